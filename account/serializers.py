@@ -8,6 +8,7 @@ from .validators import validate_password
 from .models import User, ActiveAccessToken
 from .tokens import TokenHandler
 from .tasks import soft_delete_user_related_objects
+from common.outbox import enqueue
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -116,7 +117,7 @@ class UserDeleteSerializer(serializers.Serializer):
     def delete_user(self, user):
         user.is_active = False
         user.save()
-        soft_delete_user_related_objects.delay(user.id)
+        enqueue(soft_delete_user_related_objects, args=[user.id])
 
 
 class UpdatePasswordSerializer(serializers.Serializer):
@@ -1,14 +1,23 @@
+import logging
+
 from celery import shared_task
 from django.conf import settings
 from django.core.mail import send_mail
-from django.db import transaction
+from django.db import transaction, DatabaseError
+from django.utils import timezone
 from .models import User
 from .tokens import TokenHandler
+from categories.cache import invalidate_user_categories
+from common.cache import bump_budget_version, bump_data_version, bump_recurring_version
+from common.outbox import enqueue
+
+
+logger = logging.getLogger(__name__)
 
 
 @shared_task
 def send_reset_password_email(email, reset_link):
-    print(f"Sending email to {email} with reset link: {reset_link}")
+    logger.info("Sending password reset email to %s", email)
     subject = "Password Reset Request"
     message = f"Click on the link below to reset your password:\n{reset_link}"
     recepient_list = [email]
@@ -21,31 +30,85 @@ def send_reset_password_email(email, reset_link):
     )
 
 
-@shared_task
-def soft_delete_user_related_objects(user_id):
-    try:
+# Related objects soft deleted with a user, in order.
+DELETION_CASCADE = [
+    "recurring_transactions",
+    "transactions",
+    "interwallet_transactions",
+    "budgets",
+    "wallets",
+    "categories",
+]
 
-        user = User.objects.get(id=user_id)
 
-        # Start a transaction to ensure data consistency
-        with transaction.atomic():
-            user.categories.update(is_deleted=True)
+def soft_delete_batch(queryset, batch_size):
+    """
+    Soft delete up to batch_size rows of queryset in one short transaction and
+    return how many were updated. Rows already deleted are skipped, so running
+    it again after a crash picks up where the last batch ended. updated_at is
+    set too, the archiver dates soft deletes by it.
+    """
+    with transaction.atomic():
+        ids = list(
+            queryset.filter(is_deleted=False)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+        return queryset.model.objects.filter(id__in=ids).update(is_deleted=True, updated_at=timezone.now())
 
-            user.transactions.update(is_deleted=True)
 
-            user.budgets.update(is_deleted=True)
+@shared_task(
+    bind=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    autoretry_for=(DatabaseError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def soft_delete_user_related_objects(self, user_id, progress=None):
+    """
+    Soft delete everything a deactivated user owns in bounded primary key batches.
+    Each run handles at most USER_DELETION_MAX_BATCHES batches and re-enqueues
+    itself with the running totals, so a heavy user never holds long locks or a
+    worker. The task is idempotent and the message is only acknowledged once a
+    run finishes, so a crashed worker's run is simply repeated.
+    """
+    try:
+        user = User.objects.get(id=user_id)
+    except User.DoesNotExist:
+        return f"User {user_id} does not exist."
 
-            user.wallets.update(is_deleted=True)
+    progress = progress or {name: 0 for name in DELETION_CASCADE}
+    if not any(progress.values()):
+        TokenHandler.invalidate_user_tokens(user)
 
-            user.recurring_transactions.update(is_deleted=True)
+    batch_size = settings.USER_DELETION_BATCH_SIZE
+    batches = 0
+    for name in DELETION_CASCADE:
+        queryset = getattr(user, name).all()
+        while batches < settings.USER_DELETION_MAX_BATCHES:
+            updated = soft_delete_batch(queryset, batch_size)
+            batches += 1
+            progress[name] += updated
+            if updated < batch_size:
+                break
+        else:
+            break
 
-            user.interwallet_transactions.update(is_deleted=True)
+        if not self.request.called_directly and not self.request.is_eager:
+            self.update_state(state="PROGRESS", meta=progress)
 
-            TokenHandler.invalidate_user_tokens(user)
+    invalidate_user_categories(user.id)
+    bump_data_version(user.id)
+    bump_budget_version(user.id)
+    bump_recurring_version(user.id)
 
-        return f"User {user_id} and related objects soft deleted."
+    if batches >= settings.USER_DELETION_MAX_BATCHES:
+        logger.info("Soft deleting objects of user %s, progress %s", user_id, progress)
+        enqueue(soft_delete_user_related_objects, args=[user_id], kwargs={"progress": progress})
+        return progress
 
-    except User.DoesNotExist:
-        return f"User {user_id} does not exist."
-    except Exception as e:
-        return str(e)
+    logger.info("Soft deleted objects of user %s: %s", user_id, progress)
+    return f"User {user_id} and related objects soft deleted."
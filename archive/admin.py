@@ -0,0 +1,13 @@
+from django.contrib import admin
+
+from .models import (
+    ArchivedTransaction,
+    ArchivedInterWalletTransaction,
+    ArchivedBudget,
+    ArchivedRecurringTransaction,
+)
+
+admin.site.register(ArchivedTransaction)
+admin.site.register(ArchivedInterWalletTransaction)
+admin.site.register(ArchivedBudget)
+admin.site.register(ArchivedRecurringTransaction)
@@ -0,0 +1,100 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from budgets.models import Budget
+from common.cache import bump_budget_version, bump_data_version, bump_recurring_version
+from recurring_transactions.models import RecurringTransaction
+from transactions.models import Transaction
+from wallets.models import InterWalletTransaction
+from .models import (
+    ArchivedTransaction,
+    ArchivedInterWalletTransaction,
+    ArchivedBudget,
+    ArchivedRecurringTransaction,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Version counters of the lists a model's rows are shown in, besides the data version.
+LIST_VERSIONS = {
+    Budget: bump_budget_version,
+    RecurringTransaction: bump_recurring_version,
+}
+
+
+def archive_cutoff():
+    """Rows dated before this are aged out of the hot tables."""
+    return timezone.now() - timedelta(days=365 * settings.ARCHIVE_AFTER_YEARS)
+
+
+def archive_policies():
+    """(hot model, archive model, rows to move) for every archived table."""
+    cutoff = archive_cutoff()
+    deleted = Q(
+        is_deleted=True,
+        updated_at__lt=timezone.now() - timedelta(days=settings.ARCHIVE_DELETED_AFTER_DAYS),
+    )
+    return [
+        (Transaction, ArchivedTransaction, deleted | Q(date_time__lt=cutoff)),
+        (InterWalletTransaction, ArchivedInterWalletTransaction, deleted | Q(date_time__lt=cutoff)),
+        (
+            Budget,
+            ArchivedBudget,
+            deleted | Q(year__lt=cutoff.year) | Q(year=cutoff.year, month__lt=cutoff.month),
+        ),
+        (RecurringTransaction, ArchivedRecurringTransaction, deleted | Q(end_date__lt=cutoff)),
+    ]
+
+
+def archive_batch(model, archive_model, condition, batch_size):
+    """
+    Move up to batch_size matching rows into the archive table in one transaction
+    and return how many moved. Rows locked by other writers are skipped, and an
+    archive copy left by an interrupted run is kept, so batches are idempotent.
+    Owners of moved live rows get their data version, and the model's version in
+    LIST_VERSIONS, bumped, the lists their ETags and cached pages come from no
+    longer show those rows.
+    """
+    fields = [field.attname for field in model._meta.concrete_fields]
+    with transaction.atomic():
+        rows = list(
+            model.objects.filter(condition)
+            .select_for_update(skip_locked=True)
+            .order_by("id")
+            .values(*fields)[:batch_size]
+        )
+        if not rows:
+            return 0
+        archive_model.objects.bulk_create(
+            [archive_model(**row) for row in rows], ignore_conflicts=True
+        )
+        model.objects.filter(id__in=[row["id"] for row in rows]).delete()
+    owners = [row["user_id"] for row in rows if not row["is_deleted"]]
+    bump_data_version(*owners)
+    if model in LIST_VERSIONS:
+        LIST_VERSIONS[model](*owners)
+    return len(rows)
+
+
+def archive_old_rows(batch_size=None, max_batches=None):
+    """Archive soft deleted and aged rows of every table, return {model name: rows moved}."""
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    moved = {}
+    for model, archive_model, condition in archive_policies():
+        moved[model.__name__] = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            count = archive_batch(model, archive_model, condition, batch_size)
+            moved[model.__name__] += count
+            batches += 1
+            if count < batch_size:
+                break
+        logger.info("Archived %s %s rows", moved[model.__name__], model.__name__)
+    return moved
@@ -0,0 +1,90 @@
+from django.db import models
+
+from account.models import User
+from categories.models import Category
+from wallets.models import Wallet
+
+
+def archived_fk(model):
+    """
+    Reference to a hot table without a database constraint, so rows can be archived
+    while what they point to stays in place, or is archived or removed later.
+    """
+    return models.ForeignKey(
+        model, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+
+
+class ArchivedModel(models.Model):
+    """Cold copy of a hot row, keeping its id and timestamps."""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    is_deleted = models.BooleanField(default=False)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        abstract = True
+
+
+class ArchivedTransaction(ArchivedModel):
+    user = archived_fk(User)
+    wallet = archived_fk(Wallet)
+    type = models.CharField(max_length=10)
+    category = archived_fk(Category)
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    date_time = models.DateTimeField()
+    description = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "date_time"])]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.type} - {self.amount} (archived)"
+
+
+class ArchivedInterWalletTransaction(ArchivedModel):
+    user = archived_fk(User)
+    source_wallet = archived_fk(Wallet)
+    destination_wallet = archived_fk(Wallet)
+    amount = models.DecimalField(max_digits=15, decimal_places=2)
+    date_time = models.DateTimeField()
+    description = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "date_time"])]
+
+    def __str__(self):
+        return f"{self.user_id} | {self.amount} (archived)"
+
+
+class ArchivedBudget(ArchivedModel):
+    user = archived_fk(User)
+    category = archived_fk(Category)
+    year = models.PositiveIntegerField()
+    month = models.PositiveIntegerField()
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "year", "month"])]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.month}/{self.year} (archived)"
+
+
+class ArchivedRecurringTransaction(ArchivedModel):
+    user = archived_fk(User)
+    wallet = archived_fk(Wallet)
+    type = models.CharField(max_length=10)
+    category = archived_fk(Category)
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    frequency = models.CharField(max_length=10)
+    start_date = models.DateTimeField()
+    end_date = models.DateTimeField(null=True, blank=True)
+    next_run = models.DateTimeField()
+    description = models.TextField(blank=True)
+    status = models.CharField(max_length=10)
+
+    def __str__(self):
+        return f"{self.user_id} - {self.frequency} - {self.amount} (archived)"
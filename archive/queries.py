@@ -0,0 +1,69 @@
+from heapq import merge
+from operator import attrgetter
+
+from budgets.models import Budget
+from transactions.models import Transaction
+from wallets.models import InterWalletTransaction
+from .archiver import archive_cutoff
+from .models import ArchivedBudget, ArchivedTransaction, ArchivedInterWalletTransaction
+
+
+def reaches_archive(start_date):
+    """Whether a range starting at start_date can contain archived rows."""
+    return start_date < archive_cutoff().date()
+
+
+def _sources(model, archive_model, start_date, **filters):
+    sources = [model.objects.filter(is_deleted=False, **filters)]
+    if reaches_archive(start_date):
+        sources.append(archive_model.objects.filter(is_deleted=False, **filters))
+    return sources
+
+
+def transaction_sources(user, start_date, end_date, **filters):
+    """
+    Querysets over a user's transactions in a date range, the hot table first and
+    the archive after it when the range reaches back far enough to need it.
+    """
+    return all_transaction_sources(start_date, end_date, user=user, **filters)
+
+
+def all_transaction_sources(start_date, end_date, **filters):
+    """Querysets over every user's transactions in a date range, see transaction_sources."""
+    return _sources(
+        Transaction,
+        ArchivedTransaction,
+        start_date,
+        date_time__range=(start_date, end_date),
+        **filters,
+    )
+
+
+def interwallet_sources(user, start_date, end_date, **filters):
+    """Querysets over a user's inter-wallet transactions in a date range, see transaction_sources."""
+    return _sources(
+        InterWalletTransaction,
+        ArchivedInterWalletTransaction,
+        start_date,
+        user=user,
+        date_time__range=(start_date, end_date),
+        **filters,
+    )
+
+
+def budget_sources(start_date, **filters):
+    """Querysets over budgets, the archive included when budgets from start_date on may be archived."""
+    return _sources(Budget, ArchivedBudget, start_date, **filters)
+
+
+def latest_first(sources, date_time=attrgetter("date_time")):
+    """Rows of every source, newest first. Pass itemgetter("date_time") for values() sources."""
+    if len(sources) == 1:
+        return sources[0].order_by("-date_time")
+    return list(
+        merge(
+            *(source.order_by("-date_time") for source in sources),
+            key=date_time,
+            reverse=True,
+        )
+    )
@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .archiver import archive_old_rows
+
+
+@shared_task
+def archive_old_data():
+    """Move soft deleted and aged rows out of the hot tables."""
+    return archive_old_rows()
@@ -1,18 +1,21 @@
 from datetime import date
 from decimal import Decimal
-from django.db.models import Sum
+from django.db.models import OuterRef, Subquery, Sum
 from rest_framework import serializers
 from rest_framework.serializers import ValidationError
 
 from .models import Budget
 from account.models import User
 from transactions.models import Transaction
+from categories.serializers import CategoryField
 
+from common.serializers import ValuesSerializer
 from common.utils import is_valid_uuid
 
 
 class BudgetSerializer(serializers.ModelSerializer):
     month_year = serializers.CharField(write_only=True)
+    category = CategoryField()
     spent_amount = serializers.SerializerMethodField()
 
     class Meta:
@@ -93,7 +96,7 @@ class BudgetSerializer(serializers.ModelSerializer):
         user = self._get_budget_user()
         request = self.context.get("request")
 
-        if not value.is_predefined and value.user != user:
+        if not value.is_predefined and value.user_id != getattr(user, "id", None):
             raise serializers.ValidationError(
                 "Category does not belong to the provided user."
             )
@@ -183,3 +186,29 @@ class BudgetSerializer(serializers.ModelSerializer):
             is_deleted=False,
         ).aggregate(total=Sum("amount"))["total"] or Decimal("0.00")
         return str(spent)
+
+
+class BudgetReadSerializer(ValuesSerializer):
+    """
+    BudgetSerializer output for list responses, from values() rows with the
+    spent amount summed by a correlated subquery instead of a query per budget.
+    """
+
+    serializer_class = BudgetSerializer
+    annotations = {
+        "spent_amount": Subquery(
+            Transaction.objects.filter(
+                user=OuterRef("user"),
+                category=OuterRef("category"),
+                date_time__year=OuterRef("year"),
+                date_time__month=OuterRef("month"),
+                is_deleted=False,
+            )
+            .order_by()
+            .values("user")
+            .annotate(total=Sum("amount"))
+            .values("total")[:1]
+        )
+    }
+    # Same as get_spent_amount: the sum as the database returns it, "0.00" without transactions.
+    formatters = {"spent_amount": lambda spent: "0.00" if spent is None else str(spent)}
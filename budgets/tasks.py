@@ -1,38 +1,140 @@
+import time
+from datetime import datetime, timezone as dt_timezone
+
 from celery import shared_task
 from budgets.models import Budget
 from transactions.models import Transaction
-from django.db.models import Sum
+from django.db.models import Sum, Q
+from django.db.models.functions import ExtractYear, ExtractMonth
 from decimal import Decimal
 from django.conf import settings
+from django.core.cache import cache
 from django.core.mail import send_mail
+from django.db import transaction
+from django.utils import timezone
+
+from common import outbox
+
+
+# Keys scheduled within one window are evaluated together once the window closes.
+EVALUATION_BATCH_SIZE = 200
+WINDOW_KEY = "budget_eval:window:{}"
+PENDING_KEY = "budget_eval:pending:{}:{}:{}:{}"
+
+
+def budget_key(obj):
+    """(user id, category id, year, month) of a budget, or of the budget a transaction counts towards."""
+    if isinstance(obj, Budget):
+        year, month = obj.year, obj.month
+    else:
+        date_time = timezone.localtime(obj.date_time)
+        year, month = date_time.year, date_time.month
+    return (str(obj.user_id), str(obj.category_id), year, month)
+
+
+def schedule_budget_evaluation(*keys):
+    """
+    Queue budgets for evaluation at the end of the current window, once the
+    current transaction commits. A key already waiting is skipped, so a burst of
+    writes in one category costs one evaluation and only the first key of a
+    window publishes a task.
+    """
+    transaction.on_commit(lambda: _collect_budget_keys(keys))
+
+
+def _collect_budget_keys(keys):
+    window = settings.BUDGET_EVALUATION_WINDOW
+    # Outlive the worst queue delay, a key expiring before its task runs is never
+    # evaluated. The task clears what it consumed.
+    ttl = window + settings.BUDGET_EVALUATION_MAX_DELAY
+    for key in keys:
+        if not cache.add(PENDING_KEY.format(*key), 1, timeout=ttl):
+            continue
+
+        slot = int(time.time() // window)
+        window_key = WINDOW_KEY.format(slot)
+        cache.add(window_key, 0, timeout=ttl)
+        position = cache.incr(window_key)
+        cache.set(f"{window_key}:{position}", list(key), timeout=ttl)
+
+        if position == 1:
+            outbox.enqueue(
+                evaluate_budgets,
+                args=[slot],
+                eta=datetime.fromtimestamp((slot + 1) * window, tz=dt_timezone.utc),
+            )
+
+
+@shared_task
+def evaluate_budgets(slot):
+    """Evaluate every budget key collected in one window."""
+    window_key = WINDOW_KEY.format(slot)
+    count = cache.get(window_key) or 0
+    entries = [f"{window_key}:{position}" for position in range(1, count + 1)]
+    keys = {tuple(key) for key in cache.get_many(entries).values()}
+
+    # Release the keys first, writes from now on start a new window.
+    cache.delete_many([PENDING_KEY.format(*key) for key in keys] + entries + [window_key])
+
+    keys = sorted(keys)
+    for start in range(0, len(keys), EVALUATION_BATCH_SIZE):
+        evaluate_budget_keys(keys[start:start + EVALUATION_BATCH_SIZE])
+    return len(keys)
 
 
 @shared_task
 def track_and_notify_budget(budget_id):
     """
-    Asynchronously track the budget and send a notification if the limit is reached.
+    Deprecated, kept for one release so messages published before the switch to
+    evaluate_budgets still run. Evaluates the one budget right away.
+    """
+    budget = Budget.objects.filter(id=budget_id, is_deleted=False).first()
+    if budget:
+        evaluate_budget_keys([budget_key(budget)])
+
+
+def evaluate_budget_keys(keys):
+    """
+    Check the budgets of the given (user, category, year, month) keys with one query
+    for the budgets and one grouped query for what was spent, and alert the owners
+    of budgets past their warning threshold.
     """
-    try:
-        budget = Budget.objects.get(id=budget_id, is_deleted=False)
-        
-        total_spent = Transaction.objects.filter(
-            user=budget.user,
-            category=budget.category,
-            date_time__year=budget.year,
-            date_time__month=budget.month,
-            is_deleted=False,
-        ).aggregate(Sum("amount"))["amount__sum"] or Decimal("0")
+    if not keys:
+        return
 
+    budget_filter, spent_filter = Q(), Q()
+    for user_id, category_id, year, month in keys:
+        budget_filter |= Q(user_id=user_id, category_id=category_id, year=year, month=month)
+        spent_filter |= Q(
+            user_id=user_id,
+            category_id=category_id,
+            date_time__year=year,
+            date_time__month=month,
+        )
+
+    budgets = list(
+        Budget.objects.filter(budget_filter, is_deleted=False).select_related("user", "category")
+    )
+    if not budgets:
+        return
+
+    spent = {
+        (row["user_id"], row["category_id"], row["year"], row["month"]): row["total"]
+        for row in Transaction.objects.filter(spent_filter, is_deleted=False)
+        .values("user_id", "category_id", year=ExtractYear("date_time"), month=ExtractMonth("date_time"))
+        .annotate(total=Sum("amount"))
+        .order_by()
+    }
+
+    for budget in budgets:
+        total_spent = spent.get(
+            (budget.user_id, budget.category_id, budget.year, budget.month), Decimal("0")
+        )
         total_spent_percentage = (total_spent / budget.amount) * 100
 
         # Check for warning and critical thresholds
-        if total_spent_percentage >= budget.CRITICAL_THRESHOLD:
+        if total_spent_percentage >= budget.WARNING_THRESHOLD:
             send_budget_alert(budget, total_spent)
-        elif total_spent_percentage >= budget.WARNING_THRESHOLD:
-            send_budget_alert(budget, total_spent)
-
-    except Budget.DoesNotExist:
-        pass
 
 
 def send_budget_alert(budget, total_spent):
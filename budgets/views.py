@@ -3,39 +3,44 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
+from common.cache import bump_budget_version
+from common.conditional import conditional_get, budget_version_keys
 from common.permissions import IsStaffOrOwner
+from common.serializers import requested_fields
 from common.utils import (
     validation_error_response,
     not_found_response,
     CustomPagination,
 )
 from .models import Budget
-from .serializers import BudgetSerializer
-from .tasks import track_and_notify_budget
+from .serializers import BudgetSerializer, BudgetReadSerializer
+from .tasks import budget_key, schedule_budget_evaluation
 
 
 
 class BudgetListCreateView(APIView, CustomPagination):
     """Api view to list all budgets or create a new one"""
 
+    @conditional_get(budget_version_keys)
     def get(self, request):
         """List all budgets with optional filters"""
+        fields = requested_fields(request, BudgetReadSerializer)
 
         if request.user.is_staff:
             budgets = Budget.objects.all()
         else:
             budgets = Budget.objects.filter(user=request.user, is_deleted=False)
 
-        paginated_budgets = self.paginate_queryset(budgets, request)
-        serializer = BudgetSerializer(paginated_budgets, many=True)
-        return self.get_paginated_response(serializer.data)
+        paginated_budgets = self.paginate_queryset(BudgetReadSerializer.values(budgets, fields), request)
+        return self.get_paginated_response(BudgetReadSerializer(paginated_budgets, fields=fields).data)
 
     def post(self, request):
         """Create a new budget"""
         serializer = BudgetSerializer(data=request.data, context={"request": request})
         if serializer.is_valid():
             budget = serializer.save()
-            track_and_notify_budget.delay(budget.id)
+            bump_budget_version(budget.user_id)
+            schedule_budget_evaluation(budget_key(budget))
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return validation_error_response(serializer.errors)
 
@@ -48,6 +53,7 @@ class BudgetDetailView(APIView):
         """Get budget object with proper filtering"""
         return get_object_or_404(Budget, id=pk)
 
+    @conditional_get(budget_version_keys)
     def get(self, request, pk):
         """Retrieve a specific budget"""
         try:
@@ -75,7 +81,8 @@ class BudgetDetailView(APIView):
         )
         if serializer.is_valid():
             budget = serializer.save()
-            track_and_notify_budget.delay(budget.id)
+            bump_budget_version(budget.user_id)
+            schedule_budget_evaluation(budget_key(budget))
             return Response(serializer.data, status=status.HTTP_200_OK)
         return validation_error_response(serializer.errors)
     
@@ -90,6 +97,7 @@ class BudgetDetailView(APIView):
         
         budget.is_deleted = True
         budget.save()
+        bump_budget_version(budget.user_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
         
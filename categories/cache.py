@@ -0,0 +1,131 @@
+from django.core.cache import cache
+
+from common.cache import get_versions, bump_version
+from common.utils import is_valid_uuid
+from .models import Category
+
+
+CATEGORY_CACHE_TIMEOUT = 60 * 60 * 24  # versioned keys, so stale maps just expire
+PREDEFINED_VERSION_KEY = "categories:predefined:version"
+
+CATEGORY_FIELDS = [field.attname for field in Category._meta.concrete_fields]
+
+
+def user_version_key(user_id):
+    return f"categories:user:{user_id}:version"
+
+
+def category_etag_keys(request, *args, **kwargs):
+    """
+    Version keys for the ETag of a category request, see common.conditional.
+    None for staff, who see every user's categories.
+    """
+    if request.user.is_staff:
+        return None
+    return [PREDEFINED_VERSION_KEY, user_version_key(request.user.id)]
+
+
+def get_category_versions(user_id=None):
+    """Return the (predefined, user) category versions, fetched in one round trip."""
+    version_keys = [PREDEFINED_VERSION_KEY]
+    if user_id:
+        version_keys.append(user_version_key(user_id))
+
+    versions = get_versions(version_keys)
+    return versions[PREDEFINED_VERSION_KEY], versions.get(user_version_key(user_id))
+
+
+def invalidate_predefined_categories():
+    bump_version(PREDEFINED_VERSION_KEY)
+
+
+def invalidate_user_categories(user_id):
+    bump_version(user_version_key(user_id))
+
+
+def invalidate_category_cache(category):
+    """Invalidate the cached map the given category belongs to."""
+    if category.is_predefined:
+        invalidate_predefined_categories()
+    else:
+        invalidate_user_categories(category.user_id)
+
+
+def _load_rows(queryset):
+    return {
+        str(row["id"]): row
+        for row in queryset.order_by("created_at").values(*CATEGORY_FIELDS)
+    }
+
+
+def get_category_maps(user_id=None):
+    """
+    Return (predefined, user) dicts of non-deleted category rows keyed by id.
+    - Predefined categories are shared by every user under one key.
+    - User categories are cached per user, only when a user id is given.
+    """
+    predefined_version, user_version = get_category_versions(user_id)
+    predefined_key = f"categories:predefined:{predefined_version}"
+    user_key = f"categories:user:{user_id}:{user_version}" if user_id else None
+
+    cached = cache.get_many([key for key in (predefined_key, user_key) if key])
+
+    predefined = cached.get(predefined_key)
+    if predefined is None:
+        predefined = _load_rows(
+            Category.objects.filter(is_predefined=True, is_deleted=False)
+        )
+        cache.set(predefined_key, predefined, timeout=CATEGORY_CACHE_TIMEOUT)
+
+    if not user_key:
+        return predefined, {}
+
+    own = cached.get(user_key)
+    if own is None:
+        own = _load_rows(
+            Category.objects.filter(
+                user_id=user_id, is_predefined=False, is_deleted=False
+            )
+        )
+        cache.set(user_key, own, timeout=CATEGORY_CACHE_TIMEOUT)
+
+    return predefined, own
+
+
+def _to_instance(row):
+    return Category.from_db(
+        "default", CATEGORY_FIELDS, [row[name] for name in CATEGORY_FIELDS]
+    )
+
+
+def get_visible_categories(user_id, category_type=None):
+    """Return predefined and own categories of a user ordered by created_at."""
+    predefined, own = get_category_maps(user_id)
+    rows = sorted(
+        [*predefined.values(), *own.values()], key=lambda row: row["created_at"]
+    )
+    return [
+        _to_instance(row)
+        for row in rows
+        if category_type is None or row["type"] == category_type
+    ]
+
+
+def find_category(category_id, user_id=None):
+    """Return a non-deleted predefined or user owned category, or None if not cached."""
+    category_id = str(category_id)
+    if not is_valid_uuid(category_id):
+        return None
+
+    predefined, own = get_category_maps(user_id)
+    row = predefined.get(category_id) or own.get(category_id)
+    return _to_instance(row) if row else None
+
+
+def category_slug_exists(slug, category_type, user_id):
+    """Check whether the slug is taken by a predefined or own category of the type."""
+    predefined, own = get_category_maps(user_id)
+    return any(
+        row["slug"] == slug and row["type"] == category_type
+        for row in [*predefined.values(), *own.values()]
+    )
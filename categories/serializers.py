@@ -1,10 +1,40 @@
 from rest_framework import serializers
 from .models import Category
+from .cache import find_category, category_slug_exists, invalidate_category_cache
 import re
 from django.utils.text import slugify
+from common.utils import is_valid_uuid
+from common.serializers import SparseFieldsMixin
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategoryField(serializers.PrimaryKeyRelatedField):
+    """
+    Category primary key field resolved from the per-user category cache.
+    Falls back to the database for categories that are not cached (deleted or
+    belonging to another user) so validation errors stay the same.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("queryset", Category.objects.all())
+        super().__init__(**kwargs)
+
+    def _get_owner_id(self):
+        """Owner whose categories are looked up: the instance user or the posted user."""
+        instance = getattr(self.parent, "instance", None)
+        if instance is not None and not isinstance(instance, (list, tuple)):
+            return instance.user_id
+
+        user_id = str(getattr(self.parent, "initial_data", {}).get("user", ""))
+        return user_id if is_valid_uuid(user_id) else None
+
+    def to_internal_value(self, data):
+        category = find_category(data, self._get_owner_id())
+        if category is not None:
+            return category
+        return super().to_internal_value(data)
+
+
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ["id", "name", "user", "is_predefined", "is_deleted", "type"]
@@ -47,14 +77,7 @@ class CategorySerializer(serializers.ModelSerializer):
         if len(normalized_value) < 1:
             raise serializers.ValidationError({"name": "This is not a valid name"})
 
-        if (
-            Category.objects.filter(
-                slug=normalized_value, user=user, is_deleted=False, type=type
-            ).exists()
-            or Category.objects.filter(
-                slug=normalized_value, is_predefined=True, is_deleted=False, type=type
-            ).exists()
-        ):
+        if category_slug_exists(normalized_value, type, user.id):
             raise serializers.ValidationError({"name": "This category already exists."})
         return normalized_value
 
@@ -87,8 +110,12 @@ class CategorySerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """Create a new category."""
-        return super().create(validated_data)
+        category = super().create(validated_data)
+        invalidate_category_cache(category)
+        return category
 
     def update(self, instance, validated_data):
         """Update an existing category."""
-        return super().update(instance, validated_data)
+        category = super().update(instance, validated_data)
+        invalidate_category_cache(category)
+        return category
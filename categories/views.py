@@ -1,11 +1,15 @@
 from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.response import Response
-from django.db.models import Q
 from django.db import transaction
+from django.utils import timezone
 
 from .serializers import CategorySerializer
 from .models import Category
+from .cache import get_visible_categories, invalidate_category_cache, category_etag_keys
+from common.cache import bump_budget_version
+from common.conditional import conditional_get
+from common.serializers import requested_fields
 from transactions.models import Transaction
 from budgets.models import Budget
 
@@ -20,26 +24,25 @@ from common.utils import (
 class CategoryListCreateView(APIView, CustomPagination):
     """view to create and list categories"""
 
+    @conditional_get(category_etag_keys)
     def get(self, request):
         """
         Retrieve all categories with custom pagination.
         """
         category_type = request.query_params.get("type", None)
+        fields = requested_fields(request, CategorySerializer)
 
         if request.user.is_staff:
-            categories = Category.objects.all().order_by("created_at")
+            categories = CategorySerializer.only(Category.objects.all(), fields).order_by("created_at")
+            if category_type:
+                categories = categories.filter(type=category_type)
         else:
-            categories = (
-                Category.objects.filter(is_deleted=False)
-                .filter(Q(is_predefined=True) | Q(user=request.user))
-                .order_by("created_at")
-            )
-
-        if category_type:
-            categories = categories.filter(type=category_type)
+            # predefined and own categories are served from the category cache
+            categories = get_visible_categories(request.user.id, category_type)
+
         # Apply custom pagination
         paginated_categories = self.paginate_queryset(categories, request)
-        serializer = CategorySerializer(paginated_categories, many=True)
+        serializer = CategorySerializer(paginated_categories, many=True, fields=fields)
         return self.get_paginated_response(serializer.data)
 
     def post(self, request):
@@ -61,6 +64,7 @@ class CategoryDetailView(APIView):
         """Method to get a specific category object by its id."""
         return Category.objects.get(id=id)
 
+    @conditional_get(category_etag_keys)
     def get(self, request, pk):
         """Retrieve a specific category."""
         try:
@@ -104,9 +108,14 @@ class CategoryDetailView(APIView):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            Budget.objects.filter(category=category).update(is_deleted=True)
+            budgets = Budget.objects.filter(category=category, is_deleted=False)
+            # Predefined categories are budgeted by many users
+            budget_owners = set(budgets.values_list("user_id", flat=True).distinct())
+            budgets.update(is_deleted=True, updated_at=timezone.now())
 
         category.is_deleted = True
         category.save()
+        invalidate_category_cache(category)
+        bump_budget_version(*budget_owners)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
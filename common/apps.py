@@ -0,0 +1,20 @@
+from django.apps import AppConfig
+
+
+class CommonConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "common"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from rest_framework.serializers import BaseSerializer, ListSerializer
+
+        from common.metrics import install_query_timer, timed_serializer
+        import common.task_metrics  # noqa: F401, connects the Celery signal handlers
+
+        # Serializer time is reported per request by common.middleware.PerformanceMiddleware.
+        for serializer_class in (BaseSerializer, ListSerializer):
+            serializer_class.is_valid = timed_serializer(serializer_class.is_valid)
+        BaseSerializer.data = property(timed_serializer(BaseSerializer.data.fget))
+        # Queries are counted on every connection, see PerformanceMiddleware.
+        connection_created.connect(install_query_timer)
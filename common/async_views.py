@@ -0,0 +1,109 @@
+import asyncio
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers may be coroutines. Authentication, permissions and
+    throttling still run the sync DRF code, off the event loop, and handlers
+    that stay sync (usually the writes) run through sync_to_async, so a view
+    can make only its read paths async.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if asyncio.iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = await sync_to_async(self.handle_exception)(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+def _in_own_connection(func):
+    """
+    Run func on the calling thread's own connection and release that
+    connection per CONN_MAX_AGE like a request would.
+    """
+
+    @wraps(func)
+    def wrapper():
+        close_old_connections()
+        try:
+            return func()
+        finally:
+            close_old_connections()
+
+    return wrapper
+
+
+_executor = None
+_executor_key = None
+_executor_lock = threading.Lock()
+
+
+def query_executor():
+    """
+    The process wide pool gather_queries runs queries in. Its ASYNC_QUERY_THREADS
+    threads each keep one connection across requests, so a process never holds
+    more than that many extra connections, however many requests fan out at
+    once. Recreated after a fork, since the parent's threads do not survive it.
+    """
+    global _executor, _executor_key
+    key = (os.getpid(), settings.ASYNC_QUERY_THREADS)
+    with _executor_lock:
+        if _executor_key != key:
+            _executor = ThreadPoolExecutor(max_workers=key[1], thread_name_prefix="async-query")
+            _executor_key = key
+        return _executor
+
+
+async def gather_queries(*funcs):
+    """
+    Run independent sync ORM callables concurrently and return their results in
+    order. With ASYNC_QUERY_THREADS set they run in the threads of the shared
+    query_executor, each on that thread's connection, otherwise they share the
+    request's connection the way Django's async ORM does and only the event
+    loop is freed while they run.
+    """
+    if not settings.ASYNC_QUERY_THREADS:
+        return await asyncio.gather(*(sync_to_async(func)() for func in funcs))
+
+    loop = asyncio.get_running_loop()
+    executor = query_executor()
+    # Each call runs in a copy of the request's context, so its queries count
+    # towards the request's metrics.
+    return await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, contextvars.copy_context().run, _in_own_connection(func))
+            for func in funcs
+        )
+    )
@@ -0,0 +1,56 @@
+import time
+
+from django.core.cache import cache
+
+
+def _initial_version():
+    # Time based so a version key recreated after eviction never repeats an old value.
+    return time.time_ns()
+
+
+def get_versions(keys):
+    """Return {key: version} for the given version counters in one round trip."""
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _initial_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return versions
+
+
+def bump_version(key):
+    """Increment a version counter, invalidating every cache entry built on it."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=None)
+
+
+def data_version_key(user_id):
+    return f"data_version:{user_id}"
+
+
+def bump_data_version(*user_ids):
+    """Invalidate everything derived from the financial data of the given users."""
+    for user_id in set(user_ids):
+        bump_version(data_version_key(user_id))
+
+
+def budget_version_key(user_id):
+    return f"budget_version:{user_id}"
+
+
+def bump_budget_version(*user_ids):
+    """Invalidate everything derived from the budgets of the given users."""
+    for user_id in set(user_ids):
+        bump_version(budget_version_key(user_id))
+
+
+def recurring_version_key(user_id):
+    return f"recurring_version:{user_id}"
+
+
+def bump_recurring_version(*user_ids):
+    """Invalidate everything derived from the recurring transactions of the given users."""
+    for user_id in set(user_ids):
+        bump_version(recurring_version_key(user_id))
@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+
+from common.cache import get_versions, data_version_key, budget_version_key, recurring_version_key
+
+
+def user_data_version_keys(request, *args, **kwargs):
+    """
+    Version keys behind a user's transactions, inter-wallet transactions and
+    wallets. None for staff, whose lists span users and whose detail views may
+    show any user's object, so there is no single counter to go by.
+    """
+    if request.user.is_staff:
+        return None
+    return [data_version_key(request.user.id)]
+
+
+def budget_version_keys(request, *args, **kwargs):
+    """
+    Version keys behind a user's budgets. Their spent_amount is summed from
+    transactions, so the data version is part of it. None for staff.
+    """
+    if request.user.is_staff:
+        return None
+    return [budget_version_key(request.user.id), data_version_key(request.user.id)]
+
+
+def recurring_version_keys(request, *args, **kwargs):
+    """Version keys behind a user's recurring transactions. None for staff."""
+    if request.user.is_staff:
+        return None
+    return [recurring_version_key(request.user.id)]
+
+
+def compute_etag(request, version_keys):
+    """
+    Weak ETag of a GET from the version counters its data depends on, the
+    requesting user and everything else that shapes the response: the full
+    URL, query string included, and the negotiated format.
+    """
+    versions = get_versions(version_keys)
+    fingerprint = "|".join(
+        [
+            request.build_absolute_uri(),
+            str(request.user.id),
+            request.accepted_renderer.format,
+            *(f"{key}={versions[key]}" for key in version_keys),
+        ]
+    )
+    return f'W/"{hashlib.md5(fingerprint.encode()).hexdigest()}"'
+
+
+def is_not_modified(request, etag):
+    """
+    If-None-Match check with the weak comparison RFC 9110 asks for GETs. "*"
+    never matches, the check runs before the handler knows the object exists.
+    """
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    return etag.removeprefix("W/") in {tag.removeprefix("W/") for tag in parse_etags(header)}
+
+
+def _with_etag(response, etag):
+    """Tag 200s and 304s, private and to be revalidated before every reuse."""
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_get(version_keys):
+    """
+    Decorator for APIView get handlers answering If-None-Match with a 304
+    before the handler runs, so an unchanged page costs authentication and
+    one cache lookup. `version_keys(request, *args, **kwargs)` lists the
+    counters the response is built from, or returns None to skip the check.
+    Sync and async handlers are both supported.
+    """
+
+    def decorator(handler):
+        if asyncio.iscoroutinefunction(handler):
+
+            @wraps(handler)
+            async def async_wrapper(self, request, *args, **kwargs):
+                keys = await sync_to_async(version_keys)(request, *args, **kwargs)
+                if keys is None:
+                    return await handler(self, request, *args, **kwargs)
+                etag = await sync_to_async(compute_etag)(request, keys)
+                if is_not_modified(request, etag):
+                    return _with_etag(HttpResponseNotModified(), etag)
+                return _with_etag(await handler(self, request, *args, **kwargs), etag)
+
+            return async_wrapper
+
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            keys = version_keys(request, *args, **kwargs)
+            if keys is None:
+                return handler(self, request, *args, **kwargs)
+            etag = compute_etag(request, keys)
+            if is_not_modified(request, etag):
+                return _with_etag(HttpResponseNotModified(), etag)
+            return _with_etag(handler(self, request, *args, **kwargs), etag)
+
+        return wrapper
+
+    return decorator
+
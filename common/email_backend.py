@@ -0,0 +1,178 @@
+import os
+import smtplib
+import threading
+import time
+
+from django.conf import settings
+from django.core.mail.backends.smtp import EmailBackend
+
+
+class SMTPConnectionPool:
+    """
+    Process-local pool of authenticated SMTP connections.
+
+    - Connections are keyed by server and credentials so different backends never share a session.
+    - Idle connections are health checked with NOOP before reuse and dropped once they exceed max idle time.
+    - The pool is reset after a fork so Celery prefork children never reuse their parent's sockets.
+    """
+
+    def __init__(self):
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def acquire(self, key):
+        """Return a healthy idle connection for the key, or None if a new one is needed."""
+        self._reset_after_fork()
+        while True:
+            with self._lock:
+                entries = self._idle.get(key)
+                if not entries:
+                    return None
+                connection, last_used = entries.pop()
+
+            idle_for = time.monotonic() - last_used
+            if idle_for > settings.EMAIL_POOL_MAX_IDLE:
+                self.discard(connection)
+                continue
+            if idle_for >= settings.EMAIL_POOL_HEALTH_CHECK_INTERVAL and not self._is_healthy(
+                connection
+            ):
+                self.discard(connection)
+                continue
+            return connection
+
+    def release(self, key, connection):
+        """Return a connection to the pool, closing it if the pool is already full."""
+        self._reset_after_fork()
+        with self._lock:
+            entries = self._idle.setdefault(key, [])
+            if len(entries) < settings.EMAIL_POOL_SIZE:
+                entries.append((connection, time.monotonic()))
+                return
+        self.discard(connection)
+
+    def discard(self, connection):
+        """Close a connection without returning it to the pool."""
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def close_all(self):
+        """Close every idle connection, used when a worker process shuts down."""
+        with self._lock:
+            entries = [entry for pooled in self._idle.values() for entry in pooled]
+            self._idle = {}
+        for connection, _ in entries:
+            self.discard(connection)
+
+    def _is_healthy(self, connection):
+        try:
+            return connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _reset_after_fork(self):
+        if self._pid != os.getpid():
+            # Sockets inherited from the parent are shared with it, drop them without QUIT.
+            self._idle = {}
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+
+
+connection_pool = SMTPConnectionPool()
+
+
+class PooledSMTPEmailBackend(EmailBackend):
+    """
+    SMTP backend that borrows connections from the process pool instead of opening
+    (TLS handshake + login) and quitting a session for every email.
+    A reused connection is checked with RSET before each message and replaced if
+    the server dropped it. Only that check is retried: once a message is on the
+    wire a failure may come after the server accepted it, and resending would
+    deliver it twice.
+    """
+
+    _fresh = False  # the connection was just opened, nothing to check yet
+
+    @property
+    def pool_key(self):
+        return (
+            self.host,
+            self.port,
+            self.username,
+            bool(self.use_tls),
+            bool(self.use_ssl),
+        )
+
+    def open(self):
+        """Reuse a pooled connection if one is available, else open a new one."""
+        if self.connection:
+            return False
+
+        self.connection = connection_pool.acquire(self.pool_key)
+        if self.connection is not None:
+            self._fresh = False
+            return True
+        self._fresh = True
+        return super().open()
+
+    def close(self):
+        """Hand the connection back to the pool instead of quitting the session."""
+        if self.connection is None:
+            return
+        connection, self.connection = self.connection, None
+        connection_pool.release(self.pool_key, connection)
+
+    def send_messages(self, email_messages):
+        """Send the messages, reconnecting before a message if the connection went stale."""
+        if not email_messages:
+            return 0
+        with self._lock:
+            new_conn_created = self.open()
+            if not self.connection or new_conn_created is None:
+                return 0
+
+            num_sent = 0
+            try:
+                for message in email_messages:
+                    if not self._check_connection():
+                        return num_sent
+                    self._fresh = False
+                    try:
+                        sent = self._send(message)
+                    except (smtplib.SMTPServerDisconnected, ConnectionError):
+                        self._discard_connection()
+                        raise
+                    if sent:
+                        num_sent += 1
+            finally:
+                if new_conn_created:
+                    self.close()
+        return num_sent
+
+    def _check_connection(self):
+        """
+        RSET a connection that has been used before, replacing it up to
+        EMAIL_POOL_RETRIES times if the server dropped it. False when no new
+        connection could be opened and fail_silently is set.
+        """
+        retries_left = settings.EMAIL_POOL_RETRIES
+        while not self._fresh:
+            try:
+                self.connection.rset()
+                return True
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self._discard_connection()
+                if not retries_left:
+                    raise
+                retries_left -= 1
+                if self.open() is None:
+                    return False
+        return True
+
+    def _discard_connection(self):
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            connection_pool.discard(connection)
@@ -15,7 +15,6 @@ def custom_exception_handler(exc, context):
     """
 
     response = exception_handler(exc, context)
-    print(type(response))
 
     if isinstance(exc, PermissionDenied):
         return Response(
@@ -0,0 +1,83 @@
+import threading
+import time
+
+from celery import current_app
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, OperationalError
+
+
+def check_database():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+
+
+def check_cache():
+    cache.set("health:ping", 1, timeout=settings.HEALTH_CHECK_TIMEOUT)
+    if cache.get("health:ping") != 1:
+        raise RuntimeError("cache did not return the value just written")
+
+
+def check_broker():
+    with current_app.connection_for_read() as broker:
+        broker.ensure_connection(max_retries=1, timeout=settings.HEALTH_CHECK_TIMEOUT)
+
+
+CHECKS = {"database": check_database, "cache": check_cache, "broker": check_broker}
+
+
+def run_checks():
+    """Return whether every check passed and each check's status."""
+    checks = {}
+    for name, check in CHECKS.items():
+        try:
+            check()
+            checks[name] = "ok"
+        except Exception as exc:
+            checks[name] = f"failed: {exc.__class__.__name__}"
+    return all(status == "ok" for status in checks.values()), checks
+
+
+def database_health():
+    """
+    Status code and body of the original /api/health-check/, whose shape
+    existing monitors parse: the database answers and has tables.
+    """
+    try:
+        tables = connection.introspection.table_names()
+    except OperationalError as exc:
+        return 500, {"message": "Database connection failed", "error": str(exc)}
+    except Exception as exc:
+        return 500, {"message": "An unexpected error occurred", "error": str(exc)}
+    if not tables:
+        return 500, {"message": "No tables found in the database"}
+    return 200, {"message": "Database is healthy", "total_tables": len(tables)}
+
+
+class CachedProbe:
+    """
+    Run a probe at most once per HEALTH_CHECK_TTL seconds in each process, so
+    orchestrator probes hitting every worker stay near free.
+    """
+
+    def __init__(self, run):
+        self.run = run
+        self.lock = threading.Lock()
+        self.result = None
+        self.checked_at = 0.0
+
+    def get(self):
+        with self.lock:
+            if self.result is None or time.monotonic() - self.checked_at >= settings.HEALTH_CHECK_TTL:
+                self.result = self.run()
+                self.checked_at = time.monotonic()
+            return self.result
+
+    def clear(self):
+        with self.lock:
+            self.result = None
+
+
+readiness = CachedProbe(run_checks)
+legacy_health = CachedProbe(database_health)
@@ -0,0 +1,54 @@
+import time
+from datetime import date, datetime, time as dt_time, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+
+from account.models import User
+from common.seed import DEFAULT_ANCHOR, LoadGenerator
+
+
+class Command(BaseCommand):
+    help = "Generate a synthetic dataset for load testing, deterministic for a given seed and prefix."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--transactions", type=int, default=1_000_000)
+        parser.add_argument("--transfers", type=int, default=100_000, help="Inter-wallet transactions.")
+        parser.add_argument("--days", type=int, default=365, help="Spread transaction dates over this many days.")
+        parser.add_argument(
+            "--anchor",
+            type=date.fromisoformat,
+            default=DEFAULT_ANCHOR.date(),
+            help="Date (YYYY-MM-DD) the generated dates lead up to, part of what makes a dataset reproducible.",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--prefix", default="load", help="Prefix of the generated usernames.")
+        parser.add_argument("--password", default="loadtest1@", help="Password of every generated user.")
+
+    def handle(self, *args, **options):
+        if options["users"] < 1:
+            raise CommandError("--users must be at least 1.")
+        if User.objects.filter(username=f"{options['prefix']}staff").exists():
+            raise CommandError(
+                f"A dataset with prefix '{options['prefix']}' already exists, use another --prefix or flush the database."
+            )
+
+        started = time.monotonic()
+        generator = LoadGenerator(
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            days=options["days"],
+            password=options["password"],
+            prefix=options["prefix"],
+            log=self.stdout.write if options["verbosity"] > 1 else None,
+            anchor=datetime.combine(options["anchor"], dt_time.min, tzinfo=dt_timezone.utc),
+        )
+        _, _, counts = generator.run(options["users"], options["transactions"], options["transfers"])
+
+        summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {options['users']} users, {summary} in {time.monotonic() - started:.1f}s"
+            )
+        )
@@ -0,0 +1,250 @@
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+SERIES_KEY = "metrics:series"
+VALUE_PREFIX = "metrics:value:"
+SCALE = 1_000_000  # values are stored as integers, seconds in microseconds
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+METRICS = {
+    "http_requests_total": ("counter", "Requests served, by route, method and status."),
+    "http_request_duration_seconds": ("histogram", "Wall time of the request."),
+    "db_queries_per_request": ("histogram", "Database queries run by one request."),
+    "db_duration_seconds": ("histogram", "Time one request spent in database queries."),
+    "serializer_duration_seconds": ("histogram", "Time one request spent validating and rendering serializers."),
+    "cache_hits_total": ("counter", "Cache lookups that found a value."),
+    "cache_misses_total": ("counter", "Cache lookups that found nothing."),
+    "celery_task_duration_seconds": ("histogram", "Run time of a task, by task name and final state."),
+    "celery_task_queue_wait_seconds": ("histogram", "Time from publishing a task to a worker starting it."),
+    "celery_task_retries_total": ("counter", "Task retries requested."),
+    "celery_task_failures_total": ("counter", "Tasks that raised an exception."),
+    "celery_queue_depth": ("gauge", "Messages waiting in a broker queue when last sampled."),
+}
+
+# Per request counters, None outside of a request (shell, Celery workers).
+current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    __slots__ = ("queries", "db_time", "serializer_time", "serializer_depth", "cache_hits", "cache_misses")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class Registry:
+    """
+    Accumulate observations in process and flush them to the shared cache, so
+    /api/metrics/ reports the same totals whichever worker process serves it.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = defaultdict(int)
+        self.known_series = set()
+        self.last_flush = time.monotonic()
+
+    def inc(self, name, labels, value=1):
+        with self.lock:
+            self.pending[_series(name, labels)] += round(value * SCALE)
+
+    def observe(self, name, labels, value, buckets):
+        with self.lock:
+            for bound in buckets:
+                if value <= bound:
+                    self.pending[_series(f"{name}_bucket", {**labels, "le": _format(bound)})] += SCALE
+            self.pending[_series(f"{name}_bucket", {**labels, "le": "+Inf"})] += SCALE
+            self.pending[_series(f"{name}_sum", labels)] += round(value * SCALE)
+            self.pending[_series(f"{name}_count", labels)] += SCALE
+
+    def set_gauge(self, name, labels, value):
+        """Gauges are absolute values, written straight to the cache instead of buffered."""
+        series = _series(name, labels)
+        cache.set(VALUE_PREFIX + series, round(value * SCALE), timeout=None)
+        self.register({series})
+
+    def register(self, series):
+        self.known_series.update(series)
+        registered = cache.get(SERIES_KEY) or set()
+        if not self.known_series <= registered:
+            cache.set(SERIES_KEY, registered | self.known_series, timeout=None)
+
+    def flush_if_due(self):
+        if time.monotonic() - self.last_flush >= settings.METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, defaultdict(int)
+            self.last_flush = time.monotonic()
+        if not pending:
+            return
+
+        for series, delta in pending.items():
+            key = VALUE_PREFIX + series
+            try:
+                cache.incr(key, delta)
+            except ValueError:
+                if not cache.add(key, delta, timeout=None):
+                    cache.incr(key, delta)
+
+        self.register(pending)
+
+    def render(self):
+        """Return every series in the Prometheus text exposition format."""
+        self.flush()
+        series = sorted(cache.get(SERIES_KEY) or (), key=_sort_key)
+        values = cache.get_many([VALUE_PREFIX + name for name in series])
+
+        lines, typed = [], set()
+        for name in series:
+            metric = _metric_name(name)
+            if metric not in typed:
+                kind, help_text = METRICS.get(metric, ("untyped", ""))
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+                typed.add(metric)
+            value = values.get(VALUE_PREFIX + name, 0) / SCALE
+            lines.append(f"{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _format(bound):
+    return f"{bound:g}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _series(name, labels):
+    label_text = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return f"{name}{{{label_text}}}"
+
+
+def _sort_key(series):
+    """Group series of one metric and label set together, buckets in ascending order."""
+    name, _, labels = series.partition("{")
+    labels, _, le = labels.rstrip("}").partition(',le="')
+    bound = float(le.rstrip('"')) if le else 0.0
+    return (_metric_name(series), labels, name, bound)
+
+
+def _metric_name(series):
+    name = series.split("{", 1)[0]
+    for suffix in ("_bucket", "_sum", "_count"):
+        if name.endswith(suffix) and name[: -len(suffix)] in METRICS:
+            return name[: -len(suffix)]
+    return name
+
+
+registry = Registry()
+
+
+def record_request(route, method, status, duration, request_metrics):
+    labels = {"route": route, "method": method}
+    registry.inc("http_requests_total", {**labels, "status": status})
+    registry.observe("http_request_duration_seconds", labels, duration, DURATION_BUCKETS)
+    registry.observe("db_queries_per_request", labels, request_metrics.queries, QUERY_BUCKETS)
+    registry.observe("db_duration_seconds", labels, request_metrics.db_time, DURATION_BUCKETS)
+    registry.observe("serializer_duration_seconds", labels, request_metrics.serializer_time, DURATION_BUCKETS)
+    if request_metrics.cache_hits:
+        registry.inc("cache_hits_total", labels, request_metrics.cache_hits)
+    if request_metrics.cache_misses:
+        registry.inc("cache_misses_total", labels, request_metrics.cache_misses)
+    registry.flush_if_due()
+
+
+def query_timer(execute, sql, params, many, context):
+    """connection.execute_wrapper hook counting queries and their time."""
+    request_metrics = current.get()
+    if request_metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        request_metrics.db_time += time.perf_counter() - start
+        request_metrics.queries += 1
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """
+    connection_created receiver adding query_timer to every connection, so the
+    queries of the current request count wherever they run: in the request's
+    thread, a sync_to_async thread or a gather_queries pool thread.
+    """
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_timer)
+
+
+def timed_serializer(func):
+    """Add the time of outermost serializer calls to the current request."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        request_metrics = current.get()
+        if request_metrics is None:
+            return func(*args, **kwargs)
+        request_metrics.serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            request_metrics.serializer_depth -= 1
+            if not request_metrics.serializer_depth:
+                request_metrics.serializer_time += time.perf_counter() - start
+
+    return wrapper
+
+
+def counted_cache_get(get):
+    @wraps(get)
+    def wrapper(key, default=None, version=None):
+        value = get(key, default, version=version)
+        request_metrics = current.get()
+        if request_metrics is not None:
+            if value is default:
+                request_metrics.cache_misses += 1
+            else:
+                request_metrics.cache_hits += 1
+        return value
+
+    wrapper.counted = True
+    return wrapper
+
+
+def counted_cache_get_many(get_many):
+    @wraps(get_many)
+    def wrapper(keys, version=None):
+        keys = list(keys)
+        values = get_many(keys, version=version)
+        request_metrics = current.get()
+        if request_metrics is not None:
+            request_metrics.cache_hits += len(values)
+            request_metrics.cache_misses += len(keys) - len(values)
+        return values
+
+    wrapper.counted = True
+    return wrapper
+
+
+def instrument_cache(backend):
+    """Count hits and misses on a cache backend instance, once per instance."""
+    if not getattr(backend.get, "counted", False):
+        backend.get = counted_cache_get(backend.get)
+    if not getattr(backend.get_many, "counted", False):
+        backend.get_many = counted_cache_get_many(backend.get_many)
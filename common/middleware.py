@@ -0,0 +1,173 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches, DEFAULT_CACHE_ALIAS
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from common import metrics
+
+try:
+    import brotli
+except ImportError:  # optional, gzip is used without it
+    brotli = None
+
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class PerformanceMiddleware:
+    """
+    Time every request and count its database queries, database time, cache hits
+    and misses and serializer time. The numbers are returned in a Server-Timing
+    header and aggregated per route for /api/metrics/. Queries are counted by
+    metrics.query_timer, installed on every database connection.
+    Sync and async capable, so ASGI requests take no thread hop through it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request_metrics, token, start = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.current.reset(token)
+        return self._finish(request, response, request_metrics, start)
+
+    async def __acall__(self, request):
+        request_metrics, token, start = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.current.reset(token)
+        return self._finish(request, response, request_metrics, start)
+
+    def _start(self):
+        request_metrics = metrics.RequestMetrics()
+        token = metrics.current.set(request_metrics)
+        metrics.instrument_cache(caches[DEFAULT_CACHE_ALIAS])
+        return request_metrics, token, time.perf_counter()
+
+    def _finish(self, request, response, request_metrics, start):
+        duration = time.perf_counter() - start
+        response["Server-Timing"] = server_timing(duration, request_metrics)
+
+        match = request.resolver_match
+        if not match or match.url_name != "metrics":
+            route = f"/{match.route}" if match else UNMATCHED_ROUTE
+            metrics.record_request(
+                route, request.method, response.status_code, duration, request_metrics
+            )
+        return response
+
+
+def server_timing(duration, request_metrics):
+    return ", ".join(
+        [
+            f"app;dur={duration * 1000:.1f}",
+            f'db;dur={request_metrics.db_time * 1000:.1f};desc="{request_metrics.queries} queries"',
+            f"serializer;dur={request_metrics.serializer_time * 1000:.1f}",
+            f'cache;desc="{request_metrics.cache_hits} hits {request_metrics.cache_misses} misses"',
+        ]
+    )
+
+
+BROTLI_QUALITY = 4  # close to gzip's ratio at -6 for JSON, at a fraction of max quality's cost
+COMPRESSIBLE_TYPES = ("application/json",)
+
+
+def accepted_encodings(header):
+    """{content coding: q-value} of an Accept-Encoding header, a bad q counting as 0."""
+    weights = {}
+    for item in header.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    return weights
+
+
+def choose_encoding(header):
+    """
+    The coding to compress with: the client's most preferred of brotli, when
+    installed, and gzip, brotli on a tie. None when both are refused with q=0,
+    or through "*;q=0" without being listed.
+    """
+    weights = accepted_encodings(header)
+    available = ["br", "gzip"] if brotli is not None else ["gzip"]
+    candidates = [(weights.get(coding, weights.get("*", 0.0)), coding) for coding in available]
+    weight, coding = max(candidates, key=lambda candidate: candidate[0])
+    return coding if weight > 0 else None
+
+
+class CompressionMiddleware:
+    """
+    Compress JSON responses of at least COMPRESSION_MIN_SIZE bytes, with brotli
+    when the client accepts it and the brotli package is installed, with gzip
+    otherwise. Like Django's GZipMiddleware, strong ETags become weak since
+    the bytes sent differ from those they were computed from.
+    Sync and async capable.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or not response.get("Content-Type", "").startswith(COMPRESSIBLE_TYPES)
+            or len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding == "br":
+            compressed = brotli.compress(response.content, quality=BROTLI_QUALITY)
+        elif encoding == "gzip":
+            compressed = compress_string(response.content)
+        else:
+            return response
+
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        if response.get("ETag", "").startswith('"'):
+            response["ETag"] = "W/" + response["ETag"]
+        return response
@@ -0,0 +1,96 @@
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from celery import current_app
+from django.db import transaction
+
+
+# Messages of the current request or batch() block, None when not batching.
+_batch = ContextVar("outbox_batch", default=None)
+
+
+def enqueue(task, args=None, kwargs=None, using=None, **options):
+    """
+    Publish a Celery task once the current database transaction commits, so a
+    worker never looks for rows that are not visible yet and a rollback publishes
+    nothing. Takes the same arguments as Task.apply_async. Outside of a
+    transaction the task is staged right away.
+    """
+    message = (task, args or (), kwargs or {}, options)
+    transaction.on_commit(lambda: _stage(message), using=using)
+
+
+def _stage(message):
+    messages = _batch.get()
+    if messages is None:
+        publish([message])
+    else:
+        messages.append(message)
+
+
+def publish(messages):
+    """Publish messages over a single broker connection."""
+    if not messages:
+        return
+    with current_app.producer_or_acquire() as producer:
+        for task, args, kwargs, options in messages:
+            task.apply_async(args, kwargs, producer=producer, **options)
+
+
+@contextmanager
+def batch():
+    """Hold committed messages until the block exits and publish them together."""
+    if _batch.get() is not None:
+        yield  # already batching, the outer block publishes
+        return
+
+    messages = []
+    token = _batch.set(messages)
+    try:
+        yield
+    finally:
+        _batch.reset(token)
+        publish(messages)
+
+
+@asynccontextmanager
+async def abatch():
+    """batch() for async code, publishing off the event loop."""
+    if _batch.get() is not None:
+        yield
+        return
+
+    messages = []
+    token = _batch.set(messages)
+    try:
+        yield
+    finally:
+        _batch.reset(token)
+        if messages:
+            await sync_to_async(publish)(messages)
+
+
+class OutboxMiddleware:
+    """
+    Publish the tasks enqueued while handling a request in one batch at its end.
+    Sync and async capable.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with batch():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        async with abatch():
+            return await self.get_response(request)
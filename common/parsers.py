@@ -0,0 +1,30 @@
+import io
+
+import orjson
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from common.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser reading request bodies with orjson, which like strict JSON
+    rejects NaN and infinities. Bodies orjson cannot read are handed to
+    JSONParser, so integers over 64 bits still parse and invalid JSON gets the
+    usual "JSON parse error" message.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        body = stream.read()
+
+        try:
+            if encoding.lower().replace("-", "") != "utf8":
+                return orjson.loads(body.decode(encoding))
+            return orjson.loads(body)
+        except (orjson.JSONDecodeError, UnicodeDecodeError):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
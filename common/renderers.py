@@ -0,0 +1,40 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing the same bytes with orjson. UUIDs and datetimes are
+    encoded natively, datetimes in UTC ending in "Z" like DRF's encoder writes
+    them, and everything else orjson does not know (Decimal, lazy strings,
+    querysets...) goes through DRF's encoder.
+
+    Indented output, non default JSON settings and data orjson rejects (non
+    string keys, integers over 64 bits) are left to JSONRenderer. Unlike it,
+    orjson writes NaN and infinities as null instead of failing, and floats of
+    1e16 and up as 1e16 rather than 1e+16.
+    """
+
+    options = orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Keep the output a strict javascript subset, as JSONRenderer does.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
@@ -0,0 +1,249 @@
+import random
+import uuid
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from account.models import User
+from budgets.models import Budget
+from categories.cache import invalidate_predefined_categories
+from categories.models import Category
+from recurring_transactions.models import RecurringTransaction
+from transactions.models import Transaction
+from wallets.models import Wallet, InterWalletTransaction
+
+
+PREDEFINED_CATEGORIES = [
+    ("Food", "debit"), ("Rent", "debit"), ("Groceries", "debit"), ("Transport", "debit"),
+    ("Utilities", "debit"), ("Shopping", "debit"), ("Health", "debit"), ("Entertainment", "debit"),
+    ("Salary", "credit"), ("Interest", "credit"),
+]
+USER_CATEGORIES = [("Travel", "debit"), ("Subscriptions", "debit"), ("Freelance", "credit")]
+WALLET_NAMES = ["Cash", "Bank", "Credit Card", "Savings"]
+DEBIT_SHARE = 0.85
+# Dates are generated back from a fixed moment rather than now, so a seed
+# gives the same rows whatever day it runs on.
+DEFAULT_ANCHOR = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class LoadGenerator:
+    """
+    Generate a synthetic dataset with bulk inserts, deterministic for a given seed and prefix.
+
+    Users get a long tailed activity weight so a few users own most of the rows,
+    amounts are log-normal and dates spread over the `days` days before `anchor`. Wallet
+    balances are accumulated while rows are generated and written once at the end,
+    with an opening balance credit for wallets that would otherwise end up negative.
+    Predefined categories already in the database are reused, and recurring
+    schedules start after today, so seeding never backfills recurring runs.
+    """
+
+    def __init__(
+        self, seed=42, batch_size=5000, days=365, password="loadtest1@", prefix="load", log=None,
+        anchor=DEFAULT_ANCHOR,
+    ):
+        # Keyed by prefix too, so datasets with another prefix get other ids
+        self.rng = random.Random(f"{seed}:{prefix}")
+        self.batch_size = batch_size
+        self.days = days
+        self.password = make_password(password)
+        self.prefix = prefix
+        self.log = log or (lambda message: None)
+        self.anchor = anchor
+
+    def uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def amount(self, mu=3.5, sigma=1.1):
+        cents = min(max(int(self.rng.lognormvariate(mu, sigma) * 100), 100), 9_999_999_99)
+        return Decimal(cents).scaleb(-2)
+
+    def date_time(self):
+        return self.anchor - timedelta(seconds=self.rng.randrange(self.days * 24 * 60 * 60))
+
+    def bulk_create(self, model, rows):
+        for start in range(0, len(rows), self.batch_size):
+            with transaction.atomic():
+                model.objects.bulk_create(rows[start:start + self.batch_size])
+
+    def stream(self, model, total, make_row):
+        """Create `total` rows in batches without holding them all in memory."""
+        created = 0
+        while created < total:
+            size = min(self.batch_size, total - created)
+            with transaction.atomic():
+                model.objects.bulk_create([make_row() for _ in range(size)])
+            created += size
+            self.log(f"{model.__name__}: {created}/{total}")
+
+    def create_staff(self):
+        staff = User(
+            id=self.uuid(), username=f"{self.prefix}staff", email=f"{self.prefix}staff@example.com",
+            name="Load Staff", password=self.password, is_staff=True, is_superuser=True,
+        )
+        staff.save()
+        existing = {
+            (category.name, category.type): category
+            for category in Category.objects.filter(is_predefined=True, is_deleted=False).order_by("created_at")
+        }
+        predefined, missing = [], []
+        for name, type in PREDEFINED_CATEGORIES:
+            category_id = self.uuid()  # drawn either way, so the rest of the dataset stays the same
+            category = existing.get((name, type))
+            if category is None:
+                category = Category(
+                    id=category_id, name=name, slug=slugify(name), user=staff, type=type, is_predefined=True
+                )
+                missing.append(category)
+            predefined.append(category)
+        if missing:
+            Category.objects.bulk_create(missing)
+            invalidate_predefined_categories()
+        return staff, predefined
+
+    def create_users(self, count):
+        users = [
+            User(
+                id=self.uuid(), username=f"{self.prefix}user{i}", email=f"{self.prefix}user{i}@example.com",
+                name=f"Load User {i}", password=self.password,
+            )
+            for i in range(count)
+        ]
+        self.bulk_create(User, users)
+        return users
+
+    def create_wallets_and_categories(self, users):
+        wallets, categories = {}, {}
+        for user in users:
+            names = WALLET_NAMES[: self.rng.randint(1, len(WALLET_NAMES))]
+            wallets[user.id] = [Wallet(id=self.uuid(), user=user, name=name) for name in names]
+            categories[user.id] = [
+                Category(id=self.uuid(), user=user, name=name, slug=slugify(name), type=type)
+                for name, type in USER_CATEGORIES
+            ]
+        self.bulk_create(Wallet, [wallet for rows in wallets.values() for wallet in rows])
+        self.bulk_create(Category, [category for rows in categories.values() for category in rows])
+        return wallets, categories
+
+    def create_budgets(self, users, debit_categories):
+        budgets = []
+        for user in users:
+            for category in self.rng.sample(debit_categories[user.id], 2):
+                for months_ago in range(3):
+                    year, month = divmod(self.anchor.year * 12 + self.anchor.month - 1 - months_ago, 12)
+                    budgets.append(
+                        Budget(
+                            id=self.uuid(), user=user, category=category, year=year, month=month + 1,
+                            amount=self.amount(mu=6.5, sigma=0.5),
+                        )
+                    )
+        self.bulk_create(Budget, budgets)
+        return len(budgets)
+
+    def create_recurring(self, users, wallets, debit_categories):
+        # process_recurring_transactions would catch up on schedules starting in the past
+        first_day = max(self.anchor, datetime.combine(timezone.now().date(), time.min, tzinfo=dt_timezone.utc))
+        recurring = []
+        for user in users:
+            for _ in range(self.rng.randint(0, 3)):
+                start = first_day + timedelta(days=self.rng.randint(1, 30))
+                recurring.append(
+                    RecurringTransaction(
+                        id=self.uuid(), user=user, wallet=self.rng.choice(wallets[user.id]),
+                        category=self.rng.choice(debit_categories[user.id]), type="debit",
+                        amount=self.amount(mu=4.0, sigma=0.8),
+                        frequency=self.rng.choice(["daily", "weekly", "monthly", "yearly"]),
+                        start_date=start, next_run=start,
+                    )
+                )
+        self.bulk_create(RecurringTransaction, recurring)
+        return len(recurring)
+
+    def run(self, users, transactions, transfers):
+        """Generate the dataset and return the staff user, the users and row counts."""
+        staff, predefined = self.create_staff()
+        user_objs = self.create_users(users)
+        self.log(f"User: {users}/{users}")
+        wallets, categories = self.create_wallets_and_categories(user_objs)
+
+        debit_categories, credit_categories = {}, {}
+        for user in user_objs:
+            visible = predefined + categories[user.id]
+            debit_categories[user.id] = [c for c in visible if c.type == "debit"]
+            credit_categories[user.id] = [c for c in visible if c.type == "credit"]
+
+        counts = {
+            "budgets": self.create_budgets(user_objs, debit_categories),
+            "recurring_transactions": self.create_recurring(user_objs, wallets, debit_categories),
+        }
+
+        weights = [self.rng.paretovariate(1.16) for _ in user_objs]
+        cum_weights = [0] * len(weights)
+        total = 0
+        for i, weight in enumerate(weights):
+            total += weight
+            cum_weights[i] = total
+        balances = {wallet.id: Decimal("0.00") for rows in wallets.values() for wallet in rows}
+
+        def pick_user():
+            return self.rng.choices(user_objs, cum_weights=cum_weights)[0]
+
+        def make_transaction():
+            user = pick_user()
+            wallet = self.rng.choice(wallets[user.id])
+            if self.rng.random() < DEBIT_SHARE:
+                category, amount = self.rng.choice(debit_categories[user.id]), self.amount()
+                balances[wallet.id] -= amount
+            else:
+                category, amount = self.rng.choice(credit_categories[user.id]), self.amount(mu=7.0, sigma=0.6)
+                balances[wallet.id] += amount
+            return Transaction(
+                id=self.uuid(), user=user, wallet=wallet, category=category,
+                type=category.type, amount=amount, date_time=self.date_time(),
+            )
+
+        multi_wallet_users = [user for user in user_objs if len(wallets[user.id]) > 1]
+
+        def make_transfer():
+            user = self.rng.choice(multi_wallet_users)
+            source, destination = self.rng.sample(wallets[user.id], 2)
+            amount = self.amount(mu=4.5, sigma=0.9)
+            balances[source.id] -= amount
+            balances[destination.id] += amount
+            return InterWalletTransaction(
+                id=self.uuid(), user=user, source_wallet=source, destination_wallet=destination,
+                amount=amount, date_time=self.date_time(),
+            )
+
+        self.stream(Transaction, transactions, make_transaction)
+        if multi_wallet_users:
+            self.stream(InterWalletTransaction, transfers, make_transfer)
+        counts["transactions"] = transactions
+        counts["interwallet_transactions"] = transfers if multi_wallet_users else 0
+
+        # Top up wallets that went negative, so every balance stays reachable through the API.
+        opening = self.anchor - timedelta(days=self.days)
+        openings, all_wallets = [], []
+        for user in user_objs:
+            salary = credit_categories[user.id][0]
+            for wallet in wallets[user.id]:
+                if balances[wallet.id] < 0:
+                    amount = -balances[wallet.id] + self.amount(mu=6.0, sigma=0.5)
+                    openings.append(
+                        Transaction(
+                            id=self.uuid(), user=user, wallet=wallet, category=salary,
+                            type="credit", amount=amount, date_time=opening, description="Opening balance",
+                        )
+                    )
+                    balances[wallet.id] += amount
+                wallet.balance = balances[wallet.id]
+                all_wallets.append(wallet)
+        self.bulk_create(Transaction, openings)
+        counts["transactions"] += len(openings)
+        Wallet.objects.bulk_update(all_wallets, ["balance"], batch_size=self.batch_size)
+
+        return staff, user_objs, counts
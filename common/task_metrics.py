@@ -0,0 +1,75 @@
+import time
+from datetime import datetime
+
+from celery.signals import (
+    before_task_publish,
+    task_prerun,
+    task_postrun,
+    task_retry,
+    task_failure,
+)
+
+from common.metrics import registry, DURATION_BUCKETS
+
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+QUEUE_WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+# task id -> perf_counter at start, for tasks running in this worker process
+_started = {}
+
+
+@before_task_publish.connect
+def stamp_enqueue_time(headers=None, **kwargs):
+    """Record the publish time in the message, so the worker can measure queue wait."""
+    if headers is not None:
+        headers.setdefault(ENQUEUED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def start_task_timer(task_id=None, task=None, **kwargs):
+    _started[task_id] = time.perf_counter()
+
+    enqueued_at = getattr(task.request, ENQUEUED_AT_HEADER, None)
+    if enqueued_at is not None:
+        ready_at = float(enqueued_at)
+        if task.request.eta:
+            # Countdown and ETA tasks only start waiting once they are due.
+            ready_at = max(ready_at, datetime.fromisoformat(task.request.eta).timestamp())
+        registry.observe(
+            "celery_task_queue_wait_seconds",
+            {"task": task.name, "queue": _queue_of(task)},
+            max(time.time() - ready_at, 0),
+            QUEUE_WAIT_BUCKETS,
+        )
+
+
+@task_postrun.connect
+def stop_task_timer(task_id=None, task=None, state=None, **kwargs):
+    started = _started.pop(task_id, None)
+    if started is not None:
+        registry.observe(
+            "celery_task_duration_seconds",
+            {"task": task.name, "state": state or "UNKNOWN"},
+            time.perf_counter() - started,
+            DURATION_BUCKETS,
+        )
+    registry.flush_if_due()
+
+
+@task_retry.connect
+def count_retry(sender=None, **kwargs):
+    registry.inc("celery_task_retries_total", {"task": sender.name})
+
+
+@task_failure.connect
+def count_failure(sender=None, exception=None, **kwargs):
+    registry.inc(
+        "celery_task_failures_total",
+        {"task": sender.name, "exception": type(exception).__name__},
+    )
+
+
+def _queue_of(task):
+    delivery_info = task.request.delivery_info or {}
+    return delivery_info.get("routing_key") or "celery"
@@ -0,0 +1,22 @@
+from celery import shared_task, current_app
+
+from common.metrics import registry
+
+
+@shared_task
+def sample_queue_depths():
+    """Store the number of waiting messages of every configured queue as a gauge."""
+    depths = {}
+    with current_app.connection_for_read() as connection:
+        for name in current_app.amqp.queues:
+            channel = connection.channel()
+            try:
+                _, depths[name], _ = channel.queue_declare(queue=name, passive=True)
+            except connection.channel_errors:
+                depths[name] = 0  # not declared yet, nothing was ever published to it
+            finally:
+                channel.close()
+
+    for name, depth in depths.items():
+        registry.set_gauge("celery_queue_depth", {"queue": name}, depth)
+    return depths
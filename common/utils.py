@@ -1,6 +1,11 @@
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import NotFound
+
+from common.async_views import gather_queries
 
 from rest_framework.views import exception_handler
 from rest_framework.exceptions import PermissionDenied, ValidationError
@@ -23,6 +28,36 @@ class CustomPagination(PageNumberPagination):
             }
         )
 
+    async def apaginate_queryset(self, queryset, request):
+        """
+        Async paginate_queryset that counts the rows and fetches the requested
+        page concurrently instead of one after the other.
+        """
+        number = request.query_params.get(self.page_query_param) or 1
+        if not str(number).isdigit() or int(number) < 1:
+            # "last" and invalid numbers, rare enough to take the sync path
+            return await sync_to_async(self.paginate_queryset)(queryset, request)
+
+        page_size = self.get_page_size(request)
+        paginator = self.django_paginator_class(queryset, page_size)
+        bottom = (int(number) - 1) * page_size
+        count, rows = await gather_queries(
+            queryset.count, lambda: list(queryset[bottom : bottom + page_size])
+        )
+
+        paginator.count = count  # cached_property, so page() below runs no query
+        try:
+            self.page = paginator.page(number)
+        except InvalidPage as exc:
+            raise NotFound(
+                self.invalid_page_message.format(page_number=number, message=str(exc))
+            )
+        self.page.object_list = rows
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        self.request = request
+        return rows
+
 
 def not_found_response(message, status_code=status.HTTP_404_NOT_FOUND):
     """Create a standard response structure for success or error."""
@@ -2,6 +2,7 @@
 from __future__ import absolute_import, unicode_literals
 import os
 from celery import Celery
+from celery.signals import worker_process_shutdown
 from celery.schedules import crontab
 
 # Set the default Django settings module for the 'celery' program.
@@ -20,3 +21,19 @@ app.conf.result_backend = "redis://localhost:6379/0"
 
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
+
+
+@worker_process_shutdown.connect
+def close_smtp_connections(**kwargs):
+    """Quit pooled SMTP sessions cleanly when a worker process exits."""
+    from common.email_backend import connection_pool
+
+    connection_pool.close_all()
+
+
+@worker_process_shutdown.connect
+def flush_task_metrics(**kwargs):
+    """Write task metrics buffered by this process before it exits."""
+    from common.metrics import registry
+
+    registry.flush()
@@ -47,12 +47,15 @@ INSTALLED_APPS = [
     "django_celery_beat",
     "django_celery_results",
     "drf_yasg",
+    "common",
     "account",
     "transactions",
     "categories",
     "wallets",
     "budgets",
     "recurring_transactions",
+    "reports",
+    "archive",
 ]
 
 REST_FRAMEWORK = {
@@ -62,6 +65,15 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "EXCEPTION_HANDLER": "common.exceptions.custom_exception_handler",
 }
 from datetime import timedelta
@@ -73,6 +85,9 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,  # Blacklist old refresh tokens
 }
 MIDDLEWARE = [
+    "common.middleware.PerformanceMiddleware",
+    "common.outbox.OutboxMiddleware",
+    "common.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -114,9 +129,33 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST", "127.0.0.1"),
         "PORT": int(os.getenv("DB_PORT", "5432")),
+        # Keep connections open between requests (and Celery tasks, whose Django
+        # fixup closes obsolete connections around every task) instead of paying
+        # a connect per request. Health checks drop connections the server closed.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "true").lower() == "true",
+        "OPTIONS": {},
     }
 }
 
+# Process wide psycopg 3 connection pool, an alternative to persistent
+# connections (Django refuses both at once). A process needs a connection per
+# gunicorn thread plus one per gather_queries thread (ASYNC_QUERY_THREADS), the
+# default max size, within PostgreSQL's max_connections. See gunicorn.conf.py.
+if os.getenv("DB_POOL", "false").lower() == "true":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(
+            os.getenv(
+                "DB_POOL_MAX_SIZE",
+                int(os.getenv("GUNICORN_THREADS", "4")) + int(os.getenv("ASYNC_QUERY_THREADS", "0")),
+            )
+        ),
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -171,6 +210,42 @@ CELERY_TASK_SERIALIZER = "json"  # Serialize tasks to JSON
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND")
 CELERY_TIMEZONE = os.getenv("CELERY_TIMEZONE")
 
+# Queues per workload class, so a slow export never delays budget checks.
+# Each queue gets its own worker with concurrency and prefetch tuned to it,
+# see docker-compose.prod.yml. Unrouted tasks stay on the default queue.
+from kombu import Queue
+
+CELERY_TASK_DEFAULT_QUEUE = "celery"
+CELERY_TASK_QUEUES = [
+    Queue("celery"),
+    Queue("budgets"),
+    Queue("notifications"),
+    Queue("recurring"),
+    Queue("exports"),
+    Queue("maintenance"),
+]
+CELERY_TASK_ROUTES = {
+    "budgets.tasks.evaluate_budgets": {"queue": "budgets", "priority": 2},
+    "account.tasks.send_reset_password_email": {"queue": "notifications", "priority": 0},
+    "recurring_transactions.tasks.send_transaction_notification": {"queue": "notifications", "priority": 5},
+    "recurring_transactions.tasks.process_recurring_transactions": {"queue": "recurring", "priority": 5},
+    "reports.tasks.send_transaction_history_email": {"queue": "exports", "priority": 3},
+    "reports.tasks.build_user_report_snapshots": {"queue": "exports", "priority": 8},
+    "account.tasks.soft_delete_user_related_objects": {"queue": "maintenance", "priority": 5},
+    "archive.tasks.archive_old_data": {"queue": "maintenance", "priority": 8},
+    "transactions.tasks.create_transaction_partitions": {"queue": "maintenance", "priority": 5},
+    "wallets.tasks.snapshot_wallet_balances": {"queue": "maintenance", "priority": 5},
+}
+CELERY_TASK_DEFAULT_PRIORITY = 5
+
+# Redis has no native priorities, kombu emulates them with one list per step
+# and, unlike AMQP, 0 is the highest priority and 9 the lowest.
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "priority_steps": list(range(10)),
+    "sep": ":",
+    "queue_order_strategy": "priority",
+}
+
 # CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 from celery.schedules import crontab
 
@@ -179,11 +254,58 @@ CELERY_BEAT_SCHEDULE = {
         "task": "recurring_transactions.tasks.process_recurring_transactions",
         "schedule": crontab(minute="*/1"),  # Run every 15 minutes
     },
+    "build-user-report-snapshots": {
+        "task": "reports.tasks.build_user_report_snapshots",
+        "schedule": crontab(hour=1, minute=0),  # Nightly staff overview snapshot
+    },
+    "archive-old-data": {
+        "task": "archive.tasks.archive_old_data",
+        "schedule": crontab(hour=2, minute=0),  # Nightly, after the report snapshots
+    },
+    "create-transaction-partitions": {
+        "task": "transactions.tasks.create_transaction_partitions",
+        "schedule": crontab(day_of_month=1, hour=0, minute=30),
+    },
+    "snapshot-wallet-balances": {
+        "task": "wallets.tasks.snapshot_wallet_balances",
+        "schedule": crontab(hour=0, minute=15),  # Nightly, just after the day boundary
+    },
+    "sample-queue-depths": {
+        "task": "common.tasks.sample_queue_depths",
+        "schedule": 30.0,  # seconds, feeds the celery_queue_depth gauge
+    },
 }
 
+# Archival (archive app): rows dated more than ARCHIVE_AFTER_YEARS ago, and rows
+# soft deleted more than ARCHIVE_DELETED_AFTER_DAYS ago, move to archive tables.
+ARCHIVE_AFTER_YEARS = int(os.getenv("ARCHIVE_AFTER_YEARS", "2"))
+ARCHIVE_DELETED_AFTER_DAYS = int(os.getenv("ARCHIVE_DELETED_AFTER_DAYS", "30"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "1000"))
+
+# Monthly partitions of the transactions table kept ready in advance, PostgreSQL
+# only (manage.py partition_transactions --convert switches the layout on).
+TRANSACTION_PARTITIONS_AHEAD = int(os.getenv("TRANSACTION_PARTITIONS_AHEAD", "3"))
+
+# Wallet balance snapshots (wallets.balances), taken nightly for /api/wallets/<id>/balance/.
+# Snapshots of the first of each month are kept, daily ones for this many days.
+WALLET_SNAPSHOT_DAILY_RETENTION_DAYS = int(os.getenv("WALLET_SNAPSHOT_DAILY_RETENTION_DAYS", "60"))
+
+# Soft deleting a user's objects runs in batches of this many rows, each in its own
+# transaction, and re-enqueues itself after USER_DELETION_MAX_BATCHES batches.
+USER_DELETION_BATCH_SIZE = int(os.getenv("USER_DELETION_BATCH_SIZE", "1000"))
+USER_DELETION_MAX_BATCHES = int(os.getenv("USER_DELETION_MAX_BATCHES", "50"))
+
+# Budget checks triggered within this many seconds are deduplicated and run as one batch.
+BUDGET_EVALUATION_WINDOW = int(os.getenv("BUDGET_EVALUATION_WINDOW", "30"))
+# Longest a window's evaluate_budgets task may wait in the queue, in seconds. Keys
+# collected for a window are kept this long past its end, after that they are lost.
+BUDGET_EVALUATION_MAX_DELAY = int(os.getenv("BUDGET_EVALUATION_MAX_DELAY", "3600"))
+
 # sendingmail
 # settings.py for Mailgun
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_BACKEND = os.getenv(
+    "EMAIL_BACKEND", "common.email_backend.PooledSMTPEmailBackend"
+)
 EMAIL_HOST = os.getenv("EMAIL_HOST")
 EMAIL_PORT = os.getenv("EMAIL_PORT")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS")
@@ -191,6 +313,31 @@ EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
 
+# SMTP connection pool (common.email_backend.PooledSMTPEmailBackend)
+EMAIL_POOL_SIZE = int(os.getenv("EMAIL_POOL_SIZE", "2"))  # idle connections kept per process
+EMAIL_POOL_MAX_IDLE = int(os.getenv("EMAIL_POOL_MAX_IDLE", "300"))  # seconds
+EMAIL_POOL_HEALTH_CHECK_INTERVAL = int(
+    os.getenv("EMAIL_POOL_HEALTH_CHECK_INTERVAL", "30")
+)  # NOOP connections idle for longer than this before reuse
+EMAIL_POOL_RETRIES = int(os.getenv("EMAIL_POOL_RETRIES", "1"))
+
+# Request metrics (common.middleware.PerformanceMiddleware, /api/metrics/)
+METRICS_FLUSH_INTERVAL = int(os.getenv("METRICS_FLUSH_INTERVAL", "10"))  # seconds
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")  # bearer token for /api/metrics/, staff only when unset
+
+# Async report and list views (common.async_views.gather_queries) can run their
+# independent queries concurrently in one process wide pool of this many threads,
+# each holding its own database connection on top of the request's. 0 runs them
+# on the request's connection. See gunicorn.conf.py for sizing it with DB_POOL.
+ASYNC_QUERY_THREADS = int(os.getenv("ASYNC_QUERY_THREADS", "0"))
+
+# Readiness probe (/api/health/ready/), checks cached per process
+HEALTH_CHECK_TTL = int(os.getenv("HEALTH_CHECK_TTL", "5"))  # seconds
+HEALTH_CHECK_TIMEOUT = int(os.getenv("HEALTH_CHECK_TIMEOUT", "2"))  # seconds, per dependency
+
+# JSON responses smaller than this are sent uncompressed (common.middleware.CompressionMiddleware)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes
+
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
@@ -207,9 +354,19 @@ SESSION_CACHE_ALIAS = "default"
 import sys
 
 if "test" in sys.argv or "pytest" in sys.modules:
-    DATABASES = {
+    # TEST_DATABASE=postgresql runs the suite against the DB_* server instead,
+    # which the PostgreSQL only tests (table partitioning) need.
+    if os.getenv("TEST_DATABASE", "sqlite") != "postgresql":
+        DATABASES = {
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",  # This makes it an in-memory database
+            }
+        }
+    CACHES = {
         "default": {
-            "ENGINE": "django.db.backends.sqlite3",
-            "NAME": ":memory:",  # This makes it an in-memory database
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         }
     }
+    # Other threads' connections cannot see rows of a test's open transaction.
+    ASYNC_QUERY_THREADS = 0
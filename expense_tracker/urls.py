@@ -21,7 +21,7 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
-from account.views import HealthCheckView
+from common.views import HealthCheckView, LivenessView, MetricsView, ReadinessView
 
 
 schema_view = get_schema_view(
@@ -50,5 +50,9 @@ urlpatterns = [
     path("api/interwallet-transactions/", include("wallets.urls.interwallet_url")),
     path("api/recurring-transactions/", include("recurring_transactions.urls")),
     path("api/", include("reports.urls")),
+    path("api/health/live/", LivenessView.as_view(), name="liveness"),
+    path("api/health/ready/", ReadinessView.as_view(), name="readiness"),
+    # Kept for probes configured before the split, with its original payload.
     path("api/health-check/", HealthCheckView.as_view(), name="health-check"),
+    path("api/metrics/", MetricsView.as_view(), name="metrics"),
 ]
@@ -0,0 +1,70 @@
+"""
+Gunicorn settings for the production image, every value overridable from the
+environment. The app is loaded once in the master and forked, so workers share
+its memory copy-on-write; nothing may open a database or SMTP connection at
+import time, and post_fork drops any that did.
+"""
+import multiprocessing
+import os
+
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# GUNICORN_ASGI=true serves expense_tracker.asgi with uvicorn workers, so async
+# views share an event loop instead of holding a thread each. Django cannot
+# reuse connections across ASGI requests, pair it with DB_POOL=true.
+#
+# Database connections per worker process: each request holds one while it
+# runs, and the async report and list views borrow up to ASYNC_QUERY_THREADS
+# more from a pool of threads shared by the whole process. With DB_POOL=true,
+# DB_POOL_MAX_SIZE must cover both or requests wait DB_POOL_TIMEOUT and fail:
+#   gthread: GUNICORN_THREADS + ASYNC_QUERY_THREADS, the default
+#   uvicorn: concurrent requests per worker + ASYNC_QUERY_THREADS, since
+#            requests are not bounded by threads there
+# and workers * DB_POOL_MAX_SIZE, plus the Celery processes, must stay under
+# PostgreSQL's max_connections.
+if os.getenv("GUNICORN_ASGI", "false").lower() == "true":
+    wsgi_app = "expense_tracker.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "expense_tracker.wsgi:application"
+    worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Recycle workers now and then so slow leaks cannot build up, jittered so they
+# do not all restart at once.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    """Import the URLconf, and with it every view and serializer, before workers fork."""
+    if server.cfg.preload_app:
+        from django.urls import get_resolver
+
+        get_resolver().url_patterns
+
+
+def post_fork(server, worker):
+    from django.db import connections
+
+    connections.close_all()
+
+
+def worker_exit(server, worker):
+    """Write buffered request metrics and quit pooled SMTP sessions before the worker goes."""
+    from common.email_backend import connection_pool
+    from common.metrics import registry
+
+    registry.flush()
+    connection_pool.close_all()
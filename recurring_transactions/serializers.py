@@ -5,11 +5,15 @@ from decimal import Decimal
 import datetime
 
 from common.utils import is_valid_uuid
+from common.serializers import SparseFieldsMixin
 from account.models import User
 from .models import RecurringTransaction
+from categories.serializers import CategoryField
 
 
-class RecurringTransactionSerializer(serializers.ModelSerializer):
+class RecurringTransactionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    category = CategoryField()
+
     class Meta:
         model = RecurringTransaction
         fields = [
@@ -90,7 +94,7 @@ class RecurringTransactionSerializer(serializers.ModelSerializer):
         user = self._get_recurring_transaction_user()
         transaction_type = self._get_recurring_transaction_type()
 
-        if not category.is_predefined and category.user != user:
+        if not category.is_predefined and category.user_id != getattr(user, "id", None):
             raise serializers.ValidationError(
                 "Category does not belong to the provided user."
             )
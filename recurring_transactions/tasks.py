@@ -1,3 +1,5 @@
+import logging
+
 from celery import shared_task
 from django.utils import timezone
 from django.db import transaction
@@ -5,7 +7,13 @@ from django.core.mail import send_mail
 from django.conf import settings
 from transactions.models import Transaction
 from .models import RecurringTransaction
-from transactions.tasks import handle_transaction
+from budgets.tasks import budget_key, schedule_budget_evaluation
+from common import outbox
+from common.cache import bump_data_version, bump_recurring_version
+from wallets.balances import apply_movements, transaction_movements
+
+
+logger = logging.getLogger(__name__)
 
 
 @shared_task
@@ -50,7 +58,7 @@ def send_transaction_notification(
             fail_silently=False,
         )
     except Exception as e:
-        print(f"Failed to send email notification: {str(e)}")
+        logger.warning("Failed to send email notification: %s", e)
 
 
 @shared_task
@@ -63,57 +71,66 @@ def process_recurring_transactions():
         next_run__lte=now, is_deleted=False
     )
 
-    for rec_txn in recurring_transactions:
-        with transaction.atomic():
-            # Check if related objects are deleted or if end_date has passed
-            if (
-                not rec_txn.user.is_active
-                or rec_txn.wallet.is_deleted
-                or rec_txn.category.is_deleted
-                or (
-                    rec_txn.end_date
-                    and rec_txn.end_date.date() < rec_txn.next_run.date()
+    with outbox.batch():
+        for rec_txn in recurring_transactions:
+            with transaction.atomic():
+                # Check if related objects are deleted or if end_date has passed
+                if (
+                    not rec_txn.user.is_active
+                    or rec_txn.wallet.is_deleted
+                    or rec_txn.category.is_deleted
+                    or (
+                        rec_txn.end_date
+                        and rec_txn.end_date.date() < rec_txn.next_run.date()
+                    )
+                ):
+
+                    # Soft delete the recurring transaction
+                    rec_txn.is_deleted = True
+                    rec_txn.save()
+                    bump_recurring_version(rec_txn.user_id)
+                    continue
+
+                # Create the actual transaction
+                new_transaction = Transaction.objects.create(
+                    user=rec_txn.user,
+                    wallet=rec_txn.wallet,
+                    category=rec_txn.category,
+                    type=rec_txn.type,
+                    amount=rec_txn.amount,
+                    date_time=rec_txn.next_run,
+                    description=rec_txn.description,
                 )
-            ):
+                schedule_budget_evaluation(budget_key(new_transaction))
 
-                # Soft delete the recurring transaction
-                rec_txn.is_deleted = True
+                # Update wallet balance
+                if rec_txn.type == "credit":
+                    rec_txn.wallet.balance += rec_txn.amount
+                else:
+                    rec_txn.wallet.balance -= rec_txn.amount
+                rec_txn.wallet.save()
+                apply_movements(transaction_movements(new_transaction))
+
+                # Update next run date
+                rec_txn.next_run = rec_txn.get_next_run_date(rec_txn.next_run)
                 rec_txn.save()
-                continue
-
-            # Create the actual transaction
-            new_transaction = Transaction.objects.create(
-                user=rec_txn.user,
-                wallet=rec_txn.wallet,
-                category=rec_txn.category,
-                type=rec_txn.type,
-                amount=rec_txn.amount,
-                date_time=rec_txn.next_run,
-                description=rec_txn.description,
-            )
-            handle_transaction.delay(new_transaction.id)
-
-            # Update wallet balance
-            if rec_txn.type == "credit":
-                rec_txn.wallet.balance += rec_txn.amount
-            else:
-                rec_txn.wallet.balance -= rec_txn.amount
-            rec_txn.wallet.save()
-
-            # Update next run date
-            rec_txn.next_run = rec_txn.get_next_run_date(rec_txn.next_run)
-            rec_txn.save()
-
-            rec_txn.refresh_from_db()
-
-            # Send email notification asynchronously
-            send_transaction_notification.delay(
-                user_name=rec_txn.user.name,
-                user_email=rec_txn.user.email,
-                amount=str(rec_txn.amount),
-                type_name=rec_txn.type,
-                category_name=rec_txn.category.name,
-                wallet_name=rec_txn.wallet.name,
-                transaction_date=new_transaction.date_time,
-                next_run_date=rec_txn.next_run,
-            )
+
+                rec_txn.refresh_from_db()
+
+                # Send email notification asynchronously
+                outbox.enqueue(
+                    send_transaction_notification,
+                    kwargs=dict(
+                        user_name=rec_txn.user.name,
+                        user_email=rec_txn.user.email,
+                        amount=str(rec_txn.amount),
+                        type_name=rec_txn.type,
+                        category_name=rec_txn.category.name,
+                        wallet_name=rec_txn.wallet.name,
+                        transaction_date=new_transaction.date_time,
+                        next_run_date=rec_txn.next_run,
+                    ),
+                )
+
+            bump_data_version(rec_txn.user_id)
+            bump_recurring_version(rec_txn.user_id)
@@ -7,14 +7,19 @@ from django.db import transaction as db_transaction
 from .models import RecurringTransaction
 from .serializers import RecurringTransactionSerializer
 from common.utils import CustomPagination, validation_error_response, not_found_response
+from common.cache import bump_recurring_version
+from common.conditional import conditional_get, recurring_version_keys
 from common.permissions import IsStaffOrOwner
+from common.serializers import requested_fields
 
 
 class RecurringTransactionListCreateView(APIView, CustomPagination):
     """Comprehensive list and create view for recurring transactions"""
 
+    @conditional_get(recurring_version_keys)
     def get(self, request):
         """List recurring transactions with comprehensive filtering"""
+        fields = requested_fields(request, RecurringTransactionSerializer)
         if request.user.is_staff:
             queryset = RecurringTransaction.objects.all().order_by("-created_at")
         else:
@@ -22,8 +27,10 @@ class RecurringTransactionListCreateView(APIView, CustomPagination):
                 user=request.user, is_deleted=False
             ).order_by("-created_at")
 
-        paginated_data = self.paginate_queryset(queryset, request)
-        serializer = RecurringTransactionSerializer(paginated_data, many=True)
+        paginated_data = self.paginate_queryset(
+            RecurringTransactionSerializer.only(queryset, fields), request
+        )
+        serializer = RecurringTransactionSerializer(paginated_data, many=True, fields=fields)
         return self.get_paginated_response(serializer.data)
 
     def post(self, request):
@@ -32,7 +39,8 @@ class RecurringTransactionListCreateView(APIView, CustomPagination):
             data=request.data, context={"request": request}
         )
         if serializer.is_valid():
-            serializer.save()
+            recurring_transaction = serializer.save()
+            bump_recurring_version(recurring_transaction.user_id)
             return Response(
                 serializer.data,
                 status=status.HTTP_201_CREATED,
@@ -49,6 +57,7 @@ class RecurringTransactionDetailView(APIView):
         """Retrieve recurring transaction with comprehensive permissions"""
         return get_object_or_404(RecurringTransaction, id=id)
 
+    @conditional_get(recurring_version_keys)
     def get(self, request, id):
         """Retrieve specific recurring transaction"""
         try:
@@ -76,7 +85,8 @@ class RecurringTransactionDetailView(APIView):
             context={"request": request},
         )
         if serializer.is_valid():
-            serializer.save()
+            recurring_transaction = serializer.save()
+            bump_recurring_version(recurring_transaction.user_id)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return validation_error_response(serializer.errors)
 
@@ -94,4 +104,5 @@ class RecurringTransactionDetailView(APIView):
             recurring_transaction.is_deleted = True
             recurring_transaction.save()
 
+        bump_recurring_version(recurring_transaction.user_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,131 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+from django.db.models import Count, DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from account.models import User
+from archive.queries import all_transaction_sources, budget_sources
+
+
+TOP_CATEGORY_COUNT = 3
+ZERO = Decimal("0.00")
+
+
+def _total_per_user(sources, **filters):
+    """
+    Sum of amount over every source for the outer row's user, as one expression
+    of correlated subqueries, so the archive is only read when the range needs it.
+    """
+    total = Value(ZERO)
+    for source in sources:
+        total = total + Coalesce(
+            Subquery(
+                source.filter(**filters)
+                .order_by()
+                .values("user_id")
+                .annotate(total=Sum("amount"))
+                .values("total")
+            ),
+            Value(ZERO),
+            output_field=DecimalField(max_digits=15, decimal_places=2),
+        )
+    return total
+
+
+def get_user_page(start_date, end_date, after=None, limit=50):
+    """
+    Return one keyset page of non-staff users with their income and expense totals,
+    computed by a single query over transactions, archived ones included when the
+    range reaches them, plus the next cursor.
+    """
+    sources = all_transaction_sources(start_date, end_date, user=OuterRef("pk"))
+
+    users = User.objects.filter(is_staff=False, is_active=True)
+    if after:
+        users = users.filter(id__gt=after)
+
+    page = list(
+        users.order_by("id")
+        .annotate(
+            total_income=_total_per_user(sources, type="credit"),
+            total_expense=_total_per_user(sources, type="debit"),
+        )
+        .values("id", "username", "email", "total_income", "total_expense")[: limit + 1]
+    )
+
+    next_cursor = page[limit - 1]["id"] if len(page) > limit else None
+    return page[:limit], next_cursor
+
+
+def get_top_categories(user_ids, start_date, end_date):
+    """Return {user_id: [top expense categories]} for a page of users, one query per source."""
+    totals = defaultdict(lambda: ZERO)
+    for source in all_transaction_sources(start_date, end_date, user_id__in=user_ids, type="debit"):
+        rows = source.values("user_id", category_name=F("category__name")).annotate(total=Sum("amount")).order_by()
+        for row in rows:
+            totals[row["user_id"], row["category_name"]] += row["total"]
+
+    top_categories = defaultdict(list)
+    for (user_id, category_name), total in sorted(totals.items(), key=lambda item: -item[1]):
+        if len(top_categories[user_id]) < TOP_CATEGORY_COUNT:
+            top_categories[user_id].append({"category_name": category_name, "amount": str(total)})
+    return top_categories
+
+
+def get_budget_breaches(user_ids, start_date, end_date):
+    """
+    Return {user_id: number of budgets overspent} for budgets of months in the
+    range, archived budgets and transactions included when the range reaches them.
+    """
+    # Whole months, a budget counts what was spent in its month even outside the range
+    sources = all_transaction_sources(start_date.replace(day=1), end_date + relativedelta(months=1, day=1))
+    spent = _total_per_user(
+        sources,
+        user=OuterRef("user"),
+        category=OuterRef("category"),
+        date_time__year=OuterRef("year"),
+        date_time__month=OuterRef("month"),
+    )
+
+    breaches = defaultdict(int)
+    for budgets in budget_sources(start_date, user_id__in=user_ids):
+        rows = (
+            budgets.annotate(period=F("year") * 100 + F("month"))
+            .filter(
+                period__gte=start_date.year * 100 + start_date.month,
+                period__lte=end_date.year * 100 + end_date.month,
+            )
+            .annotate(spent=spent)
+            .filter(spent__gt=F("amount"))
+            .values("user_id")
+            .annotate(breaches=Count("id"))
+            .order_by()
+        )
+        for row in rows:
+            breaches[row["user_id"]] += row["breaches"]
+    return dict(breaches)
+
+
+def build_user_aggregates(start_date, end_date, after=None, limit=50):
+    """Build one page of per-user totals, top categories and budget breaches."""
+    page, next_cursor = get_user_page(start_date, end_date, after, limit)
+    user_ids = [row["id"] for row in page]
+
+    top_categories = get_top_categories(user_ids, start_date, end_date)
+    budget_breaches = get_budget_breaches(user_ids, start_date, end_date)
+
+    items = [
+        {
+            "user_id": row["id"],
+            "username": row["username"],
+            "email": row["email"],
+            "total_income": str(row["total_income"]),
+            "total_expense": str(row["total_expense"]),
+            "top_categories": top_categories.get(row["id"], []),
+            "budget_breaches": budget_breaches.get(row["id"], 0),
+        }
+        for row in page
+    ]
+    return items, next_cursor
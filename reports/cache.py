@@ -0,0 +1,55 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+
+from common.cache import get_versions, data_version_key
+from common.utils import is_valid_uuid
+from categories.cache import PREDEFINED_VERSION_KEY, user_version_key
+
+
+REPORT_CACHE_TIMEOUT = 60 * 60  # entries are keyed by data version, expiry only frees memory
+
+
+def report_version_keys(user_id):
+    """The data and category version counters every report of a user is built from."""
+    return [
+        data_version_key(user_id),
+        PREDEFINED_VERSION_KEY,
+        user_version_key(user_id),
+    ]
+
+
+def report_etag_keys(request, *args, **kwargs):
+    """Version keys for the ETag of a report request, see common.conditional."""
+    if not request.user.is_staff:
+        return report_version_keys(request.user.id)
+    user_id = request.query_params.get("user_id")
+    return report_version_keys(user_id) if user_id and is_valid_uuid(user_id) else None
+
+
+def report_cache_key(user_id, endpoint, params):
+    """
+    Build the cache key of a report from the user's data and category versions,
+    so any transaction, wallet or category change makes old entries unreachable.
+    """
+    version_keys = report_version_keys(user_id)
+    versions = get_versions(version_keys)
+    fingerprint = ":".join(
+        [*(str(versions[key]) for key in version_keys), *map(str, params)]
+    )
+    digest = hashlib.md5(fingerprint.encode()).hexdigest()
+    return f"report:{endpoint}:{user_id}:{digest}"
+
+
+async def aget_cached_report(user_id, endpoint, params, build):
+    """
+    Return the cached report for (user, endpoint, params), awaiting the build
+    coroutine function on a miss.
+    """
+    key = await sync_to_async(report_cache_key)(user_id, endpoint, params)
+    data = await cache.aget(key)
+    if data is None:
+        data = await build()
+        await cache.aset(key, data, timeout=REPORT_CACHE_TIMEOUT)
+    return data
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.3 on 2026-10-19 08:28
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserReportSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('period_start', models.DateField()),
+                ('period_end', models.DateField()),
+                ('total_income', models.DecimalField(decimal_places=2, default=0, max_digits=15)),
+                ('total_expense', models.DecimalField(decimal_places=2, default=0, max_digits=15)),
+                ('top_categories', models.JSONField(default=list)),
+                ('budget_breaches', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='report_snapshots', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['period_start', 'period_end', 'user'], name='reports_use_period__e693f7_idx')],
+            },
+        ),
+    ]
@@ -1,3 +1,23 @@
 from django.db import models
+from account.models import User
+from common.models import BaseModel
 
-# Create your models here.
+
+class UserReportSnapshot(BaseModel):
+    """Precomputed per-user totals for the staff overview, rebuilt nightly."""
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="report_snapshots"
+    )
+    period_start = models.DateField()
+    period_end = models.DateField()
+    total_income = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    total_expense = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    top_categories = models.JSONField(default=list)
+    budget_breaches = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=["period_start", "period_end", "user"])]
+
+    def __str__(self):
+        return f"{self.user} | {self.period_start} - {self.period_end}"
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from transactions.models import Transaction
 from wallets.models import InterWalletTransaction
+from common.serializers import ValuesSerializer
 
 class TransactionReportSerializer(serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name')
@@ -13,10 +14,23 @@ class TransactionReportSerializer(serializers.ModelSerializer):
     def get_date(self, obj):
         return obj.date_time.date()
 
+class TransactionReportReadSerializer(ValuesSerializer):
+    """TransactionReportSerializer output from values() rows, names fetched with joins."""
+
+    serializer_class = TransactionReportSerializer
+    sources = {"category_name": "category__name", "wallet": "wallet__name"}
+
+
 class InterWalletTransactionReportSerializer(serializers.ModelSerializer):
     source_wallet = serializers.CharField(source='source_wallet.name')
     destination_wallet = serializers.CharField(source='destination_wallet.name')
 
     class Meta:
         model = InterWalletTransaction
-        fields = ['source_wallet', 'destination_wallet', 'amount', 'date_time']
\ No newline at end of file
+        fields = ['source_wallet', 'destination_wallet', 'amount', 'date_time']
+
+class InterWalletTransactionReportReadSerializer(ValuesSerializer):
+    """InterWalletTransactionReportSerializer output from values() rows, wallet names fetched with joins."""
+
+    serializer_class = InterWalletTransactionReportSerializer
+    sources = {"source_wallet": "source_wallet__name", "destination_wallet": "destination_wallet__name"}
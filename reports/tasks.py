@@ -4,6 +4,7 @@ from celery import shared_task
 from django.conf import settings
 from transactions.models import Transaction
 import csv
+from datetime import date
 import io
 
 from reportlab.lib.pagesizes import letter
@@ -12,6 +13,12 @@ from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 
 from account.models import User
+from archive.models import ArchivedTransaction
+from archive.queries import reaches_archive, latest_first
+from django.db import transaction as db_transaction
+from django.utils import timezone
+from .aggregates import build_user_aggregates
+from .models import UserReportSnapshot
 
 
 @shared_task
@@ -25,15 +32,19 @@ def send_transaction_history_email(
     """Celery task to generate and send transaction history via email asynchronously."""
     
     user = User.objects.get(id=user_id)
-    # Filter transactions for the authenticated user
-    transactions = (
-        Transaction.objects.filter(
-            user=user,
-            is_deleted=False,
-            date_time__date__range=(start_date, end_date),
-        )
-        .select_related("category", "wallet")
-        .order_by("-date_time")
+    # Filter transactions for the authenticated user, from the archive too for old ranges
+    models = [Transaction]
+    if reaches_archive(date.fromisoformat(start_date)):
+        models.append(ArchivedTransaction)
+    transactions = latest_first(
+        [
+            model.objects.filter(
+                user=user,
+                is_deleted=False,
+                date_time__date__range=(start_date, end_date),
+            ).select_related("category", "wallet")
+            for model in models
+        ]
     )
 
     # if not transactions.exists():
@@ -46,7 +57,8 @@ def send_transaction_history_email(
             "wallet": txn.wallet.name,  # Fetch wallet name
             "date": txn.date_time.date().isoformat(),
         }
-        for txn in transactions.filter(type="credit")
+        for txn in transactions
+        if txn.type == "credit"
     ]
 
     debit_transactions = [
@@ -56,7 +68,8 @@ def send_transaction_history_email(
             "wallet": txn.wallet.name,  # Fetch wallet name
             "date": txn.date_time.date().isoformat(),
         }
-        for txn in transactions.filter(type="debit")
+        for txn in transactions
+        if txn.type == "debit"
     ]
 
     # Generate file
@@ -95,6 +108,41 @@ def send_transaction_history_email(
 
 
 
+@shared_task
+def build_user_report_snapshots(page_size=500):
+    """
+    Nightly task to precompute the staff overview for the current month to date,
+    so the staff report can be served from UserReportSnapshot instantly.
+    """
+    today = timezone.now().date()
+    period_start = today.replace(day=1)
+
+    snapshots = []
+    after = None
+    while True:
+        items, after = build_user_aggregates(period_start, today, after, page_size)
+        snapshots.extend(
+            UserReportSnapshot(
+                user_id=item["user_id"],
+                period_start=period_start,
+                period_end=today,
+                total_income=item["total_income"],
+                total_expense=item["total_expense"],
+                top_categories=item["top_categories"],
+                budget_breaches=item["budget_breaches"],
+            )
+            for item in items
+        )
+        if after is None:
+            break
+
+    with db_transaction.atomic():
+        UserReportSnapshot.objects.all().delete()
+        UserReportSnapshot.objects.bulk_create(snapshots, batch_size=page_size)
+
+    return {"message": f"Built {len(snapshots)} user report snapshots"}
+
+
 def generate_csv_transaction_history(
     start_date, end_date, credit_transactions, debit_transactions
 ):
@@ -3,6 +3,7 @@ from .views import (
     TransactionReportAPI,
     SpendingTrendsView,
     TransactionHistoryExportView,
+    StaffUserReportView,
 )
 
 urlpatterns = [
@@ -12,6 +13,11 @@ urlpatterns = [
     path(
         "transaction-report/trends/", SpendingTrendsView.as_view(), name="transaction-trends"
     ),
+    path(
+        "transaction-report/users/",
+        StaffUserReportView.as_view(),
+        name="staff-user-report",
+    ),
     path(
         "transaction-report/export/",
         TransactionHistoryExportView.as_view(),
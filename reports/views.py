@@ -1,19 +1,31 @@
+from asgiref.sync import sync_to_async
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from django.db.models import Sum, F
-from datetime import datetime
-
-from transactions.models import Transaction
-from wallets.models import InterWalletTransaction
+from django.db.models.functions import TruncDay, TruncWeek, TruncMonth
+from datetime import datetime, timedelta
+from collections import defaultdict
+from operator import itemgetter
+from decimal import Decimal
+from dateutil.relativedelta import relativedelta
+
+from archive.queries import transaction_sources, interwallet_sources, latest_first
 from .serializers import (
-    TransactionReportSerializer,
-    InterWalletTransactionReportSerializer,
+    TransactionReportReadSerializer,
+    InterWalletTransactionReportReadSerializer,
 )
 from account.models import User
-from common.utils import is_valid_uuid
+from common.utils import is_valid_uuid, not_found_response
+from common.permissions import IsStaffUser
+from common.async_views import AsyncAPIView, gather_queries
+from .aggregates import build_user_aggregates
+from .models import UserReportSnapshot
 from .tasks import send_transaction_history_email
+from common.outbox import enqueue
+from .cache import aget_cached_report, report_etag_keys
+from common.conditional import conditional_get
 
 
 def parse_and_validate_dates(request):
@@ -48,29 +60,53 @@ def parse_and_validate_dates(request):
 
 
 def fetch_transactions(user, start_date, end_date):
-    """Helper function to retrieve transactions for a user within a date range."""
-    return Transaction.objects.filter(
-        user=user, is_deleted=False, date_time__range=(start_date, end_date)
-    )
+    """
+    Helper function to retrieve transactions for a user within a date range, as a
+    list of querysets that includes the archive when the range reaches into it.
+    """
+    return transaction_sources(user, start_date, end_date)
+
+
+def filter_sources(transactions, **filters):
+    """Helper function to apply the same filter to every transaction source."""
+    return [source.filter(**filters) for source in transactions]
+
+
+def merge_totals(rows, *keys):
+    """Helper function to add up rows that share the same keys, keeping their order."""
+    merged = {}
+    for row in rows:
+        key = tuple(row[name] for name in keys)
+        if key in merged:
+            merged[key]["total"] += row["total"]
+        else:
+            merged[key] = dict(row)
+    return list(merged.values())
 
 
 def calculate_totals(transactions, transaction_type):
     """Helper function to calculate total income or expenses."""
-    return (
-        transactions.filter(type=transaction_type).aggregate(total=Sum("amount"))[
-            "total"
-        ]
-        or 0.00
-    )
+    totals = [
+        source.filter(type=transaction_type).aggregate(total=Sum("amount"))["total"]
+        for source in transactions
+    ]
+    totals = [total for total in totals if total is not None]
+    return sum(totals) if totals else 0.00
 
 
 def group_transactions_by_category(transactions):
     """Helper function to group transactions by category and calculate total amount per category."""
-    return list(
-        transactions.values(category_name=F("category__name"))
-        .annotate(total=Sum("amount"))
-        .order_by("-total")
+    rows = merge_totals(
+        (
+            row
+            for source in transactions
+            for row in source.values(category_name=F("category__name"))
+            .annotate(total=Sum("amount"))
+            .order_by("-total")
+        ),
+        "category_name",
     )
+    return sorted(rows, key=lambda entry: entry["total"], reverse=True)
 
 
 def calculate_percentage(data_list, total_amount, percentage_key):
@@ -86,6 +122,118 @@ def calculate_percentage(data_list, total_amount, percentage_key):
     ]
 
 
+GRANULARITY_TRUNC = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+
+
+def parse_granularity(request):
+    """Helper function to read the optional granularity and by_category query parameters."""
+    granularity = request.query_params.get("granularity")
+    by_category = request.query_params.get("by_category", "").lower() == "true"
+
+    if granularity is not None and granularity not in GRANULARITY_TRUNC:
+        return (
+            None,
+            by_category,
+            Response(
+                {"error": "Invalid granularity. Use 'day', 'week' or 'month'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            ),
+        )
+    return granularity, by_category, None
+
+
+def bucket_start(day, granularity):
+    """Helper function to get the first day of the bucket a date falls in."""
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(day, granularity):
+    """Helper function to get the first day of the following bucket."""
+    if granularity == "week":
+        return day + timedelta(weeks=1)
+    if granularity == "month":
+        return day + relativedelta(months=1)
+    return day + timedelta(days=1)
+
+
+def group_transactions_by_period(transactions, granularity):
+    """Helper function to total transactions per (period, type, category) in a single query per source."""
+    rows = merge_totals(
+        (
+            row
+            for source in transactions
+            for row in source.annotate(period=GRANULARITY_TRUNC[granularity]("date_time"))
+            .values("period", "type", category_name=F("category__name"))
+            .annotate(total=Sum("amount"))
+            .order_by("period")
+        ),
+        "period",
+        "type",
+        "category_name",
+    )
+    return sorted(rows, key=lambda row: row["period"])
+
+
+def summarize_by_category(rows, transaction_type):
+    """Helper function to collapse period rows into per category totals, highest first."""
+    totals = defaultdict(Decimal)
+    for row in rows:
+        if row["type"] == transaction_type:
+            totals[row["category_name"]] += row["total"]
+    return sorted(
+        [{"category_name": name, "total": total} for name, total in totals.items()],
+        key=lambda entry: entry["total"],
+        reverse=True,
+    )
+
+
+def build_time_series(rows, start_date, end_date, granularity, by_category):
+    """Helper function to build a dense income/expense series, filling empty buckets with zero."""
+    buckets = {}
+    period = bucket_start(start_date, granularity)
+    while period <= end_date:
+        buckets[period] = {
+            "income": Decimal("0"),
+            "expense": Decimal("0"),
+            "categories": {"credit": defaultdict(Decimal), "debit": defaultdict(Decimal)},
+        }
+        period = next_bucket(period, granularity)
+
+    for row in rows:
+        bucket = buckets.get(row["period"].date())
+        if bucket is None:
+            continue
+        bucket["income" if row["type"] == "credit" else "expense"] += row["total"]
+        bucket["categories"][row["type"]][row["category_name"]] += row["total"]
+
+    series = []
+    for period, bucket in buckets.items():
+        entry = {
+            "period": str(period),
+            "income": float(bucket["income"]),
+            "expense": float(bucket["expense"]),
+        }
+        if by_category:
+            for key, transaction_type in (
+                ("income_categories", "credit"),
+                ("expense_categories", "debit"),
+            ):
+                entry[key] = [
+                    {"category_name": name, "amount": float(amount)}
+                    for name, amount in sorted(
+                        bucket["categories"][transaction_type].items(),
+                        key=lambda item: item[1],
+                        reverse=True,
+                    )
+                ]
+        series.append(entry)
+    return series
+
+
 def get_target_user(request):
     """
     Determines the target user for the request based on authentication and permissions.
@@ -119,94 +267,250 @@ def get_target_user(request):
         return target_user
 
 
-class TransactionReportAPI(APIView):
+def report_rows(sources, read_serializer=TransactionReportReadSerializer):
+    """Helper function to serialize sources newest first, from values() rows."""
+    rows = latest_first(
+        [read_serializer.values(source) for source in sources],
+        date_time=itemgetter("date_time"),
+    )
+    return read_serializer(rows).data
 
-    def get(self, request):
+
+async def build_transaction_report(target_user, start_date, end_date):
+    """
+    Build the transaction report data of a user for a date range, running the
+    independent totals, grouping and listing queries concurrently.
+    """
+    transactions = fetch_transactions(target_user, start_date, end_date)
+    interwallet_transactions = interwallet_sources(target_user, start_date, end_date)
+
+    (
+        total_income,
+        total_expense,
+        category_expense,
+        credit_transactions,
+        debit_transactions,
+        interwallet_data,
+    ) = await gather_queries(
+        lambda: calculate_totals(transactions, "credit"),
+        lambda: calculate_totals(transactions, "debit"),
+        lambda: group_transactions_by_category(
+            filter_sources(transactions, type="debit")
+        ),
+        lambda: report_rows(filter_sources(transactions, type="credit")),
+        lambda: report_rows(filter_sources(transactions, type="debit")),
+        lambda: report_rows(
+            interwallet_transactions, InterWalletTransactionReportReadSerializer
+        ),
+    )
+
+    return {
+        "total_income": total_income,
+        "total_expense": total_expense,
+        "category_expense": category_expense,
+        "transactions": {
+            "credit_transactions": credit_transactions,
+            "debit_transactions": debit_transactions,
+        },
+        "interwallet_transactions": interwallet_data,
+    }
+
+
+async def build_spending_trends(
+    target_user, start_date, end_date, granularity=None, by_category=False
+):
+    """
+    Build the category wise income and expense trends of a user for a date range.
+    With a granularity, everything is derived from one query grouped by period,
+    type and category, and a dense time series is added to the response.
+    Without one, the totals and groupings are queried concurrently.
+    """
+    transactions = fetch_transactions(target_user, start_date, end_date)
+
+    if granularity:
+        rows = await sync_to_async(group_transactions_by_period)(
+            transactions, granularity
+        )
+        income_data = summarize_by_category(rows, "credit")
+        expense_data = summarize_by_category(rows, "debit")
+        total_income = sum(entry["total"] for entry in income_data)
+        total_expense = sum(entry["total"] for entry in expense_data)
+    else:
+        total_income, total_expense, income_data, expense_data = await gather_queries(
+            lambda: calculate_totals(transactions, "credit"),
+            lambda: calculate_totals(transactions, "debit"),
+            lambda: group_transactions_by_category(
+                filter_sources(transactions, type="credit")
+            ),
+            lambda: group_transactions_by_category(
+                filter_sources(transactions, type="debit")
+            ),
+        )
+
+    income_list = calculate_percentage(income_data, total_income, "percentage")
+    expense_list = calculate_percentage(expense_data, total_expense, "percentage")
+
+    response_data = {
+        "start_date": str(start_date),
+        "end_date": str(end_date),
+        "total_income": float(total_income),
+        "total_expense": float(total_expense),
+        "income": income_list,
+        "expense": expense_list,
+    }
+
+    if granularity:
+        response_data["granularity"] = granularity
+        response_data["series"] = build_time_series(
+            rows, start_date, end_date, granularity, by_category
+        )
+
+    return response_data
+
+
+class TransactionReportAPI(AsyncAPIView):
+
+    @conditional_get(report_etag_keys)
+    async def get(self, request):
         start_date, end_date, error_response = parse_and_validate_dates(request)
         if error_response:
             return error_response
 
         try:
-            target_user = get_target_user(request)
+            target_user = await sync_to_async(get_target_user)(request)
         except ValidationError as e:
             return Response(
                 {"error": str(e.detail[0])}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        transactions = fetch_transactions(target_user, start_date, end_date)
+        response_data = await aget_cached_report(
+            target_user.id,
+            "transaction-report",
+            [start_date, end_date],
+            lambda: build_transaction_report(target_user, start_date, end_date),
+        )
 
-        total_income = calculate_totals(transactions, "credit")
-        total_expense = calculate_totals(transactions, "debit")
+        return Response(response_data, status=status.HTTP_200_OK)
 
-        category_expense = group_transactions_by_category(
-            transactions.filter(type="debit")
-        )
 
-        credit_transactions = TransactionReportSerializer(
-            transactions.filter(type="credit").order_by("-date_time"), many=True
-        ).data
+class SpendingTrendsView(AsyncAPIView):
 
-        debit_transactions = TransactionReportSerializer(
-            transactions.filter(type="debit").order_by("-date_time"), many=True
-        ).data
+    @conditional_get(report_etag_keys)
+    async def get(self, request):
+        start_date, end_date, error_response = parse_and_validate_dates(request)
+        if error_response:
+            return error_response
 
-        interwallet_transactions = InterWalletTransaction.objects.filter(
-            user=request.user, is_deleted=False, date_time__range=(start_date, end_date)
-        )
+        try:
+            target_user = await sync_to_async(get_target_user)(request)
+        except ValidationError as e:
+            return Response(
+                {"error": str(e.detail[0])}, status=status.HTTP_400_BAD_REQUEST
+            )
 
-        interwallet_data = InterWalletTransactionReportSerializer(
-            interwallet_transactions.order_by("-date_time"), many=True
-        ).data
-
-        response_data = {
-            "total_income": total_income,
-            "total_expense": total_expense,
-            "category_expense": category_expense,
-            "transactions": {
-                "credit_transactions": credit_transactions,
-                "debit_transactions": debit_transactions,
-            },
-            "interwallet_transactions": interwallet_data,
-        }
+        granularity, by_category, error_response = parse_granularity(request)
+        if error_response:
+            return error_response
+
+        response_data = await aget_cached_report(
+            target_user.id,
+            "transaction-trends",
+            [start_date, end_date, granularity, by_category],
+            lambda: build_spending_trends(
+                target_user, start_date, end_date, granularity, by_category
+            ),
+        )
 
         return Response(response_data, status=status.HTTP_200_OK)
 
 
-class SpendingTrendsView(APIView):
+class StaffUserReportView(APIView):
+    """
+    Staff overview of all non-staff users: totals, top expense categories and budget breaches.
+    - Paginated by keyset: pass the returned next_cursor as 'after' to get the next page.
+    - snapshot=true serves the latest nightly snapshot instead of querying live data.
+    """
+
+    permission_classes = [IsStaffUser]
+    default_limit = 50
+    max_limit = 500
 
     def get(self, request):
-        start_date, end_date, error_response = parse_and_validate_dates(request)
-        if error_response:
-            return error_response
+        after = request.query_params.get("after")
+        if after and not is_valid_uuid(after):
+            return Response(
+                {"error": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST
+            )
 
         try:
-            target_user = get_target_user(request)
-        except ValidationError as e:
+            limit = min(
+                int(request.query_params.get("limit", self.default_limit)),
+                self.max_limit,
+            )
+            if limit < 1:
+                raise ValueError
+        except ValueError:
             return Response(
-                {"error": str(e.detail[0])}, status=status.HTTP_400_BAD_REQUEST
+                {"error": "limit must be a positive integer."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        transactions = fetch_transactions(target_user, start_date, end_date)
+        if request.query_params.get("snapshot", "").lower() == "true":
+            return self.get_snapshot(after, limit)
 
-        total_income = calculate_totals(transactions, "credit")
-        total_expense = calculate_totals(transactions, "debit")
+        start_date, end_date, error_response = parse_and_validate_dates(request)
+        if error_response:
+            return error_response
 
-        income_data = group_transactions_by_category(transactions.filter(type="credit"))
-        expense_data = group_transactions_by_category(transactions.filter(type="debit"))
+        items, next_cursor = build_user_aggregates(start_date, end_date, after, limit)
 
-        income_list = calculate_percentage(income_data, total_income, "percentage")
-        expense_list = calculate_percentage(expense_data, total_expense, "percentage")
+        return Response(
+            {
+                "start_date": str(start_date),
+                "end_date": str(end_date),
+                "next_cursor": next_cursor,
+                "items": items,
+            },
+            status=status.HTTP_200_OK,
+        )
 
-        response_data = {
-            "start_date": str(start_date),
-            "end_date": str(end_date),
-            "total_income": float(total_income),
-            "total_expense": float(total_expense),
-            "income": income_list,
-            "expense": expense_list,
-        }
+    def get_snapshot(self, after, limit):
+        """Serve a page of the most recent snapshot."""
+        latest = UserReportSnapshot.objects.order_by("-created_at").first()
+        if latest is None:
+            return not_found_response("No snapshot has been generated yet.")
+
+        snapshots = UserReportSnapshot.objects.filter(
+            period_start=latest.period_start, period_end=latest.period_end
+        ).select_related("user")
+        if after:
+            snapshots = snapshots.filter(user_id__gt=after)
+        page = list(snapshots.order_by("user_id")[: limit + 1])
+        next_cursor = page[limit - 1].user_id if len(page) > limit else None
+
+        items = [
+            {
+                "user_id": snapshot.user_id,
+                "username": snapshot.user.username,
+                "email": snapshot.user.email,
+                "total_income": str(snapshot.total_income),
+                "total_expense": str(snapshot.total_expense),
+                "top_categories": snapshot.top_categories,
+                "budget_breaches": snapshot.budget_breaches,
+            }
+            for snapshot in page[:limit]
+        ]
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        return Response(
+            {
+                "start_date": str(latest.period_start),
+                "end_date": str(latest.period_end),
+                "generated_at": latest.created_at,
+                "next_cursor": next_cursor,
+                "items": items,
+            },
+            status=status.HTTP_200_OK,
+        )
 
 
 class TransactionHistoryExportView(APIView):
@@ -235,19 +539,22 @@ class TransactionHistoryExportView(APIView):
 
             transactions = fetch_transactions(target_user, start_date, end_date)
 
-            if not transactions.exists():
+            if not any(source.exists() for source in transactions):
                 return Response(
                     {"error": "No transactions found for the given date range"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
             # Trigger Celery task for email sending
-            send_transaction_history_email.delay(
-                target_user.id,
-                target_user.email,
-                str(start_date),
-                str(end_date),
-                file_format,
+            enqueue(
+                send_transaction_history_email,
+                args=[
+                    target_user.id,
+                    target_user.email,
+                    str(start_date),
+                    str(end_date),
+                    file_format,
+                ],
             )
 
             return Response(
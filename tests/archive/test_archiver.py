@@ -0,0 +1,132 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from account.tasks import soft_delete_user_related_objects
+from archive.archiver import archive_old_rows
+from archive.models import ArchivedRecurringTransaction, ArchivedTransaction
+from recurring_transactions.models import RecurringTransaction
+from transactions.models import Transaction
+
+
+@pytest.fixture
+def transactions(create_user, create_category, create_wallet):
+    user = create_user()
+    category = create_category(user=user)
+    wallet = create_wallet(user=user)
+    now = timezone.now()
+
+    def create(days_ago, amount, **extra):
+        return Transaction.objects.create(
+            user=user, wallet=wallet, category=category, amount=amount,
+            date_time=now - timedelta(days=days_ago), **extra,
+        )
+
+    aged = create(365 * 3, 40)
+    recent = create(10, 5)
+    deleted_long_ago = create(20, 7, is_deleted=True)
+    deleted_recently = create(20, 9, is_deleted=True)
+    Transaction.objects.filter(id=deleted_long_ago.id).update(updated_at=now - timedelta(days=60))
+    return {
+        "user": user,
+        "aged": aged,
+        "recent": recent,
+        "deleted_long_ago": deleted_long_ago,
+        "deleted_recently": deleted_recently,
+    }
+
+
+@pytest.mark.django_db
+def test_aged_and_old_deleted_rows_move_to_the_archive(transactions, settings):
+    settings.ARCHIVE_BATCH_SIZE = 1
+
+    moved = archive_old_rows()
+
+    assert moved["Transaction"] == 2
+    assert set(ArchivedTransaction.objects.values_list("id", flat=True)) == {
+        transactions["aged"].id,
+        transactions["deleted_long_ago"].id,
+    }
+    assert set(Transaction.objects.values_list("id", flat=True)) == {
+        transactions["recent"].id,
+        transactions["deleted_recently"].id,
+    }
+    archived = ArchivedTransaction.objects.get(id=transactions["aged"].id)
+    assert archived.amount == transactions["aged"].amount
+    assert archived.category_id == transactions["aged"].category_id
+
+
+@pytest.mark.django_db
+def test_archiving_resumes_after_an_interrupted_batch(transactions):
+    aged = transactions["aged"]
+    # A crashed run left the archive copy behind without deleting the hot row.
+    ArchivedTransaction.objects.create(
+        **{field.attname: getattr(aged, field.attname) for field in Transaction._meta.concrete_fields}
+    )
+
+    archive_old_rows()
+
+    assert not Transaction.objects.filter(id=aged.id).exists()
+    assert ArchivedTransaction.objects.filter(id=aged.id).count() == 1
+
+
+@pytest.mark.django_db
+def test_reports_include_archived_ranges(transactions, authenticated_client):
+    archive_old_rows()
+    client = authenticated_client()
+    today = timezone.now().date()
+    params = {"start_date": str(today - timedelta(days=365 * 4)), "end_date": str(today + timedelta(days=1))}
+
+    response = client.get(reverse("transaction-report"), params)
+
+    assert response.status_code == 200
+    assert float(response.data["total_expense"]) == 45.0
+    assert [txn["amount"] for txn in response.data["transactions"]["debit_transactions"]] == ["5.00", "40.00"]
+
+
+@pytest.mark.django_db
+def test_cascade_soft_deleted_rows_wait_before_archiving(transactions, settings):
+    """Bulk soft deletes stamp updated_at, so a deleted user's rows are not archived on the next run"""
+    recent = transactions["recent"]
+    Transaction.objects.filter(id=recent.id).update(updated_at=timezone.now() - timedelta(days=60))
+
+    soft_delete_user_related_objects(transactions["user"].id)
+    archive_old_rows()
+
+    assert Transaction.objects.filter(id=recent.id, is_deleted=True).exists()
+    assert not ArchivedTransaction.objects.filter(id=recent.id).exists()
+
+
+@pytest.mark.django_db
+def test_archiving_live_rows_invalidates_list_etags(transactions, authenticated_client):
+    client = authenticated_client()
+    url = reverse("transaction-list-create")
+    etag = client.get(url)["ETag"]
+
+    archive_old_rows()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert str(transactions["aged"].id) not in {str(item["id"]) for item in response.data["items"]}
+
+
+@pytest.mark.django_db
+def test_archiving_ended_recurring_transactions_invalidates_their_etag(transactions, authenticated_client):
+    start = timezone.now() - timedelta(days=365 * 4)
+    RecurringTransaction.objects.create(
+        user=transactions["user"], wallet=transactions["aged"].wallet, category=transactions["aged"].category,
+        type="debit", amount=10, frequency="monthly", start_date=start, next_run=start,
+        end_date=start + timedelta(days=90),
+    )
+    client = authenticated_client()
+    url = reverse("recurring-transactions-list")
+    etag = client.get(url)["ETag"]
+
+    archive_old_rows()
+
+    assert ArchivedRecurringTransaction.objects.count() == 1
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["count"] == 0
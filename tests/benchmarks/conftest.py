@@ -0,0 +1,76 @@
+import os
+from datetime import date, datetime, time, timezone as dt_timezone
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account.models import ActiveAccessToken
+from common.seed import LoadGenerator
+from recurring_transactions.models import RecurringTransaction
+from transactions.models import Transaction
+from wallets.models import InterWalletTransaction
+
+
+# Volumes are small by default so the suite runs in seconds on SQLite,
+# export BENCH_USERS=1000 BENCH_TRANSACTIONS=1000000 for production sized runs.
+BENCH_USERS = int(os.getenv("BENCH_USERS", "20"))
+BENCH_TRANSACTIONS = int(os.getenv("BENCH_TRANSACTIONS", "2000"))
+BENCH_ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "10"))
+BENCH_SEED = int(os.getenv("BENCH_SEED", "42"))
+# The data must stay recent, a year ending at a fixed past date drifts into the
+# archive tables. Set BENCH_ANCHOR=YYYY-MM-DD to replay an earlier run's data.
+BENCH_ANCHOR = date.fromisoformat(os.getenv("BENCH_ANCHOR", str(date.today())))
+
+
+@pytest.fixture(scope="session")
+def bench_data(django_db_setup, django_db_blocker):
+    """Seed the benchmark dataset once per session and flush it afterwards."""
+    with django_db_blocker.unblock():
+        generator = LoadGenerator(
+            seed=BENCH_SEED, password="benchpassword1@", prefix="bench",
+            anchor=datetime.combine(BENCH_ANCHOR, time.min, tzinfo=dt_timezone.utc),
+        )
+        staff, users, _ = generator.run(BENCH_USERS, BENCH_TRANSACTIONS, BENCH_TRANSACTIONS // 10)
+        yield {"staff": staff, "user": _busiest(users)}
+        call_command("flush", interactive=False, verbosity=0)
+
+
+def _busiest(users):
+    """
+    The user with the most transactions among those owning every kind of object,
+    so per-user endpoints see real volumes.
+    """
+    candidates = set(InterWalletTransaction.objects.values_list("user_id", flat=True)) & set(
+        RecurringTransaction.objects.values_list("user_id", flat=True)
+    )
+    top = (
+        Transaction.objects.filter(user_id__in=candidates)
+        .values("user_id")
+        .annotate(total=Count("id"))
+        .order_by("-total")
+        .first()
+    )
+    return next(user for user in users if user.id == top["user_id"])
+
+
+def _client_for(user):
+    access_token = str(AccessToken.for_user(user))
+    ActiveAccessToken.objects.create(user=user, access_token=access_token)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+    return client
+
+
+@pytest.fixture
+def bench_clients(bench_data, db, mocker):
+    """Authenticated clients for the seeded user and staff, with Celery publishing and the broker probe stubbed."""
+    mocker.patch("celery.app.task.Task.apply_async")
+    mocker.patch.dict("common.health.CHECKS", {"broker": lambda: None})
+    return {
+        "user": _client_for(bench_data["user"]),
+        "staff": _client_for(bench_data["staff"]),
+        "anonymous": APIClient(),
+    }
@@ -0,0 +1,165 @@
+import itertools
+import statistics
+import time
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse
+
+from account.models import User
+from account.views import generate_custom_token
+from budgets.models import Budget
+from recurring_transactions.models import RecurringTransaction
+from transactions.models import Transaction
+from wallets.models import Wallet, InterWalletTransaction
+
+from .conftest import BENCH_ANCHOR, BENCH_ITERATIONS, _client_for
+
+
+_counter = itertools.count()
+
+
+def _report_range():
+    """The year of seeded data, leading up to its anchor."""
+    end = BENCH_ANCHOR
+    return {"start_date": str(end.replace(year=end.year - 1)), "end_date": str(end)}
+
+
+# name -> (client, method, url kwargs, payload, query budget, cold cache)
+# The query budget is the maximum number of queries one request may run,
+# raise it only together with the change that needs the extra queries.
+CASES = {
+    "swagger-docs": ("user", "get", None, None, 2, False),
+    "register": (
+        "anonymous", "post", None,
+        lambda o: {
+            "username": f"benchnew{next(_counter)}", "email": f"benchnew{next(_counter)}@example.com",
+            "name": "Bench New", "password": "benchpassword1@",
+        },
+        3, False,
+    ),
+    "login": (
+        "anonymous", "post", None,
+        lambda o: {"username": o["user"].username, "password": "benchpassword1@"},
+        3, False,
+    ),
+    "logout": ("fresh", "post", None, None, 3, False),
+    "password-reset": ("anonymous", "post", None, lambda o: {"email": o["user"].email}, 3, True),
+    "password-reset-confirm": (
+        "anonymous", "post", lambda o: {"token": generate_custom_token(User.objects.get(pk=o["user"].pk))},
+        lambda o: {"password": "benchpassword1@"}, 4, False,
+    ),
+    "get-users": ("staff", "get", None, None, 4, False),
+    "get-update-delete-user": ("user", "get", lambda o: {"id": o["user"].id}, None, 3, False),
+    "change-password": (
+        "staff", "patch", lambda o: {"id": o["staff"].id},
+        lambda o: {"new_password": "benchpassword1@", "confirm_new_password": "benchpassword1@"},
+        5, False,
+    ),
+    "transaction-list-create": ("user", "get", None, None, 4, False),
+    "transaction-detail": ("user", "get", lambda o: {"id": o["transaction"]}, None, 4, False),
+    "category-list-create-view": ("user", "get", None, None, 2, False),
+    "category-detail-view": ("user", "get", lambda o: {"pk": o["category"]}, None, 4, False),
+    "wallet-list-create-view": ("user", "get", None, None, 4, False),
+    "wallet-detail-view": ("user", "get", lambda o: {"pk": o["wallet"]}, None, 4, False),
+    "wallet-balance-view": (
+        "user", "get", lambda o: {"pk": o["wallet"]}, lambda o: {"as_of": _report_range()["start_date"]}, 8, False,
+    ),
+    "budget-list-create": ("user", "get", None, None, 4, False),
+    "budget-detail": ("user", "get", lambda o: {"pk": o["budget"]}, None, 6, False),
+    "interwallet-transaction-list-create": ("user", "get", None, None, 4, False),
+    "interwallet-transaction-retrieve-update-delete": (
+        "user", "get", lambda o: {"pk": o["interwallet"]}, None, 4, False,
+    ),
+    "recurring-transactions-list": ("user", "get", None, None, 4, False),
+    "recurring-transaction-detail": ("user", "get", lambda o: {"id": o["recurring"]}, None, 4, False),
+    "transaction-report": ("user", "get", None, lambda o: _report_range(), 8, True),
+    "transaction-trends": ("user", "get", None, lambda o: _report_range(), 8, True),
+    "staff-user-report": ("staff", "get", None, lambda o: _report_range(), 6, False),
+    "transaction-history-export": ("user", "get", None, lambda o: _report_range(), 4, False),
+    "liveness": ("anonymous", "get", None, None, 0, False),
+    "readiness": ("anonymous", "get", None, None, 1, False),
+    "health-check": ("anonymous", "get", None, None, 1, False),
+    "metrics": ("staff", "get", None, None, 2, False),
+}
+
+
+def _api_route_names(patterns=None):
+    for pattern in patterns if patterns is not None else get_resolver().url_patterns:
+        if hasattr(pattern, "url_patterns"):
+            if "admin" not in str(pattern.pattern):
+                yield from _api_route_names(pattern.url_patterns)
+        elif pattern.name:
+            yield pattern.name
+
+
+@pytest.fixture
+def bench_objects(bench_data):
+    user = bench_data["user"]
+    return {
+        "user": user,
+        "staff": bench_data["staff"],
+        "transaction": Transaction.objects.filter(user=user).values_list("id", flat=True)[0],
+        "category": user.categories.values_list("id", flat=True)[0],
+        "wallet": Wallet.objects.filter(user=user).values_list("id", flat=True)[0],
+        "budget": Budget.objects.filter(user=user).values_list("id", flat=True)[0],
+        "interwallet": InterWalletTransaction.objects.filter(user=user).values_list("id", flat=True)[0],
+        "recurring": RecurringTransaction.objects.filter(user=user).values_list("id", flat=True)[0],
+    }
+
+
+@pytest.mark.benchmark
+def test_every_route_has_a_benchmark():
+    """New routes must be added to CASES with a query budget"""
+    assert set(_api_route_names()) - set(CASES) == set()
+
+
+# Known N+1 queries, strict so the marker has to go once they are fixed.
+KNOWN_REGRESSIONS = {}
+
+
+def _marks(name):
+    if name in KNOWN_REGRESSIONS:
+        return [pytest.mark.xfail(reason=KNOWN_REGRESSIONS[name], strict=True)]
+    return []
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "name",
+    [pytest.param(name, marks=_marks(name)) for name in CASES],
+)
+def test_endpoint_latency_and_query_budget(name, bench_clients, bench_objects):
+    role, method, url_kwargs, payload, budget, cold = CASES[name]
+
+    def request():
+        client = _client_for(bench_objects["user"]) if role == "fresh" else bench_clients[role]
+        url = reverse(name, kwargs=url_kwargs(bench_objects) if url_kwargs else None)
+        data = payload(bench_objects) if payload else None
+        return lambda: getattr(client, method)(url, data)
+
+    if not cold:
+        request()()  # warm up caches, steady state is what gets measured
+
+    latencies, query_counts = [], []
+    for _ in range(BENCH_ITERATIONS):
+        if cold:
+            cache.clear()
+        send = request()
+
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            response = send()
+            latencies.append(time.perf_counter() - start)
+        query_counts.append(len(ctx.captured_queries))
+
+        assert response.status_code < 400, (name, response.status_code, getattr(response, "data", None))
+
+    quantiles = statistics.quantiles(latencies, n=20) if len(latencies) > 1 else latencies * 19
+    print(
+        f"\n{name:<48} p50={quantiles[9] * 1000:8.2f}ms p95={quantiles[18] * 1000:8.2f}ms "
+        f"queries={max(query_counts)} (budget {budget})"
+    )
+    assert max(query_counts) <= budget, f"{name} ran {max(query_counts)} queries, budget is {budget}"
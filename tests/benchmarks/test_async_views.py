@@ -0,0 +1,79 @@
+import asyncio
+import os
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account.models import ActiveAccessToken
+from .conftest import BENCH_ITERATIONS
+from .test_api_endpoints import _report_range
+
+
+BENCH_CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "8"))
+
+# Async views, with the query parameters they are benchmarked with.
+ASYNC_ROUTES = {
+    "transaction-report": _report_range,
+    "transaction-trends": _report_range,
+    "transaction-list-create": dict,
+    "interwallet-transaction-list-create": dict,
+}
+
+
+@pytest.fixture
+def committed_token(bench_data, django_db_blocker):
+    """
+    A token committed outside any test transaction: the ASGI handler runs each
+    request's sync code in its own thread, with its own database connection.
+    """
+    user = bench_data["user"]
+    with django_db_blocker.unblock():
+        token = str(AccessToken.for_user(user))
+        ActiveAccessToken.objects.create(user=user, access_token=token)
+        yield f"Bearer {token}"
+        ActiveAccessToken.objects.filter(access_token=token).delete()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", ASYNC_ROUTES)
+def test_async_view_throughput(name, committed_token, django_db_blocker):
+    """
+    Requests per second of an async view taking BENCH_CONCURRENCY requests at
+    once through the ASGI handler, against the same requests sent one by one.
+    Caches are cleared so every request does the full work. On SQLite the
+    queries of concurrent requests are serialized, run against PostgreSQL with
+    ASYNC_QUERY_THREADS for representative numbers.
+    """
+    url, params = reverse(name), ASYNC_ROUTES[name]()
+    sync_client = APIClient()
+    sync_client.credentials(HTTP_AUTHORIZATION=committed_token)
+    async_client, headers = AsyncClient(), {"Authorization": committed_token}
+
+    def sequential():
+        for _ in range(BENCH_CONCURRENCY):
+            cache.clear()
+            assert sync_client.get(url, params).status_code == 200
+
+    async def concurrent():
+        cache.clear()
+        responses = await asyncio.gather(*(async_client.get(url, params, headers=headers) for _ in range(BENCH_CONCURRENCY)))
+        assert [response.status_code for response in responses] == [200] * BENCH_CONCURRENCY
+
+    timings = {}
+    with django_db_blocker.unblock():
+        for label, run in (("sequential", sequential), ("concurrent", async_to_sync(concurrent))):
+            start = time.perf_counter()
+            for _ in range(BENCH_ITERATIONS):
+                run()
+            timings[label] = BENCH_ITERATIONS * BENCH_CONCURRENCY / (time.perf_counter() - start)
+
+    print(
+        f"\n{name:<40} sequential={timings['sequential']:8.1f} req/s "
+        f"concurrent={timings['concurrent']:8.1f} req/s (x{BENCH_CONCURRENCY})"
+    )
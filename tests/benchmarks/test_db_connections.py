@@ -0,0 +1,56 @@
+import statistics
+import time
+
+import pytest
+from django.conf import settings
+from django.db import connections
+
+from .conftest import BENCH_ITERATIONS
+
+
+def _timed(run):
+    latencies = []
+    for _ in range(BENCH_ITERATIONS * 5):
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies)
+
+
+def _query(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+
+
+@pytest.mark.benchmark
+def test_connection_reuse_removes_connect_cost(django_db_setup, django_db_blocker):
+    """
+    Compare a request that opens its own connection (CONN_MAX_AGE=0, the old
+    default) with one reusing a persistent connection, health check included.
+    Runs on a separate connection so the test database transaction is untouched.
+    """
+    connection = connections.create_connection("default")
+    with django_db_blocker.unblock():
+        def fresh():
+            connection.connect()
+            _query(connection)
+            connection.close()
+
+        def reused():
+            if connection.connection is None:
+                connection.connect()
+            connection.health_check_done = False
+            connection.close_if_health_check_failed()
+            _query(connection)
+
+        fresh_time, reused_time = _timed(fresh), _timed(reused)
+        connection.close()
+
+    default = settings.DATABASES["default"]
+    print(
+        f"\n{connection.vendor}: connect per request={fresh_time * 1000:.3f}ms "
+        f"reused={reused_time * 1000:.3f}ms (CONN_MAX_AGE={default.get('CONN_MAX_AGE', 0)}, "
+        f"pool={'pool' in default.get('OPTIONS', {})})"
+    )
+    assert reused_time <= fresh_time
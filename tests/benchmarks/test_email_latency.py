@@ -0,0 +1,34 @@
+import time
+
+import pytest
+from django.core.mail import send_mail
+
+
+EMAIL_COUNT = 50
+
+
+def _per_email_latency(count):
+    start = time.perf_counter()
+    for i in range(count):
+        send_mail(f"Benchmark {i}", "Body", None, ["user@example.com"])
+    return (time.perf_counter() - start) / count
+
+
+@pytest.mark.benchmark
+def test_pooled_backend_per_email_latency(smtp_server, settings):
+    """Compare per-email latency of the stock SMTP backend and the pooled backend"""
+    settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+    baseline = _per_email_latency(EMAIL_COUNT)
+    baseline_sessions = smtp_server.sessions
+
+    settings.EMAIL_BACKEND = "common.email_backend.PooledSMTPEmailBackend"
+    pooled = _per_email_latency(EMAIL_COUNT)
+    pooled_sessions = smtp_server.sessions - baseline_sessions
+
+    print(
+        f"\nper-email latency: smtp={baseline * 1000:.2f}ms "
+        f"({baseline_sessions} sessions), pooled={pooled * 1000:.2f}ms "
+        f"({pooled_sessions} sessions)"
+    )
+    assert baseline_sessions == EMAIL_COUNT
+    assert pooled_sessions == 1
@@ -0,0 +1,56 @@
+import gc
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.renderers import JSONRenderer
+
+from common.renderers import ORJSONRenderer
+from reports.views import build_spending_trends, build_transaction_report
+
+from .conftest import BENCH_ANCHOR
+
+
+MIN_SPEEDUP = 3
+
+
+def _best(render, data, repeat=15):
+    """Best time of a few runs, garbage collection paused like timeit does."""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            render(data)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+@pytest.fixture
+def report_payloads(bench_data, db):
+    """The report and daily trends of the busiest seeded user over the last year."""
+    today = BENCH_ANCHOR
+    start = today.replace(year=today.year - 1)
+    user = bench_data["user"]
+    return {
+        "transaction-report": async_to_sync(build_transaction_report)(user, start, today),
+        "transaction-trends": async_to_sync(build_spending_trends)(user, start, today, "day", True),
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", ["transaction-report", "transaction-trends"])
+def test_orjson_renderer_speedup(name, report_payloads):
+    data = report_payloads[name]
+    drf, fast = JSONRenderer(), ORJSONRenderer()
+    assert fast.render(data) == drf.render(data)
+
+    drf_time, fast_time = _best(drf.render, data), _best(fast.render, data)
+
+    print(
+        f"\n{name:<20} bytes={len(drf.render(data)):8d} json={drf_time * 1000:7.2f}ms "
+        f"orjson={fast_time * 1000:6.2f}ms speedup={drf_time / fast_time:5.1f}x"
+    )
+    assert drf_time / fast_time >= MIN_SPEEDUP
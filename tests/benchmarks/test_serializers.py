@@ -0,0 +1,70 @@
+import gc
+import time
+
+import pytest
+
+from budgets.models import Budget
+from budgets.serializers import BudgetSerializer, BudgetReadSerializer
+from reports.serializers import TransactionReportSerializer, TransactionReportReadSerializer
+from transactions.models import Transaction
+from transactions.serializers import TransactionSerializer, TransactionReadSerializer
+from wallets.models import Wallet
+from wallets.serializers.wallet_serializer import WalletSerializer, WalletReadSerializer
+
+
+MIN_SPEEDUP = 5
+
+# name -> (model serializer, read serializer, queryset)
+PAIRS = {
+    "transaction": (TransactionSerializer, TransactionReadSerializer, lambda: Transaction.objects.all()),
+    "wallet": (WalletSerializer, WalletReadSerializer, lambda: Wallet.objects.all()),
+    "budget": (BudgetSerializer, BudgetReadSerializer, lambda: Budget.objects.all()),
+    "transaction-report": (
+        TransactionReportSerializer, TransactionReportReadSerializer,
+        lambda: Transaction.objects.select_related("category", "wallet"),
+    ),
+}
+
+
+def _per_row(serializers, rows, repeat=15):
+    """
+    Best time per row of each serializer over a few runs, interleaved so load
+    changes hit both alike, garbage collection paused like timeit does.
+    """
+    best = [float("inf")] * len(serializers)
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for i, (serialize, objs) in enumerate(zip(serializers, rows)):
+                start = time.perf_counter()
+                serialize(objs)
+                best[i] = min(best[i], time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return [elapsed / len(objs) for elapsed, objs in zip(best, rows)]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", PAIRS)
+def test_read_serializer_speedup(name, bench_data, db, mocker):
+    """
+    CPU time per row of the ModelSerializer against its values() counterpart,
+    rows fetched beforehand so only serialization is measured. The budget
+    serializer's spent amount query per row is stubbed out to compare like for like.
+    """
+    serializer_class, read_serializer_class, queryset = PAIRS[name]
+    if name == "budget":
+        mocker.patch.object(BudgetSerializer, "get_spent_amount", return_value="0.00")
+    instances = list(queryset())
+    rows = list(read_serializer_class.values(queryset()))
+
+    model_time, read_time = _per_row(
+        [lambda objs: serializer_class(objs, many=True).data, lambda objs: read_serializer_class(objs).data],
+        [instances, rows],
+    )
+
+    print(
+        f"\n{name:<20} rows={len(rows):6d} model={model_time * 1e6:7.2f}us/row "
+        f"values={read_time * 1e6:6.2f}us/row speedup={model_time / read_time:5.1f}x"
+    )
+    assert model_time / read_time >= MIN_SPEEDUP
@@ -0,0 +1,70 @@
+import json
+import os
+import runpy
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+STARTUP_ITERATIONS = int(os.getenv("BENCH_STARTUP_ITERATIONS", "5"))
+STARTUP_BUDGET = float(os.getenv("BENCH_STARTUP_BUDGET", "5.0"))
+
+# What a gunicorn master does with preload_app: load the WSGI app, then the URLconf in when_ready.
+LOAD_APP = """
+import json, time
+start = time.perf_counter()
+from expense_tracker.wsgi import application
+loaded = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+ready = time.perf_counter()
+from django.db import connections
+print(json.dumps({
+    "app": loaded - start,
+    "urls": ready - loaded,
+    "connections": [c.alias for c in connections.all(initialized_only=True) if c.connection is not None],
+}))
+"""
+
+
+def _load_app():
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "expense_tracker.settings"}
+    result = subprocess.run(
+        [sys.executable, "-c", LOAD_APP], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_loading_the_app_opens_no_connections():
+    """Workers are forked from the preloaded app and must not share its sockets"""
+    assert _load_app()["connections"] == []
+
+
+def test_gunicorn_config_preloads_the_app():
+    config = runpy.run_path(str(ROOT / "gunicorn.conf.py"))
+
+    assert config["preload_app"] is True
+    assert config["workers"] >= 1 and config["threads"] >= 1
+    assert (config["worker_class"], config["wsgi_app"]) == ("gthread", "expense_tracker.wsgi:application")
+
+
+def test_gunicorn_config_serves_asgi_with_uvicorn_workers(monkeypatch):
+    monkeypatch.setenv("GUNICORN_ASGI", "true")
+    config = runpy.run_path(str(ROOT / "gunicorn.conf.py"))
+
+    assert config["wsgi_app"] == "expense_tracker.asgi:application"
+    assert config["worker_class"] == "uvicorn_worker.UvicornWorker"
+
+
+@pytest.mark.benchmark
+def test_app_startup_time():
+    runs = [_load_app() for _ in range(STARTUP_ITERATIONS)]
+    app = statistics.median(run["app"] for run in runs)
+    total = statistics.median(run["app"] + run["urls"] for run in runs)
+
+    print(f"\nstartup: app={app * 1000:.0f}ms app+urls={total * 1000:.0f}ms (budget {STARTUP_BUDGET:.1f}s)")
+    assert total <= STARTUP_BUDGET
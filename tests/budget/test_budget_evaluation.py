@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+import pytest
+from django.core import mail
+from django.core.cache import cache
+from django.utils import timezone
+
+from budgets.models import Budget
+from budgets.tasks import (
+    budget_key, schedule_budget_evaluation, evaluate_budgets, evaluate_budget_keys, track_and_notify_budget,
+)
+from transactions.models import Transaction
+from transactions.tasks import handle_transaction
+
+
+@pytest.fixture
+def budget_setup(create_user, create_category, create_wallet):
+    user = create_user()
+    category = create_category(user=user)
+    wallet = create_wallet(user=user)
+    now = timezone.now()
+    budget = Budget.objects.create(
+        user=user, category=category, year=now.year, month=now.month, amount=Decimal("100.00")
+    )
+
+    def spend(amount):
+        return Transaction.objects.create(
+            user=user, wallet=wallet, category=category, type="debit", amount=Decimal(amount)
+        )
+
+    return budget, spend
+
+
+@pytest.mark.django_db
+def test_burst_of_transactions_schedules_one_evaluation(
+    budget_setup, mocker, django_capture_on_commit_callbacks
+):
+    budget, spend = budget_setup
+    apply_async = mocker.patch("budgets.tasks.evaluate_budgets.apply_async")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(50):
+            schedule_budget_evaluation(budget_key(spend("1.00")))
+
+    apply_async.assert_called_once()
+    slot = apply_async.call_args.args[0][0]
+    evaluate_keys = mocker.patch("budgets.tasks.evaluate_budget_keys")
+
+    assert evaluate_budgets(slot) == 1
+    evaluate_keys.assert_called_once_with([budget_key(budget)])
+
+    # The window is released, the next write schedules a new evaluation.
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_budget_evaluation(budget_key(budget))
+    assert apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+def test_evaluate_budget_keys_alerts_past_warning_threshold(budget_setup, django_assert_num_queries):
+    budget, spend = budget_setup
+    spend("95.00")
+
+    with django_assert_num_queries(2):
+        evaluate_budget_keys([budget_key(budget)])
+
+    assert len(mail.outbox) == 1
+    assert budget.category.name in mail.outbox[0].subject
+
+
+@pytest.mark.django_db
+def test_evaluate_budget_keys_stays_quiet_under_threshold(budget_setup):
+    budget, spend = budget_setup
+    spend("10.00")
+
+    evaluate_budget_keys([budget_key(budget)])
+
+    assert mail.outbox == []
+
+
+@pytest.mark.django_db
+def test_keys_outlive_a_late_queue(budget_setup, mocker, settings, django_capture_on_commit_callbacks):
+    budget, _ = budget_setup
+    settings.BUDGET_EVALUATION_MAX_DELAY = 600
+    mocker.patch("budgets.tasks.evaluate_budgets.apply_async")
+    add = mocker.spy(cache, "add")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_budget_evaluation(budget_key(budget))
+
+    assert {call.kwargs["timeout"] for call in add.call_args_list} == {settings.BUDGET_EVALUATION_WINDOW + 600}
+
+
+@pytest.mark.django_db
+def test_legacy_task_names_still_evaluate(budget_setup, mocker):
+    budget, spend = budget_setup
+    transaction = spend("95.00")
+    schedule = mocker.patch("transactions.tasks.schedule_budget_evaluation")
+
+    handle_transaction(transaction.id)
+    schedule.assert_called_once_with(budget_key(budget))
+
+    track_and_notify_budget(budget.id)
+    assert len(mail.outbox) == 1
@@ -0,0 +1,87 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from categories.cache import find_category, get_visible_categories
+
+
+def _category_queries(queries):
+    return [q["sql"] for q in queries if "categories_category" in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_category_list_served_from_cache(create_category, create_user, authenticated_client):
+    """Repeated category listing should not query the categories table"""
+    user = create_user()
+    client = authenticated_client()
+    create_category(name="Rent", user=user)
+    url = reverse("category-list-create-view")
+
+    client.get(url)
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.data["items"][0]["name"] == "Rent"
+    assert _category_queries(ctx.captured_queries) == []
+
+
+@pytest.mark.django_db
+def test_category_cache_invalidated_on_create_and_delete(create_user, authenticated_client):
+    """Creating or deleting a category bumps the cached version for the user"""
+    user = create_user()
+    client = authenticated_client()
+    url = reverse("category-list-create-view")
+    assert get_visible_categories(user.id) == []
+
+    response = client.post(url, {"name": "Bills", "user": str(user.id), "type": "debit"})
+    category_id = response.data["id"]
+    assert [c.name for c in get_visible_categories(user.id)] == ["Bills"]
+
+    client.delete(reverse("category-detail-view", kwargs={"pk": category_id}))
+    assert get_visible_categories(user.id) == []
+    assert find_category(category_id, user.id) is None
+
+
+@pytest.mark.django_db
+def test_duplicate_category_name_rejected(create_category, create_user, authenticated_client):
+    """Duplicate slugs are detected from the cached category map"""
+    user = create_user()
+    client = authenticated_client()
+    create_category(name="Travel", user=user)
+
+    response = client.post(
+        reverse("category-list-create-view"),
+        {"name": "travel", "user": str(user.id), "type": "debit"},
+    )
+
+    assert response.status_code == 400
+    assert "name" in response.data["error"]
+
+
+@pytest.mark.django_db
+def test_transaction_category_validated_from_cache(
+    create_user, create_category, create_wallet, authenticated_client, mocker
+):
+    """Transaction creation resolves its category without a categories query"""
+    user = create_user()
+    category = create_category(user=user)
+    wallet = create_wallet(user=user)
+    client = authenticated_client()
+    mocker.patch("budgets.tasks.evaluate_budgets.apply_async")
+    find_category(category.id, user.id)  # warm the cache
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.post(
+            reverse("transaction-list-create"),
+            {
+                "user": user.id,
+                "category": category.id,
+                "wallet": wallet.id,
+                "amount": 50,
+            },
+        )
+
+    assert response.status_code == 201
+    assert _category_queries(ctx.captured_queries) == []
@@ -0,0 +1,116 @@
+import logging
+import re
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.db.backends.signals import connection_created
+from django.http import JsonResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from common.middleware import CompressionMiddleware, PerformanceMiddleware
+from common.outbox import OutboxMiddleware
+from transactions.models import Transaction
+
+
+@pytest.fixture
+def transactions(create_user, create_category, create_wallet):
+    user = create_user()
+    category, wallet = create_category(user=user), create_wallet(user=user)
+    Transaction.objects.bulk_create(
+        Transaction(user=user, wallet=wallet, category=category, type="debit", amount=i + 1)
+        for i in range(15)
+    )
+    return user
+
+
+@pytest.mark.django_db
+def test_async_list_counts_and_pages_together(transactions, authenticated_client, django_assert_num_queries):
+    client = authenticated_client()
+
+    # 2 for authentication, then the count and the page
+    with django_assert_num_queries(4):
+        response = client.get(reverse("transaction-list-create"), {"page": 2})
+
+    assert response.status_code == 200
+    assert response.data["count"] == 15
+    assert response.data["total_pages"] == 2
+    assert len(response.data["items"]) == 5
+    assert response.data["next"] is None and response.data["previous"] is not None
+
+
+@pytest.mark.django_db
+def test_async_list_rejects_pages_past_the_end(transactions, authenticated_client):
+    client = authenticated_client()
+
+    assert client.get(reverse("transaction-list-create"), {"page": 3}).status_code == 404
+    assert client.get(reverse("transaction-list-create"), {"page": "last"}).status_code == 200
+
+
+@pytest.mark.django_db
+def test_async_view_runs_permission_checks(api_client):
+    """Same answer as the sync views give anonymous requests"""
+    async_response = api_client.get(reverse("transaction-list-create"))
+    sync_response = api_client.get(reverse("wallet-list-create-view"))
+
+    assert async_response.status_code == sync_response.status_code == 403
+    assert async_response.data == sync_response.data
+
+
+def _queries(response):
+    return re.search(r'"(\d+) queries"', response["Server-Timing"]).group(1)
+
+
+@pytest.mark.django_db(transaction=True)  # the pool threads' connections only see committed rows
+def test_threaded_queries_reuse_a_bounded_pool(transactions, authenticated_client, settings):
+    client = authenticated_client()
+    url, params = reverse("transaction-report"), {"start_date": "2000-01-01", "end_date": "2100-01-01"}
+    expected = client.get(url, params)
+
+    settings.ASYNC_QUERY_THREADS = 2
+    connected_in = []
+
+    def record(sender, connection, **kwargs):
+        connected_in.append(threading.current_thread().name)
+
+    connection_created.connect(record)
+    try:
+        for _ in range(3):
+            cache.clear()  # skip the report cache, run every query
+            response = client.get(url, params)
+            assert response.data == expected.data
+            # queries of the pool threads count towards the request
+            assert _queries(response) == _queries(expected)
+    finally:
+        connection_created.disconnect(record)
+
+    assert connected_in
+    assert len(connected_in) <= settings.ASYNC_QUERY_THREADS
+    assert all(name.startswith("async-query") for name in connected_in)
+
+
+def test_middlewares_are_async_capable():
+    async def view(request):
+        return JsonResponse({"items": list(range(500))})
+
+    middleware = PerformanceMiddleware(OutboxMiddleware(CompressionMiddleware(view)))
+    assert iscoroutinefunction(middleware)
+
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+    request.resolver_match = None
+    response = async_to_sync(middleware)(request)
+
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Server-Timing"].startswith("app;dur=")
+
+
+def test_asgi_handler_adapts_no_middleware(settings, caplog):
+    """No middleware forces the ASGI handler through a thread."""
+    settings.DEBUG = True
+    with caplog.at_level(logging.DEBUG, logger="django.request"):
+        ASGIHandler()
+
+    assert not [record.getMessage() for record in caplog.records if "adapted" in record.getMessage()]
@@ -0,0 +1,99 @@
+import gzip
+
+import pytest
+from django.http import HttpResponse, JsonResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from common import middleware
+from common.middleware import CompressionMiddleware
+
+
+LARGE = {"rows": [{"category_name": "Food", "amount": "10.00"}] * 200}
+
+
+def _respond(response, accept_encoding="gzip, deflate, br"):
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+@pytest.fixture(autouse=True)
+def without_brotli(mocker):
+    mocker.patch.object(middleware, "brotli", None)
+
+
+def test_large_json_is_gzipped():
+    response = JsonResponse(LARGE)
+    original = response.content
+    response["ETag"] = '"abc"'
+
+    response = _respond(response)
+
+    assert response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.content) == original
+    assert int(response["Content-Length"]) == len(response.content) < len(original)
+    assert response["Vary"] == "Accept-Encoding"
+    assert response["ETag"] == 'W/"abc"'
+
+
+def test_brotli_preferred_when_installed():
+    brotli = pytest.importorskip("brotli")
+    middleware.brotli = brotli
+    original = JsonResponse(LARGE).content
+
+    response = _respond(JsonResponse(LARGE))
+
+    assert response["Content-Encoding"] == "br"
+    assert brotli.decompress(response.content) == original
+
+
+@pytest.mark.parametrize(
+    "response, accept_encoding",
+    [
+        (JsonResponse({"ok": True}), "gzip"),  # under COMPRESSION_MIN_SIZE
+        (JsonResponse(LARGE), ""),
+        (JsonResponse(LARGE), "br"),  # brotli not installed
+        (HttpResponse("x" * 5000, content_type="text/html"), "gzip"),
+    ],
+    ids=["small", "not-accepted", "brotli-unavailable", "not-json"],
+)
+def test_left_uncompressed(response, accept_encoding):
+    assert not _respond(response, accept_encoding).has_header("Content-Encoding")
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, with_brotli, expected",
+    [
+        ("gzip;q=0, br;q=0", True, None),
+        ("br;q=0, gzip", True, "gzip"),
+        ("gzip;q=0.5, br;q=1", True, "br"),
+        ("gzip;q=1, br;q=0.5", True, "gzip"),
+        ("gzip, br", True, "br"),
+        ("GZIP;Q=0", False, None),
+        ("*", False, "gzip"),
+        ("*;q=0, identity", False, None),
+        ("gzip;q=oops", False, None),
+        ("deflate", False, None),
+    ],
+)
+def test_choose_encoding_honours_q_values(accept_encoding, with_brotli, expected):
+    middleware.brotli = object() if with_brotli else None
+
+    assert middleware.choose_encoding(accept_encoding) == expected
+
+
+def test_refused_gzip_is_not_sent():
+    assert not _respond(JsonResponse(LARGE), "gzip;q=0, identity").has_header("Content-Encoding")
+
+
+@pytest.mark.django_db
+def test_api_list_is_compressed(create_user, create_category, authenticated_client):
+    user = create_user()
+    for i in range(30):
+        create_category(name=f"category {i}", user=user)
+    client = authenticated_client()
+
+    response = client.get(reverse("category-list-create-view"), HTTP_ACCEPT_ENCODING="gzip")
+
+    assert response["Content-Encoding"] == "gzip"
+    assert b'"category 1' in gzip.decompress(response.content)
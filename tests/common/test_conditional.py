@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from budgets.models import Budget
+from recurring_transactions.models import RecurringTransaction
+
+
+REPORT_PARAMS = {"start_date": "2000-01-01", "end_date": "2100-01-01"}
+
+
+@pytest.fixture
+def client_with_wallet(create_user, create_wallet, authenticated_client):
+    user = create_user()
+    wallet = create_wallet(user=user)
+    return authenticated_client(), user, wallet
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, params",
+    [
+        ("wallet-list-create-view", None),
+        ("transaction-list-create", None),
+        ("interwallet-transaction-list-create", None),
+        ("category-list-create-view", None),
+        ("budget-list-create", None),
+        ("recurring-transactions-list", None),
+        ("transaction-report", REPORT_PARAMS),
+        ("transaction-trends", REPORT_PARAMS),
+    ],
+)
+def test_unchanged_response_is_not_modified(client_with_wallet, url_name, params, django_assert_max_num_queries):
+    client, _, _ = client_with_wallet
+    url = reverse(url_name)
+
+    first = client.get(url, params)
+    assert first.status_code == 200
+    assert first["ETag"].startswith('W/"')
+    assert "private" in first["Cache-Control"]
+
+    with django_assert_max_num_queries(2):  # authentication only
+        second = client.get(url, params, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    assert second.status_code == 304
+    assert second["ETag"] == first["ETag"]
+    assert second.content == b""
+
+
+@pytest.mark.django_db
+def test_etag_changes_with_data_and_query(client_with_wallet):
+    client, user, wallet = client_with_wallet
+    url = reverse("wallet-detail-view", kwargs={"pk": wallet.id})
+    etag = client.get(url)["ETag"]
+
+    assert client.get(reverse("wallet-list-create-view"))["ETag"] != etag
+    client.patch(url, {"name": "renamed"})
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_budget_etag_changes_with_spending_and_category_delete(client_with_wallet, create_category, mocker):
+    mocker.patch("budgets.tasks.evaluate_budgets.apply_async")
+    client, user, wallet = client_with_wallet
+    category = create_category(user=user)
+    now = timezone.now()
+    budget = Budget.objects.create(user=user, category=category, year=now.year, month=now.month, amount=Decimal("100"))
+    url = reverse("budget-detail", kwargs={"pk": budget.id})
+    etag = client.get(url)["ETag"]
+
+    # spent_amount changes with the transactions
+    client.post(
+        reverse("transaction-list-create"),
+        {"user": user.id, "wallet": wallet.id, "category": category.id, "type": "debit", "amount": "10.00"},
+    )
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    etag = response["ETag"]
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # deleting the category soft deletes its budgets in bulk
+    other = create_category(name="Other", user=user)
+    Budget.objects.create(user=user, category=other, year=now.year, month=now.month, amount=Decimal("100"))
+    list_etag = client.get(reverse("budget-list-create"))["ETag"]
+    assert client.delete(reverse("category-detail-view", kwargs={"pk": other.id})).status_code == 204
+    response = client.get(reverse("budget-list-create"), HTTP_IF_NONE_MATCH=list_etag)
+    assert response.status_code == 200
+    assert response.data["count"] == 1
+
+
+@pytest.mark.django_db
+def test_recurring_transaction_etag_changes_on_update(client_with_wallet, create_category):
+    client, user, wallet = client_with_wallet
+    now = timezone.now()
+    recurring = RecurringTransaction.objects.create(
+        user=user, wallet=wallet, category=create_category(user=user), type="debit", amount=Decimal("10"),
+        frequency="monthly", start_date=now, next_run=now,
+    )
+    url = reverse("recurring-transaction-detail", kwargs={"id": recurring.id})
+    etag = client.get(url)["ETag"]
+    list_etag = client.get(reverse("recurring-transactions-list"))["ETag"]
+
+    assert client.patch(url, {"description": "rent"}).status_code == 200
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+    assert client.get(reverse("recurring-transactions-list"), HTTP_IF_NONE_MATCH=list_etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_etag_is_per_user(client_with_wallet, create_user, generate_token):
+    client, _, _ = client_with_wallet
+    url = reverse("category-list-create-view")
+    etag = client.get(url)["ETag"]
+
+    create_user(username="other", email="other@example.com")
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_token('other')}")
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_errors_and_staff_lists_carry_no_etag(client_with_wallet, create_user, generate_token):
+    client, _, _ = client_with_wallet
+    assert not client.get(reverse("transaction-report")).has_header("ETag")  # dates missing, 400
+
+    staff = create_user(username="staff", email="staff@example.com")
+    staff.is_staff = True
+    staff.save()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_token('staff')}")
+    assert not client.get(reverse("wallet-list-create-view")).has_header("ETag")
@@ -0,0 +1,66 @@
+import pytest
+from django.db import connection, OperationalError
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+def test_liveness_does_no_io(api_client):
+    """No django_db mark, so any query would fail the test"""
+    response = api_client.get(reverse("liveness"))
+
+    assert response.status_code == 200
+    assert response.data == {"status": "ok"}
+
+
+@pytest.mark.django_db
+def test_readiness_caches_checks_for_the_ttl(api_client, mocker, settings):
+    settings.HEALTH_CHECK_TTL = 60
+    broker = mocker.patch.dict("common.health.CHECKS", {"broker": mocker.Mock()})["broker"]
+
+    with CaptureQueriesContext(connection) as first:
+        response = api_client.get(reverse("readiness"))
+    with CaptureQueriesContext(connection) as second:
+        api_client.get(reverse("readiness"))
+
+    assert response.status_code == 200
+    assert response.data["checks"] == {"database": "ok", "cache": "ok", "broker": "ok"}
+    assert len(first.captured_queries) == 1
+    assert len(second.captured_queries) == 0
+    broker.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_readiness_reports_failed_dependency(api_client, mocker):
+    mocker.patch.dict("common.health.CHECKS", {"broker": mocker.Mock(side_effect=ConnectionError("refused"))})
+
+    response = api_client.get(reverse("readiness"))
+
+    assert response.status_code == 503
+    assert response.data["status"] == "unavailable"
+    assert response.data["checks"]["broker"] == "failed: ConnectionError"
+    assert response.data["checks"]["database"] == "ok"
+
+
+@pytest.mark.django_db
+def test_legacy_health_check_keeps_its_payload(api_client, mocker):
+    broker = mocker.patch.dict("common.health.CHECKS", {"broker": mocker.Mock()})["broker"]
+
+    response = api_client.get(reverse("health-check"))
+
+    assert response.status_code == 200
+    assert set(response.data) == {"message", "total_tables"}
+    assert response.data["message"] == "Database is healthy"
+    assert response.data["total_tables"] > 0
+    broker.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_legacy_health_check_reports_database_failure(api_client, mocker):
+    mocker.patch.object(
+        connection.introspection, "table_names", side_effect=OperationalError("connection refused")
+    )
+
+    response = api_client.get(reverse("health-check"))
+
+    assert response.status_code == 500
+    assert response.data == {"message": "Database connection failed", "error": "connection refused"}
@@ -0,0 +1,63 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+def test_server_timing_header_reports_queries(create_user, authenticated_client):
+    create_user()
+    client = authenticated_client()
+
+    response = client.get(reverse("category-list-create-view"))
+
+    assert response.status_code == 200
+    timing = response["Server-Timing"]
+    assert timing.startswith("app;dur=")
+    assert 'db;dur=' in timing and "queries" in timing
+    assert "serializer;dur=" in timing
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exposes_route_histograms(create_user, authenticated_client, api_client, settings):
+    settings.METRICS_TOKEN = "scrape-secret"
+    create_user()
+    client = authenticated_client()
+    client.get(reverse("category-list-create-view"))
+    client.get(reverse("category-list-create-view"))
+    client.credentials()
+
+    api_client.credentials(HTTP_AUTHORIZATION="Bearer scrape-secret")
+    response = api_client.get(reverse("metrics"))
+
+    assert response.status_code == 200
+    body = response.content.decode()
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_total{route="/api/categories/",method="GET",status="200"} 2' in body
+    assert 'db_queries_per_request_count{route="/api/categories/",method="GET"} 2' in body
+    assert 'route="/api/metrics/"' not in body
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_requires_configured_token(api_client, settings):
+    settings.METRICS_TOKEN = "scrape-secret"
+
+    assert api_client.get(reverse("metrics")).status_code == 401
+
+    api_client.credentials(HTTP_AUTHORIZATION="Bearer scrape-secret")
+    assert api_client.get(reverse("metrics")).status_code == 200
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_is_staff_only_without_token(api_client, create_user, generate_token, settings):
+    settings.METRICS_TOKEN = None
+
+    assert api_client.get(reverse("metrics")).status_code == 403
+
+    create_user()
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_token('testuser')}")
+    assert api_client.get(reverse("metrics")).status_code == 403
+
+    staff = create_user(username="staff", email="staff@example.com")
+    staff.is_staff = True
+    staff.save()
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_token('staff')}")
+    assert api_client.get(reverse("metrics")).status_code == 200
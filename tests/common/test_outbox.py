@@ -0,0 +1,51 @@
+import pytest
+from celery import shared_task
+from django.db import transaction
+
+from common import outbox
+
+
+@shared_task
+def noop(value=None):
+    return value
+
+
+@pytest.fixture
+def apply_async(mocker):
+    return mocker.patch.object(noop, "apply_async")
+
+
+@pytest.mark.django_db
+def test_enqueue_waits_for_commit(apply_async, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks() as callbacks:
+        outbox.enqueue(noop, args=[1])
+
+    apply_async.assert_not_called()
+    callbacks[0]()
+    apply_async.assert_called_once()
+    assert apply_async.call_args.args[0] == [1]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_enqueue_is_never_published(apply_async):
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            outbox.enqueue(noop, args=[1])
+            raise RuntimeError
+
+    apply_async.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batch_publishes_together_over_one_producer(apply_async):
+    with outbox.batch():
+        outbox.enqueue(noop, args=[1])
+        outbox.enqueue(noop, args=[2], countdown=5)
+        with outbox.batch():
+            outbox.enqueue(noop, args=[3])
+        apply_async.assert_not_called()
+
+    assert [call.args[0] for call in apply_async.call_args_list] == [[1], [2], [3]]
+    producers = {id(call.kwargs["producer"]) for call in apply_async.call_args_list}
+    assert len(producers) == 1
+    assert apply_async.call_args_list[1].kwargs["countdown"] == 5
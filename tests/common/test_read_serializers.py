@@ -0,0 +1,76 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from budgets.models import Budget
+from budgets.serializers import BudgetSerializer, BudgetReadSerializer
+from reports.serializers import (
+    InterWalletTransactionReportSerializer,
+    InterWalletTransactionReportReadSerializer,
+    TransactionReportSerializer,
+    TransactionReportReadSerializer,
+)
+from transactions.models import Transaction
+from transactions.serializers import TransactionSerializer, TransactionReadSerializer
+from wallets.models import Wallet, InterWalletTransaction
+from wallets.serializers.wallet_serializer import WalletSerializer, WalletReadSerializer
+
+
+@pytest.fixture
+def rows(create_user, create_category, create_wallet):
+    user = create_user()
+    category = create_category(user=user)
+    wallet = create_wallet(user=user)
+    Wallet.objects.filter(pk=wallet.pk).update(balance=Decimal("1234.5"))
+    now = timezone.now()
+    for i, amount in enumerate(["10", "10.5", "0.01", "99999.99"]):
+        Transaction.objects.create(
+            user=user, wallet=wallet, category=category, type="debit", amount=Decimal(amount),
+            date_time=now - timedelta(seconds=i, microseconds=i * 1234),
+            description="" if i % 2 else f"note {i}",
+        )
+    Budget.objects.create(user=user, category=category, year=now.year, month=now.month, amount=Decimal("500"))
+    Budget.objects.create(user=user, category=category, year=2001, month=1, amount=Decimal("20.1"))
+    InterWalletTransaction.objects.create(
+        user=user, source_wallet=wallet, destination_wallet=create_wallet(name="cash", user=user),
+        amount=Decimal("7.5"), date_time=now,
+    )
+
+
+CONTRACTS = [
+    (TransactionSerializer, TransactionReadSerializer, lambda: Transaction.objects.order_by("-date_time")),
+    (WalletSerializer, WalletReadSerializer, lambda: Wallet.objects.order_by("created_at")),
+    (BudgetSerializer, BudgetReadSerializer, lambda: Budget.objects.all()),
+    (
+        TransactionReportSerializer, TransactionReportReadSerializer,
+        lambda: Transaction.objects.order_by("-date_time"),
+    ),
+    (
+        InterWalletTransactionReportSerializer, InterWalletTransactionReportReadSerializer,
+        lambda: InterWalletTransaction.objects.order_by("-date_time"),
+    ),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "serializer_class, read_serializer_class, queryset", CONTRACTS, ids=lambda c: getattr(c, "__name__", "")
+)
+def test_read_serializer_matches_model_serializer(rows, serializer_class, read_serializer_class, queryset):
+    expected = serializer_class(queryset(), many=True).data
+    actual = read_serializer_class(read_serializer_class.values(queryset())).data
+
+    assert actual == expected
+    assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
+
+
+@pytest.mark.django_db
+def test_budget_read_serializer_sums_spent_amount_in_one_query(rows, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        data = BudgetReadSerializer(BudgetReadSerializer.values(Budget.objects.all())).data
+
+    assert Decimal(data[0]["spent_amount"]) == Decimal("100020.50")
+    assert data[1]["spent_amount"] == "0.00"
@@ -0,0 +1,102 @@
+import io
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from common.parsers import ORJSONParser
+from common.renderers import ORJSONRenderer
+
+
+PAYLOADS = {
+    "decimal": {"total_income": Decimal("1234.50"), "zero": Decimal("0"), "float": 0.00},
+    "uuid": [uuid.UUID("12345678-1234-5678-1234-567812345678"), uuid.uuid4()],
+    "utc-datetime": datetime(2025, 1, 2, 3, 4, 5, 120, tzinfo=dt_timezone.utc),
+    "zoneinfo-utc": datetime(2025, 1, 2, 3, 4, 5, tzinfo=ZoneInfo("UTC")),
+    "zero-offset": datetime(2025, 1, 2, 3, 4, 5, tzinfo=ZoneInfo("Europe/London")),
+    "offset": datetime(2025, 6, 2, 3, 4, 5, 999999, tzinfo=ZoneInfo("Asia/Kolkata")),
+    "naive": datetime(2025, 1, 2, 3, 4, 5),
+    "date-time-timedelta": [date(2025, 1, 2), time(1, 2, 3, 4), timedelta(days=1, seconds=3)],
+    "unicode": {"name": "café ₹     \x01 \" \\ /", "emoji": "💸"},
+    "lazy": {"detail": gettext_lazy("Not found.")},
+    "containers": ReturnDict(
+        {"rows": ReturnList([OrderedDict(a=1), (1, 2), {3}], serializer=None), "none": None, "ok": True},
+        serializer=None,
+    ),
+    "non-str-keys": {1: "a", None: "b"},
+    "big-int": {"value": 2**70},
+    "nested-report": {
+        "total_income": Decimal("100.5"),
+        "category_wise_expenses": [{"category_name": "Food", "amount": 10.5, "percentage": Decimal("33.33")}],
+        "transactions": [{"id": str(uuid.uuid4()), "date_time": "2025-01-02T03:04:05Z"}],
+    },
+}
+
+
+@pytest.mark.parametrize("data", PAYLOADS.values(), ids=PAYLOADS.keys())
+def test_renderer_matches_drf_json_renderer(data):
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize(
+    "accepted_media_type, renderer_context",
+    [("application/json; indent=4", None), ("application/json", {"indent": 2}), (None, None)],
+)
+def test_renderer_matches_drf_when_indenting(accepted_media_type, renderer_context):
+    data = PAYLOADS["nested-report"]
+    assert ORJSONRenderer().render(data, accepted_media_type, renderer_context) == JSONRenderer().render(
+        data, accepted_media_type, renderer_context
+    )
+
+
+def test_renderer_returns_empty_body_for_none():
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_renderer_raises_like_drf_for_unserializable_data():
+    with pytest.raises(TypeError):
+        JSONRenderer().render({"value": object()})
+    with pytest.raises(TypeError):
+        ORJSONRenderer().render({"value": object()})
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"amount": "10.50", "nested": {"list": [1, 2.5, null, true]}}', '{"name": "café"}'.encode(), b"[18446744073709551616]"],
+)
+def test_parser_matches_drf_json_parser(body):
+    assert ORJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body))
+
+
+def test_parser_honours_request_encoding():
+    body = '{"name": "café"}'.encode("latin-1")
+    assert ORJSONParser().parse(io.BytesIO(body), parser_context={"encoding": "latin-1"}) == {"name": "café"}
+
+
+@pytest.mark.parametrize("body", [b'{"amount": ', b'{"amount": NaN}'])
+def test_parser_rejects_invalid_json_like_drf(body):
+    with pytest.raises(ParseError, match="JSON parse error"):
+        ORJSONParser().parse(io.BytesIO(body))
+
+
+@pytest.mark.django_db
+def test_api_renders_and_parses_with_orjson(authenticated_client, create_user):
+    user = create_user()
+    client = authenticated_client()
+
+    response = client.post(
+        reverse("wallet-list-create-view"), {"name": "Travel", "user": str(user.id)}, format="json"
+    )
+
+    assert response.status_code == 201
+    assert isinstance(response.accepted_renderer, ORJSONRenderer)
+    assert response.content == JSONRenderer().render(response.data)
@@ -0,0 +1,79 @@
+import pytest
+from django.core.management import call_command, CommandError
+from django.db.models import Sum
+from django.utils import timezone
+
+from account.models import User
+from categories.cache import get_category_versions
+from categories.models import Category
+from recurring_transactions.models import RecurringTransaction
+from transactions.models import Transaction
+from wallets.models import Wallet, InterWalletTransaction
+
+
+def _seed(**options):
+    call_command("seed_load", users=5, transactions=300, transfers=40, batch_size=100, verbosity=0, **options)
+
+
+def _total(queryset):
+    return queryset.aggregate(total=Sum("amount"))["total"] or 0
+
+
+@pytest.mark.django_db
+def test_seed_load_creates_consistent_wallet_balances():
+    _seed()
+
+    assert User.objects.filter(username__startswith="loaduser").count() == 5
+    assert Transaction.objects.count() >= 300
+    assert InterWalletTransaction.objects.count() == 40
+
+    for wallet in Wallet.objects.all():
+        transactions = Transaction.objects.filter(wallet=wallet)
+        expected = (
+            _total(transactions.filter(type="credit"))
+            - _total(transactions.filter(type="debit"))
+            + _total(InterWalletTransaction.objects.filter(destination_wallet=wallet))
+            - _total(InterWalletTransaction.objects.filter(source_wallet=wallet))
+        )
+        assert wallet.balance == expected
+        assert wallet.balance >= 0
+
+
+@pytest.mark.django_db
+def test_seed_load_is_deterministic_by_seed():
+    _seed(seed=7)
+    first = list(Transaction.objects.order_by("id").values_list("id", "amount", "date_time"))
+    User.objects.all().delete()
+
+    _seed(seed=7)
+    second = list(Transaction.objects.order_by("id").values_list("id", "amount", "date_time"))
+
+    assert first == second
+
+
+@pytest.mark.django_db
+def test_seed_load_refuses_existing_prefix():
+    _seed()
+    with pytest.raises(CommandError):
+        _seed()
+
+
+@pytest.mark.django_db
+def test_seed_load_reuses_predefined_categories():
+    predefined_version, _ = get_category_versions()
+    _seed()
+    assert get_category_versions()[0] != predefined_version
+    predefined = set(Category.objects.filter(is_predefined=True).values_list("id", flat=True))
+
+    _seed(prefix="again")
+
+    assert set(Category.objects.filter(is_predefined=True).values_list("id", flat=True)) == predefined
+    assert Transaction.objects.filter(user__username__startswith="againuser", category_id__in=predefined).exists()
+
+
+@pytest.mark.django_db
+def test_seed_load_schedules_recurring_transactions_after_today():
+    _seed()
+
+    assert RecurringTransaction.objects.exists()
+    assert not RecurringTransaction.objects.filter(next_run__lte=timezone.now()).exists()
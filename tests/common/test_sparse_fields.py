@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from budgets.models import Budget
+from recurring_transactions.models import RecurringTransaction
+from transactions.models import Transaction
+
+
+@pytest.fixture
+def client_with_data(create_user, create_category, create_wallet, authenticated_client):
+    user = create_user()
+    category = create_category(user=user)
+    wallet = create_wallet(user=user)
+    Transaction.objects.create(
+        user=user, wallet=wallet, category=category, type="debit", amount=Decimal("10"),
+        date_time=timezone.now(), description="lunch",
+    )
+    Budget.objects.create(user=user, category=category, year=2025, month=1, amount=Decimal("100"))
+    RecurringTransaction.objects.create(
+        user=user, wallet=wallet, category=category, type="debit", amount=Decimal("5"),
+        frequency="monthly", start_date=timezone.now(), next_run=timezone.now(), description="rent",
+    )
+    return authenticated_client()
+
+
+ENDPOINTS = {
+    "transaction-list-create": ("transactions_transaction", {"id", "amount"}),
+    "wallet-list-create-view": ("wallets_wallet", {"id", "name"}),
+    "budget-list-create": ("budgets_budget", {"id", "amount"}),
+    "recurring-transactions-list": ("recurring_transactions", {"id", "amount"}),
+    "category-list-create-view": (None, {"id", "name"}),  # served from the category cache
+}
+
+
+def _list_select(queries, table):
+    """The SELECT fetching the page rows, not the COUNT."""
+    return next(
+        query["sql"] for query in queries
+        if query["sql"].startswith("SELECT") and table in query["sql"].split("FROM", 1)[1] and "COUNT" not in query["sql"]
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ENDPOINTS)
+def test_fields_trim_output_and_columns(client_with_data, url_name):
+    table, fields = ENDPOINTS[url_name]
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client_with_data.get(reverse(url_name), {"fields": ",".join(fields)})
+
+    assert response.status_code == 200
+    assert response.data["items"]
+    assert all(set(item) == fields for item in response.data["items"])
+    if table:
+        assert '"description"' not in _list_select(ctx.captured_queries, table)
+        assert '"created_at"' not in _list_select(ctx.captured_queries, table).split("ORDER BY")[0]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ENDPOINTS)
+def test_all_fields_without_parameter(client_with_data, url_name):
+    _, fields = ENDPOINTS[url_name]
+    items = client_with_data.get(reverse(url_name)).data["items"]
+
+    assert fields < set(items[0])
+
+
+@pytest.mark.django_db
+def test_unknown_fields_rejected(client_with_data):
+    response = client_with_data.get(reverse("transaction-list-create"), {"fields": "id,password,secret"})
+
+    assert response.status_code == 400
+    assert response.data["details"]["fields"] == "Unknown fields: password, secret."
+
+
+@pytest.mark.django_db
+def test_budget_spent_amount_only_summed_when_asked(client_with_data):
+    with CaptureQueriesContext(connection) as ctx:
+        client_with_data.get(reverse("budget-list-create"), {"fields": "id,amount"})
+    assert "SUM" not in _list_select(ctx.captured_queries, "budgets_budget")
+
+    items = client_with_data.get(reverse("budget-list-create"), {"fields": "spent_amount"}).data["items"]
+    assert items == [{"spent_amount": "0.00"}]
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from celery import shared_task
+from kombu import Connection
+
+from common import task_metrics
+from common.metrics import registry
+from common.tasks import sample_queue_depths
+
+
+@shared_task
+def probe(fail=False):
+    if fail:
+        raise ValueError("boom")
+    return True
+
+
+def test_task_duration_and_failures_are_recorded():
+    probe.apply()
+    probe.apply(kwargs={"fail": True})
+
+    body = registry.render()
+    name = "tests.common.test_task_metrics.probe"
+    assert f'celery_task_duration_seconds_count{{task="{name}",state="SUCCESS"}} 1' in body
+    assert f'celery_task_duration_seconds_count{{task="{name}",state="FAILURE"}} 1' in body
+    assert f'celery_task_failures_total{{task="{name}",exception="ValueError"}} 1' in body
+
+
+def test_queue_wait_is_measured_from_the_publish_header():
+    headers = {}
+    task_metrics.stamp_enqueue_time(headers=headers)
+    headers[task_metrics.ENQUEUED_AT_HEADER] -= 2
+    request = SimpleNamespace(eta=None, delivery_info={"routing_key": "exports"}, **headers)
+    task = SimpleNamespace(name="reports.export", request=request)
+
+    task_metrics.start_task_timer(task_id="abc", task=task)
+    task_metrics.stop_task_timer(task_id="abc", task=task, state="SUCCESS")
+
+    body = registry.render()
+    assert 'celery_task_queue_wait_seconds_bucket{task="reports.export",queue="exports",le="1"}' not in body
+    assert 'celery_task_queue_wait_seconds_bucket{task="reports.export",queue="exports",le="5"} 1' in body
+
+
+def test_sample_queue_depths_sets_gauges(mocker):
+    connection = Connection("memory://")
+    queue = connection.SimpleQueue("celery")
+    queue.put({"n": 1})
+    queue.put({"n": 2})
+    mocker.patch("celery.app.base.Celery.connection_for_read", return_value=connection)
+
+    depths = sample_queue_depths.apply().get()
+    assert depths["celery"] == 2
+    assert depths["exports"] == 0
+    assert 'celery_queue_depth{queue="celery"} 2' in registry.render()
+    queue.clear()
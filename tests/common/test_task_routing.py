@@ -0,0 +1,28 @@
+import pytest
+from django.conf import settings
+
+from expense_tracker.celery import app
+
+
+@pytest.mark.parametrize(
+    "task_name, queue",
+    [
+        ("budgets.tasks.evaluate_budgets", "budgets"),
+        ("account.tasks.send_reset_password_email", "notifications"),
+        ("recurring_transactions.tasks.process_recurring_transactions", "recurring"),
+        ("reports.tasks.send_transaction_history_email", "exports"),
+        ("account.tasks.soft_delete_user_related_objects", "maintenance"),
+        ("common.tasks.sample_queue_depths", "celery"),
+    ],
+)
+def test_tasks_are_routed_to_their_workload_queue(task_name, queue):
+    route = app.amqp.router.route({}, task_name)
+    assert route["queue"].name == queue
+
+
+def test_routes_point_at_registered_tasks_and_declared_queues():
+    app.loader.import_default_modules()
+    queues = {queue.name for queue in settings.CELERY_TASK_QUEUES}
+    for task_name, options in settings.CELERY_TASK_ROUTES.items():
+        assert task_name in app.tasks
+        assert options["queue"] in queues
@@ -5,6 +5,26 @@ from rest_framework_simplejwt.tokens import AccessToken
 from categories.models import Category
 from django.utils.text import slugify
 
+pytest_plugins = ["tests.fixtures.smtp"]
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached lookups never leak between tests."""
+    import time
+    from django.core.cache import cache
+    from common.health import legacy_health, readiness
+    from common.metrics import registry
+
+    cache.clear()
+    registry.pending.clear()  # buffered metrics would be flushed into the next test
+    registry.known_series.clear()
+    registry.last_flush = time.monotonic()  # no timed flush touching the cache mid-test
+    readiness.clear()
+    legacy_health.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     """Returns a Django API test client"""
@@ -96,4 +116,4 @@ def create_wallet(db, create_user):
             user=user,
         )
         return wallet
-    return _create_wallet
\ No newline at end of file
+    return _create_wallet
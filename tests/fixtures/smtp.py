@@ -0,0 +1,86 @@
+import socket
+import socketserver
+import threading
+
+import pytest
+
+from common.email_backend import connection_pool
+
+
+class _SMTPStubHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue, enough for smtplib to deliver plain messages."""
+
+    def handle(self):
+        self.server.sessions += 1
+        self.server.open_sockets.append(self.connection)
+        self._reply("220 localhost SMTP stub")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self._reply("250 localhost")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                data = b""
+                while not data.endswith(b"\r\n.\r\n"):
+                    chunk = self.rfile.readline()
+                    if not chunk:
+                        return
+                    data += chunk
+                self.server.messages.append(data)
+                if self.server.drop_after_data:
+                    break  # accepted, but the session dies before the reply
+                self._reply("250 OK queued")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                break
+            else:
+                self._reply("502 Command not implemented")
+
+    def _reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+
+class SMTPStubServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPStubHandler)
+        self.sessions = 0
+        self.messages = []
+        self.open_sockets = []
+        self.drop_after_data = False
+
+    def drop_connections(self):
+        """Simulate the server closing every open session."""
+        for sock in self.open_sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.open_sockets = []
+
+
+@pytest.fixture
+def smtp_server(settings):
+    """Run a local SMTP stand-in and point the email settings at it."""
+    server = SMTPStubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    settings.EMAIL_HOST, settings.EMAIL_PORT = server.server_address
+    settings.EMAIL_HOST_USER = ""
+    settings.EMAIL_HOST_PASSWORD = ""
+    settings.EMAIL_USE_TLS = False
+    settings.DEFAULT_FROM_EMAIL = "noreply@example.com"
+    settings.EMAIL_BACKEND = "common.email_backend.PooledSMTPEmailBackend"
+    yield server
+
+    connection_pool.close_all()
+    server.shutdown()
+    server.server_close()
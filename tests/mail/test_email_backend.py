@@ -0,0 +1,68 @@
+import smtplib
+
+import pytest
+from django.core.mail import send_mail
+
+from common.mail import send_email
+
+
+def test_connection_reused_across_emails(smtp_server):
+    """Consecutive emails should share one pooled SMTP session"""
+    for i in range(3):
+        send_email(f"Subject {i}", "Body", ["user@example.com"])
+
+    assert len(smtp_server.messages) == 3
+    assert smtp_server.sessions == 1
+
+
+def test_reconnect_after_server_disconnect(smtp_server):
+    """A pooled connection dropped by the server is replaced transparently"""
+    send_mail("First", "Body", None, ["user@example.com"])
+    smtp_server.drop_connections()
+
+    sent = send_mail("Second", "Body", None, ["user@example.com"])
+
+    assert sent == 1
+    assert len(smtp_server.messages) == 2
+    assert smtp_server.sessions == 2
+
+
+def test_health_check_discards_dead_connection(smtp_server, settings):
+    """Idle connections failing NOOP are dropped before reuse"""
+    settings.EMAIL_POOL_HEALTH_CHECK_INTERVAL = 0
+
+    send_mail("First", "Body", None, ["user@example.com"])
+    smtp_server.drop_connections()
+    send_mail("Second", "Body", None, ["user@example.com"])
+
+    assert len(smtp_server.messages) == 2
+    assert smtp_server.sessions == 2
+
+
+def test_pool_size_limits_idle_connections(smtp_server, settings):
+    """Connections beyond the pool size are closed instead of kept idle"""
+    from django.core.mail import get_connection
+    from common.email_backend import connection_pool
+
+    settings.EMAIL_POOL_SIZE = 1
+    first, second = get_connection(), get_connection()
+    first.open()
+    second.open()
+    first.close()
+    second.close()
+
+    key = first.pool_key
+    assert len(connection_pool._idle[key]) == 1
+    assert smtp_server.sessions == 2
+
+
+def test_no_resend_after_data_accepted(smtp_server):
+    """A session dying after the server took the message is not retried, it would deliver twice"""
+    send_mail("First", "Body", None, ["user@example.com"])
+    smtp_server.drop_after_data = True
+
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        send_mail("Second", "Body", None, ["user@example.com"])
+
+    assert len(smtp_server.messages) == 2
+    assert smtp_server.sessions == 1
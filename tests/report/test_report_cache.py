@@ -0,0 +1,68 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+REPORT_PARAMS = {"start_date": "2000-01-01", "end_date": "2100-01-01"}
+
+
+def _transaction_queries(queries):
+    return [q for q in queries if "transactions_transaction" in q["sql"]]
+
+
+@pytest.fixture
+def report_setup(create_user, create_category, create_wallet, authenticated_client, mocker):
+    mocker.patch("budgets.tasks.evaluate_budgets.apply_async")
+    user = create_user()
+    category = create_category(user=user)
+    wallet = create_wallet(user=user)
+    client = authenticated_client()
+
+    def add_transaction(amount):
+        response = client.post(
+            reverse("transaction-list-create"),
+            {
+                "user": user.id,
+                "category": category.id,
+                "wallet": wallet.id,
+                "amount": amount,
+                "date_time": "2025-01-15T10:00:00Z",
+            },
+        )
+        assert response.status_code == 201
+        return response.data["id"]
+
+    return client, add_transaction
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["transaction-report", "transaction-trends"])
+def test_repeated_report_served_from_cache(report_setup, url_name):
+    """A repeated report request should not query transactions again"""
+    client, add_transaction = report_setup
+    add_transaction(100)
+    url = reverse(url_name)
+
+    first = client.get(url, REPORT_PARAMS)
+    with CaptureQueriesContext(connection) as ctx:
+        second = client.get(url, REPORT_PARAMS)
+
+    assert second.status_code == 200
+    assert second.data == first.data
+    assert _transaction_queries(ctx.captured_queries) == []
+
+
+@pytest.mark.django_db
+def test_report_cache_invalidated_by_transaction_changes(report_setup):
+    """Creating or deleting a transaction bumps the data version of the user"""
+    client, add_transaction = report_setup
+    url = reverse("transaction-report")
+    transaction_id = add_transaction(100)
+    assert float(client.get(url, REPORT_PARAMS).data["total_expense"]) == 100
+
+    add_transaction(50)
+    assert float(client.get(url, REPORT_PARAMS).data["total_expense"]) == 150
+
+    client.delete(reverse("transaction-detail", kwargs={"id": transaction_id}))
+    assert float(client.get(url, REPORT_PARAMS).data["total_expense"]) == 50
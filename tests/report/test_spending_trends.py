@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from transactions.models import Transaction
+
+
+@pytest.fixture
+def trends_data(create_user, create_category, create_wallet):
+    """Two expenses in January, one income in March 2025"""
+    user = create_user()
+    food = create_category(name="Food", user=user)
+    salary = create_category(name="Salary", user=user, type="credit")
+    wallet = create_wallet(user=user)
+
+    for category, type, amount, day in [
+        (food, "debit", 100, datetime(2025, 1, 5, tzinfo=timezone.utc)),
+        (food, "debit", 50, datetime(2025, 1, 20, tzinfo=timezone.utc)),
+        (salary, "credit", 1000, datetime(2025, 3, 1, tzinfo=timezone.utc)),
+    ]:
+        Transaction.objects.create(
+            user=user, wallet=wallet, category=category, type=type,
+            amount=amount, date_time=day,
+        )
+    return user
+
+
+@pytest.mark.django_db
+def test_monthly_series_is_dense(trends_data, authenticated_client):
+    """Months without transactions are filled with zero totals"""
+    client = authenticated_client()
+    params = {"start_date": "2025-01-01", "end_date": "2025-04-30", "granularity": "month"}
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("transaction-trends"), params)
+
+    assert response.status_code == 200
+    assert response.data["series"] == [
+        {"period": "2025-01-01", "income": 0.0, "expense": 150.0},
+        {"period": "2025-02-01", "income": 0.0, "expense": 0.0},
+        {"period": "2025-03-01", "income": 1000.0, "expense": 0.0},
+        {"period": "2025-04-01", "income": 0.0, "expense": 0.0},
+    ]
+    assert response.data["total_expense"] == 150.0
+    assert response.data["expense"][0]["category_name"] == "Food"
+    transaction_queries = [
+        q for q in ctx.captured_queries if "transactions_transaction" in q["sql"]
+    ]
+    assert len(transaction_queries) == 1
+
+
+@pytest.mark.django_db
+def test_weekly_series_by_category(trends_data, authenticated_client):
+    """Weekly buckets start on Monday and can be split per category"""
+    client = authenticated_client()
+    params = {
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-31",
+        "granularity": "week",
+        "by_category": "true",
+    }
+
+    response = client.get(reverse("transaction-trends"), params)
+
+    series = response.data["series"]
+    assert series[0]["period"] == "2024-12-30"
+    assert len(series) == 5
+    assert series[0]["expense_categories"] == [{"category_name": "Food", "amount": 100.0}]
+    assert series[1]["expense_categories"] == []
+
+
+@pytest.mark.django_db
+def test_invalid_granularity(trends_data, authenticated_client):
+    client = authenticated_client()
+    params = {"start_date": "2025-01-01", "end_date": "2025-01-31", "granularity": "year"}
+
+    response = client.get(reverse("transaction-trends"), params)
+
+    assert response.status_code == 400
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone as dj_timezone
+
+from archive.archiver import archive_old_rows
+from archive.models import ArchivedTransaction
+from budgets.models import Budget
+from reports.tasks import build_user_report_snapshots
+from transactions.models import Transaction
+
+
+PARAMS = {"start_date": "2025-01-01", "end_date": "2025-02-01"}
+
+
+@pytest.fixture
+def staff_client(create_user, authenticated_client):
+    staff = create_user(username="staffuser", email="staff@example.com")
+    staff.is_staff = True
+    staff.save()
+    return authenticated_client(username="staffuser")
+
+
+@pytest.fixture
+def users_with_data(create_user, create_category, create_wallet):
+    users = []
+    for i in range(3):
+        user = create_user(username=f"normaluser{i}", email=f"user{i}@example.com")
+        category = create_category(name=f"Food {i}", user=user)
+        wallet = create_wallet(user=user)
+        Transaction.objects.create(
+            user=user, wallet=wallet, category=category, type="debit",
+            amount=100 * (i + 1), date_time=datetime(2025, 1, 10, tzinfo=timezone.utc),
+        )
+        Budget.objects.create(user=user, category=category, year=2025, month=1, amount=150)
+        users.append(user)
+    return sorted(users, key=lambda user: user.id)
+
+
+@pytest.mark.django_db
+def test_staff_report_totals_and_keyset_pages(staff_client, users_with_data):
+    """Users are returned in id order, two per page, with totals and budget breaches"""
+    url = reverse("staff-user-report")
+
+    first = staff_client.get(url, {**PARAMS, "limit": 2})
+    second = staff_client.get(url, {**PARAMS, "limit": 2, "after": first.data["next_cursor"]})
+
+    assert first.status_code == 200
+    items = first.data["items"] + second.data["items"]
+    assert [item["user_id"] for item in items] == [user.id for user in users_with_data]
+    assert second.data["next_cursor"] is None
+
+    by_user = {item["username"]: item for item in items}
+    assert float(by_user["normaluser0"]["total_expense"]) == 100
+    assert by_user["normaluser0"]["budget_breaches"] == 0
+    assert by_user["normaluser2"]["budget_breaches"] == 1
+    assert by_user["normaluser2"]["top_categories"][0]["category_name"] == "Food 2"
+
+
+@pytest.mark.django_db
+def test_staff_report_query_count_independent_of_users(
+    staff_client, users_with_data, django_assert_max_num_queries
+):
+    with django_assert_max_num_queries(6):
+        response = staff_client.get(reverse("staff-user-report"), PARAMS)
+    assert len(response.data["items"]) == 3
+
+
+@pytest.mark.django_db
+def test_staff_report_includes_archived_transactions(staff_client, create_user, create_category, create_wallet):
+    user = create_user(username="normaluser", email="user@example.com")
+    category = create_category(name="Rent", user=user)
+    wallet = create_wallet(user=user)
+    moment = dj_timezone.now() - timedelta(days=3 * 365)
+    for amount in (100, 80):
+        Transaction.objects.create(
+            user=user, wallet=wallet, category=category, type="debit", amount=amount, date_time=moment
+        )
+    Transaction.objects.create(
+        user=user, wallet=wallet, category=category, type="debit", amount=50, date_time=dj_timezone.now()
+    )
+    Budget.objects.create(user=user, category=category, year=moment.year, month=moment.month, amount=150)
+    archive_old_rows()
+    assert ArchivedTransaction.objects.count() == 2
+
+    response = staff_client.get(
+        reverse("staff-user-report"),
+        {"start_date": str((moment - timedelta(days=1)).date()), "end_date": str(dj_timezone.now().date() + timedelta(days=1))},
+    )
+
+    item, = response.data["items"]
+    assert float(item["total_expense"]) == 230
+    assert item["top_categories"] == [{"category_name": "Rent", "amount": "230.00"}]
+    assert item["budget_breaches"] == 1
+
+
+@pytest.mark.django_db
+def test_staff_report_forbidden_for_normal_user(create_user, authenticated_client):
+    create_user()
+    client = authenticated_client()
+
+    response = client.get(reverse("staff-user-report"), PARAMS)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_staff_report_served_from_snapshot(staff_client, users_with_data):
+    build_user_report_snapshots()
+
+    response = staff_client.get(reverse("staff-user-report"), {"snapshot": "true"})
+
+    assert response.status_code == 200
+    assert len(response.data["items"]) == 3
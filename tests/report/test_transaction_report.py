@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from transactions.models import Transaction
+from wallets.models import InterWalletTransaction
+
+
+REPORT_PARAMS = {"start_date": "2000-01-01", "end_date": "2100-01-01"}
+
+
+@pytest.fixture
+def report_data(create_user, create_category, create_wallet, authenticated_client):
+    user = create_user()
+    category = create_category(user=user)
+    savings = create_wallet(name="Savings", user=user)
+    cash = create_wallet(name="Cash", user=user)
+    client = authenticated_client()
+
+    def add_rows(count):
+        now = timezone.now()
+        for _ in range(count):
+            for kind in ("credit", "debit"):
+                Transaction.objects.create(
+                    user=user, wallet=cash, category=category, type=kind, amount=Decimal("10"), date_time=now
+                )
+            InterWalletTransaction.objects.create(
+                user=user, source_wallet=savings, destination_wallet=cash, amount=Decimal("5"), date_time=now
+            )
+
+    def report_queries():
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(reverse("transaction-report"), REPORT_PARAMS)
+        assert response.status_code == 200
+        return response, len(ctx.captured_queries)
+
+    return add_rows, report_queries
+
+
+@pytest.mark.django_db
+def test_report_query_count_does_not_depend_on_rows(report_data):
+    """Category and wallet names come from joins, not a query per row"""
+    add_rows, report_queries = report_data
+    add_rows(1)
+    _, few = report_queries()
+
+    add_rows(10)
+    response, many = report_queries()
+
+    assert many == few
+    assert len(response.data["interwallet_transactions"]) == 11
+    assert len(response.data["transactions"]["debit_transactions"]) == 11
+
+
+@pytest.mark.django_db
+def test_report_rows_carry_names(report_data):
+    add_rows, report_queries = report_data
+    add_rows(1)
+
+    response, _ = report_queries()
+
+    transfer = response.data["interwallet_transactions"][0]
+    assert (transfer["source_wallet"], transfer["destination_wallet"], transfer["amount"]) == ("savings", "cash", "5.00")
+    credit = response.data["transactions"]["credit_transactions"][0]
+    assert (credit["wallet"], credit["amount"]) == ("cash", "10.00")
+    assert credit["category_name"]
@@ -0,0 +1,140 @@
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from django.core.management import call_command
+from django.db import connection
+
+from transactions import partitions
+from transactions.models import Transaction
+from transactions.tasks import create_transaction_partitions
+
+
+requires_postgresql = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="partitioning needs PostgreSQL, run with TEST_DATABASE=postgresql"
+)
+
+
+def test_month_starts_cover_both_ends_across_years():
+    months = list(partitions.month_starts(date(2024, 11, 20), date(2025, 2, 3)))
+
+    assert months == [date(2024, 11, 1), date(2024, 12, 1), date(2025, 1, 1), date(2025, 2, 1)]
+    assert partitions.partition_name(months[0]) == "transactions_transaction_p202411"
+
+
+@pytest.mark.skipif(connection.vendor == "postgresql", reason="checks the fallback of other databases")
+@pytest.mark.django_db
+def test_partitioning_is_a_noop_without_postgresql():
+    out = StringIO()
+    call_command("partition_transactions", convert=True, stdout=out)
+
+    assert "keeping the plain transactions table" in out.getvalue()
+    assert create_transaction_partitions() == []
+
+
+def _month(months_from_now):
+    return date.today().replace(day=1) + relativedelta(months=months_from_now)
+
+
+@pytest.fixture
+def dated_transactions(create_user, create_category, create_wallet):
+    """One transaction in each of a few months around today, the oldest 14 months back."""
+    user = create_user()
+    category = create_category(user=user)
+    wallet = create_wallet(user=user)
+    return {
+        month: Transaction.objects.create(
+            user=user, wallet=wallet, category=category, amount=Decimal("10"),
+            date_time=datetime(month.year, month.month, 15, 12, tzinfo=dt_timezone.utc),
+        )
+        for month in [_month(-14), _month(-1), _month(0), _month(2)]
+    }
+
+
+def _partition_of_rows():
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT id, tableoid::regclass::text FROM "{partitions.TABLE}"')
+        return {row_id: partition for row_id, partition in cursor.fetchall()}
+
+
+def _constraints():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT contype, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass",
+            [partitions.TABLE],
+        )
+        return cursor.fetchall()
+
+
+def _indexes():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT indexdef FROM pg_indexes WHERE tablename = %s", [partitions.TABLE])
+        return [row[0] for row in cursor.fetchall()]
+
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_convert_moves_every_row_into_its_month(dated_transactions):
+    assert partitions.convert_to_partitioned(months_ahead=3)
+
+    assert partitions.is_partitioned()
+    assert Transaction.objects.count() == len(dated_transactions)
+    assert _partition_of_rows() == {
+        transaction.id: partitions.partition_name(month) for month, transaction in dated_transactions.items()
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT count(*) FROM "{partitions.UNPARTITIONED_TABLE}"')
+        assert cursor.fetchone()[0] == len(dated_transactions)
+
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_rows_past_the_last_partition_move_out_of_default(dated_transactions):
+    partitions.convert_to_partitioned(months_ahead=3)
+    transaction = dated_transactions[_month(0)]
+    later = Transaction.objects.create(
+        user_id=transaction.user_id, wallet_id=transaction.wallet_id, category_id=transaction.category_id,
+        amount=Decimal("5"), date_time=datetime(_month(6).year, _month(6).month, 1, tzinfo=dt_timezone.utc),
+    )
+    assert _partition_of_rows()[later.id] == partitions.DEFAULT_PARTITION
+
+    created = partitions.create_future_partitions(months_ahead=6)
+
+    assert created == [partitions.partition_name(_month(4)), partitions.partition_name(_month(5)),
+                       partitions.partition_name(_month(6))]
+    assert _partition_of_rows()[later.id] == partitions.partition_name(_month(6))
+
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_convert_keeps_keys_and_indexes(dated_transactions):
+    partitions.convert_to_partitioned(months_ahead=3)
+
+    constraints = _constraints()
+    assert ("p", "PRIMARY KEY (id, date_time)") in constraints
+    foreign_keys = sorted(definition.split(")")[0] for contype, definition in constraints if contype == "f")
+    assert foreign_keys == ["FOREIGN KEY (category_id", "FOREIGN KEY (user_id", "FOREIGN KEY (wallet_id"]
+    indexes = _indexes()
+    for columns in ["(user_id, date_time)", "(wallet_id)", "(category_id)", "(date_time)"]:
+        assert any(index.endswith(f"USING btree {columns}") for index in indexes), columns
+
+    transaction = Transaction.objects.get(id=dated_transactions[_month(-1)].id)
+    transaction.amount = Decimal("12")
+    transaction.save()
+    assert Transaction.objects.get(id=transaction.id).amount == Decimal("12")
+
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_converting_twice_changes_nothing(dated_transactions):
+    call_command("partition_transactions", convert=True, months_ahead=3, stdout=StringIO())
+    rows, constraints, indexes = _partition_of_rows(), _constraints(), _indexes()
+
+    assert partitions.convert_to_partitioned(months_ahead=3) is False
+    out = StringIO()
+    call_command("partition_transactions", convert=True, months_ahead=3, stdout=out)
+
+    assert "none needed" in out.getvalue()
+    assert (_partition_of_rows(), _constraints(), _indexes()) == (rows, constraints, indexes)
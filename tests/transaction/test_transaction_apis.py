@@ -2,11 +2,11 @@ import pytest
 from django.urls import reverse
 from unittest.mock import patch
 from unittest.mock import Mock
-from uuid import UUID
 
 @pytest.mark.django_db
 def test_create_transaction(
-    create_user, create_category, create_wallet, authenticated_client, mocker
+    create_user, create_category, create_wallet, authenticated_client, mocker,
+    django_capture_on_commit_callbacks,
 ):
     """Test creating a transaction while mocking the Celery task"""
 
@@ -25,9 +25,10 @@ def test_create_transaction(
     }
 
     # Mock Celery Task
-    mock_task = mocker.patch("transactions.tasks.handle_transaction.delay")
+    mock_task = mocker.patch("budgets.tasks.evaluate_budgets.apply_async")
 
-    response = client.post(url, payload)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(url, payload)
 
     assert response.status_code == 201
     assert response.data["amount"] == "100.00"
@@ -39,7 +40,7 @@ def test_create_transaction(
     current_balance = wallet.balance
     assert current_balance == initial_balance - float(response.data["amount"])
     
-    mock_task.assert_called_once_with(UUID(response.data["id"]))
+    mock_task.assert_called_once()
     
 @pytest.mark.django_db
 def test_create_transaction_fail(
@@ -63,7 +64,7 @@ def test_create_transaction_fail(
     }
 
     # Mock Celery Task
-    mock_task = mocker.patch("transactions.tasks.handle_transaction.delay")
+    mock_task = mocker.patch("budgets.tasks.evaluate_budgets.apply_async")
 
     response = client.post(url, payload)
 
@@ -190,45 +190,49 @@ def test_change_password(authenticated_client, create_user):
     assert response.status_code == 200  # Password updated successfully
 
 @pytest.mark.django_db
-def test_delete_user(authenticated_client, create_user, mocker):
+def test_delete_user(authenticated_client, create_user, mocker, django_capture_on_commit_callbacks):
     """Test deleting a user"""
     user = create_user()
     client = authenticated_client()
 
-    mock_delete_task = mocker.patch("account.tasks.soft_delete_user_related_objects.delay", Mock())
+    mock_delete_task = mocker.patch("account.tasks.soft_delete_user_related_objects.apply_async", Mock())
 
     user_id = user.id
-    response = client.delete(
-        f"/api/users/{user_id}/", {"password": "testpassword12@"}
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.delete(
+            f"/api/users/{user_id}/", {"password": "testpassword12@"}
+        )
     assert response.status_code == 204  # User deleted successfully
 
-    mock_delete_task.assert_called_once_with(user.id)
+    mock_delete_task.assert_called_once()
+    assert mock_delete_task.call_args.args[0] == [user.id]
     user.refresh_from_db()
     assert not user.is_active
 
 
 @pytest.mark.django_db
-def test_password_reset_request_success(mocker, api_client, create_user):
+def test_password_reset_request_success(mocker, api_client, create_user, django_capture_on_commit_callbacks):
     """Test successful password reset request with email sent via Celery (mocked)"""
     user = create_user()
 
     # Mock the email-sending Celery task
-    mock_task = mocker.patch("account.tasks.send_reset_password_email.delay")
+    mock_task = mocker.patch("account.tasks.send_reset_password_email.apply_async")
 
     # Mock Redis cache to bypass storing/reset link check
     mock_cache_get = mocker.patch("django.core.cache.cache.get", return_value=None)
     mock_cache_set = mocker.patch("django.core.cache.cache.set")
 
-    response = api_client.post(
-        "/api/auth/password-reset/", {"email": user.email}
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            "/api/auth/password-reset/", {"email": user.email}
+        )
 
     assert response.status_code == 200
     assert response.data["message"] == "Password reset email sent."
 
     # Ensure email sending task was called
-    mock_task.assert_called_once_with(user.email, mocker.ANY)
+    mock_task.assert_called_once()
+    assert mock_task.call_args.args[0] == [user.email, mocker.ANY]
 
     # Ensure Redis cache was checked and set
     mock_cache_get.assert_called_once_with(f"password_reset:{user.id}")
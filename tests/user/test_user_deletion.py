@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+
+from account.models import ActiveAccessToken
+from account.tasks import soft_delete_user_related_objects
+from transactions.models import Transaction
+
+
+@pytest.fixture
+def heavy_user(create_user, create_category, create_wallet, generate_token):
+    user = create_user()
+    generate_token()
+    category = create_category(user=user)
+    wallet = create_wallet(user=user)
+    Transaction.objects.bulk_create(
+        Transaction(user=user, wallet=wallet, category=category, amount=Decimal("1.00"))
+        for _ in range(7)
+    )
+    return user
+
+
+@pytest.mark.django_db
+def test_deletion_runs_in_batches_and_resumes(heavy_user, settings, mocker):
+    settings.USER_DELETION_BATCH_SIZE = 2
+    settings.USER_DELETION_MAX_BATCHES = 4
+    requeue = mocker.patch("account.tasks.enqueue")
+
+    progress = soft_delete_user_related_objects(heavy_user.id)
+
+    # One empty batch of recurring transactions and three batches of two
+    # transactions, then the task hands over to its next run.
+    assert progress["transactions"] == 6
+    assert Transaction.objects.filter(user=heavy_user, is_deleted=False).count() == 1
+    assert not ActiveAccessToken.objects.filter(user=heavy_user).exists()
+    requeue.assert_called_once_with(
+        soft_delete_user_related_objects, args=[heavy_user.id], kwargs={"progress": progress}
+    )
+
+    settings.USER_DELETION_MAX_BATCHES = 10
+    result = soft_delete_user_related_objects(heavy_user.id, progress=progress)
+
+    assert result == f"User {heavy_user.id} and related objects soft deleted."
+    assert not Transaction.objects.filter(user=heavy_user, is_deleted=False).exists()
+    assert not heavy_user.wallets.filter(is_deleted=False).exists()
+    assert not heavy_user.categories.filter(is_deleted=False).exists()
+    assert progress["transactions"] == 7
+
+
+@pytest.mark.django_db
+def test_deletion_is_idempotent(heavy_user):
+    soft_delete_user_related_objects(heavy_user.id)
+    result = soft_delete_user_related_objects(heavy_user.id)
+
+    assert result == f"User {heavy_user.id} and related objects soft deleted."
+    assert Transaction.objects.filter(user=heavy_user, is_deleted=True).count() == 7
@@ -0,0 +1,191 @@
+import threading
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+import pytest
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.urls import reverse
+from django.utils import timezone
+
+from transactions.models import Transaction
+from wallets import balances
+from wallets.models import InterWalletTransaction, WalletBalanceSnapshot
+from wallets.tasks import snapshot_wallet_balances
+
+
+START = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def history(create_user, create_category, create_wallet):
+    """Two wallets with a credit, a debit and a transfer on each of 60 days, balances kept in step."""
+    user = create_user()
+    category = create_category(user=user)
+    main, savings = create_wallet(name="main", user=user), create_wallet(name="savings", user=user)
+
+    for day in range(60):
+        moment = START + timedelta(days=day, hours=day % 24)
+        Transaction.objects.create(
+            user=user, wallet=main, category=category, type="credit", amount=Decimal("100"), date_time=moment
+        )
+        Transaction.objects.create(
+            user=user, wallet=main, category=category, type="debit", amount=Decimal(day), date_time=moment
+        )
+        InterWalletTransaction.objects.create(
+            user=user, source_wallet=main, destination_wallet=savings, amount=Decimal("10.5"), date_time=moment
+        )
+    main.balance = Decimal(60 * 100 - sum(range(60))) - Decimal("630")
+    savings.balance = Decimal("630")
+    main.save()
+    savings.save()
+    return user, main, savings
+
+
+def _replayed(wallet, moment):
+    """Balance from every movement before moment, the slow way."""
+    def total(queryset):
+        return queryset.filter(date_time__lt=moment, is_deleted=False).aggregate(total=Sum("amount"))["total"] or 0
+
+    transactions = Transaction.objects.filter(wallet=wallet)
+    return (
+        total(transactions.filter(type="credit"))
+        - total(transactions.filter(type="debit"))
+        + total(InterWalletTransaction.objects.filter(destination_wallet=wallet))
+        - total(InterWalletTransaction.objects.filter(source_wallet=wallet))
+    )
+
+
+MOMENTS = [START - timedelta(days=1), START + timedelta(days=9, hours=3), START + timedelta(days=31), START + timedelta(days=90)]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("snapshot_days", [[], [10], [0, 15, 30, 45]])
+def test_balance_as_of_matches_replay(history, snapshot_days):
+    _, main, savings = history
+    for day in snapshot_days:
+        balances.take_snapshots(START + timedelta(days=day), "daily")
+
+    for wallet in (main, savings):
+        for moment in MOMENTS:
+            assert balances.balance_as_of(wallet, moment) == _replayed(wallet, moment), (wallet.name, moment)
+
+
+@pytest.mark.django_db
+def test_balance_as_of_reads_only_movements_since_snapshot(history, django_assert_num_queries, mocker):
+    _, main, _ = history
+    balances.take_snapshots(START + timedelta(days=30), "monthly")
+    movement_total = mocker.spy(balances, "movement_total")
+
+    with django_assert_num_queries(4):  # two snapshot lookups, transactions and transfers
+        balances.balance_as_of(main, START + timedelta(days=32))
+
+    movement_total.assert_called_once_with(main.id, START + timedelta(days=30), START + timedelta(days=32))
+
+
+@pytest.mark.django_db
+def test_backdated_changes_adjust_later_snapshots(history, authenticated_client, create_category, mocker):
+    mocker.patch("budgets.tasks.evaluate_budgets.apply_async")
+    user, main, savings = history
+    balances.take_snapshots(START + timedelta(days=30), "daily")
+    client = authenticated_client()
+
+    response = client.post(
+        reverse("transaction-list-create"),
+        {
+            "user": user.id, "category": create_category(name="Salary", user=user, type="credit").id, "wallet": main.id,
+            "type": "credit", "amount": "25.00", "date_time": (START + timedelta(days=5)).isoformat(),
+        },
+    )
+    assert response.status_code == 201
+    transfer = InterWalletTransaction.objects.first()
+    response = client.patch(
+        reverse("interwallet-transaction-retrieve-update-delete", kwargs={"pk": transfer.id}),
+        {"date_time": (START + timedelta(days=45)).isoformat()},
+    )
+    assert response.status_code == 200
+    debit = Transaction.objects.filter(type="debit").order_by("date_time")[3]
+    assert client.delete(reverse("transaction-detail", kwargs={"id": debit.id})).status_code == 204
+
+    for wallet in (main, savings):
+        wallet.refresh_from_db()
+        snapshot = WalletBalanceSnapshot.objects.get(wallet=wallet)
+        assert snapshot.balance == _replayed(wallet, snapshot.as_of)
+        assert balances.balance_as_of(wallet, START + timedelta(days=31)) == _replayed(wallet, START + timedelta(days=31))
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="row locks need PostgreSQL, run with TEST_DATABASE=postgresql"
+)
+@pytest.mark.django_db(transaction=True)
+def test_snapshots_wait_for_in_flight_backdated_writes(history, create_category, settings):
+    user, main, savings = history
+    as_of = START + timedelta(days=30)
+    written, release = threading.Event(), threading.Event()
+
+    def backdated_credit():
+        try:
+            with transaction.atomic():
+                credit = Transaction.objects.create(
+                    user=user, wallet=main, category=create_category(name="Salary", user=user, type="credit"),
+                    type="credit", amount=Decimal("25"), date_time=START + timedelta(days=5),
+                )
+                main.balance += credit.amount
+                main.save()
+                balances.apply_movements(balances.transaction_movements(credit))
+                written.set()
+                release.wait(5)
+        finally:
+            connection.close()
+
+    writer = threading.Thread(target=backdated_credit)
+    writer.start()
+    assert written.wait(5)
+    threading.Timer(0.3, release.set).start()
+    try:
+        # main is skipped while the writer holds it, then read once it committed
+        assert balances.take_snapshots(as_of, "daily") == 2
+    finally:
+        release.set()
+        writer.join()
+
+    for wallet in (main, savings):
+        assert WalletBalanceSnapshot.objects.get(wallet=wallet).balance == _replayed(wallet, as_of)
+
+
+@pytest.mark.django_db
+def test_snapshot_task_takes_monthly_snapshots_and_prunes_daily(history, mocker, settings):
+    settings.WALLET_SNAPSHOT_DAILY_RETENTION_DAYS = 7
+    _, main, _ = history
+    old = timezone.now() - timedelta(days=30)
+    WalletBalanceSnapshot.objects.create(wallet=main, as_of=old, period="daily", balance=0)
+    WalletBalanceSnapshot.objects.create(wallet=main, as_of=old - timedelta(days=1), period="monthly", balance=0)
+
+    mocker.patch("wallets.tasks.timezone.localdate", return_value=date(2026, 3, 1))
+    result = snapshot_wallet_balances()
+
+    assert result == {"snapshots": 2, "pruned": 1}
+    snapshot = WalletBalanceSnapshot.objects.get(wallet=main, as_of=balances.day_start(date(2026, 3, 1)))
+    assert snapshot.period == "monthly"
+    assert snapshot.balance == main.balance
+    assert WalletBalanceSnapshot.objects.filter(period="monthly").count() == 3
+
+
+@pytest.mark.django_db
+def test_balance_endpoint(history, authenticated_client, create_user, create_wallet):
+    user, main, _ = history
+    client = authenticated_client()
+    url = reverse("wallet-balance-view", kwargs={"pk": main.id})
+
+    response = client.get(url, {"as_of": "2025-01-10"})
+    assert response.status_code == 200
+    assert response.data == {
+        "wallet": str(main.id),
+        "as_of": "2025-01-10",
+        "balance": f"{_replayed(main, START + timedelta(days=10)):.2f}",
+    }
+
+    assert client.get(url, {"as_of": "10-01-2025"}).status_code == 400
+    assert client.get(url).status_code == 400
+    other = create_wallet(name="other", user=create_user(username="other", email="other@example.com"))
+    assert client.get(reverse("wallet-balance-view", kwargs={"pk": other.id}), {"as_of": "2025-01-10"}).status_code == 404
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from transactions import partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming monthly partitions of the transactions table, or with --convert "
+        "move the plain table to the partitioned layout. PostgreSQL only, a no-op elsewhere."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead", type=int, default=settings.TRANSACTION_PARTITIONS_AHEAD,
+            help="Create partitions up to this many months from now.",
+        )
+        parser.add_argument(
+            "--convert", action="store_true",
+            help="Convert the plain table, copying every row. Locks the table while it runs.",
+        )
+        parser.add_argument(
+            "--drop-old", action="store_true",
+            help="With --convert, drop the plain table instead of keeping it for rollback.",
+        )
+
+    def handle(self, *args, **options):
+        if not partitions.supports_partitioning():
+            self.stdout.write("Partitioning needs PostgreSQL, keeping the plain transactions table.")
+            return
+
+        if not partitions.is_partitioned():
+            if not options["convert"]:
+                self.stdout.write("The transactions table is not partitioned, run with --convert first.")
+                return
+            partitions.convert_to_partitioned(
+                options["months_ahead"], drop_old=options["drop_old"], log=self.stdout.write
+            )
+            self.stdout.write(self.style.SUCCESS("Transactions table converted to monthly partitions."))
+            return
+
+        created = partitions.create_future_partitions(options["months_ahead"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {len(created)} partitions: {', '.join(created) or 'none needed'}")
+        )
@@ -0,0 +1,143 @@
+"""
+Monthly range partitioning of the transactions table on PostgreSQL.
+
+The partitioned table has the same columns and the primary key (id, date_time),
+since PostgreSQL requires the partition key in every unique constraint; Django
+keeps addressing rows by id. Rows outside every monthly partition land in a
+default partition, and creating a month later moves them out of it. On other
+databases the plain table is kept and these helpers are never called.
+"""
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+from django.db import connection, transaction
+
+from .models import Transaction
+
+
+TABLE = Transaction._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+UNPARTITIONED_TABLE = f"{TABLE}_unpartitioned"
+
+
+def supports_partitioning():
+    return connection.vendor == "postgresql"
+
+
+def is_partitioned():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s)",
+            [TABLE],
+        )
+        return cursor.fetchone()[0]
+
+
+def month_starts(first, last):
+    """First day of every month from first's month to last's month, both included."""
+    month = date(first.year, first.month, 1)
+    while month <= last:
+        yield month
+        month += relativedelta(months=1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def _bounds(month):
+    return f"{month.isoformat()} 00:00:00+00", f"{(month + relativedelta(months=1)).isoformat()} 00:00:00+00"
+
+
+def create_partition(cursor, month):
+    """
+    Create the partition of one month if it is missing and return whether it was
+    created. Rows of that month already in the default partition are moved into it.
+    """
+    name = partition_name(month)
+    cursor.execute("SELECT to_regclass(%s)", [name])
+    if cursor.fetchone()[0]:
+        return False
+
+    lower, upper = _bounds(month)
+    cursor.execute(
+        f'SELECT EXISTS (SELECT 1 FROM "{DEFAULT_PARTITION}" WHERE date_time >= %s AND date_time < %s)',
+        [lower, upper],
+    )
+    if not cursor.fetchone()[0]:
+        cursor.execute(
+            f'CREATE TABLE "{name}" PARTITION OF "{TABLE}" FOR VALUES FROM (%s) TO (%s)',
+            [lower, upper],
+        )
+        return True
+
+    cursor.execute(f'CREATE TABLE "{name}" (LIKE "{TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    cursor.execute(
+        f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" WHERE date_time >= %s AND date_time < %s RETURNING *) '
+        f'INSERT INTO "{name}" SELECT * FROM moved',
+        [lower, upper],
+    )
+    cursor.execute(
+        f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{name}" FOR VALUES FROM (%s) TO (%s)',
+        [lower, upper],
+    )
+    return True
+
+
+def create_future_partitions(months_ahead, today=None):
+    """Make sure partitions exist from this month to months_ahead months from now."""
+    today = today or date.today()
+    created = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for month in month_starts(today, today + relativedelta(months=months_ahead)):
+            if create_partition(cursor, month):
+                created.append(partition_name(month))
+    return created
+
+
+def convert_to_partitioned(months_ahead, drop_old=False, log=None):
+    """
+    Replace the plain transactions table with a partitioned one holding the same
+    rows. Runs in one transaction under an exclusive lock, so writers wait for it
+    and a failure leaves the plain table untouched. The old table is kept as
+    UNPARTITIONED_TABLE unless drop_old is set. Returns False, changing nothing,
+    when the table is already partitioned.
+    """
+    log = log or (lambda message: None)
+    today = date.today()
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE "{TABLE}" IN ACCESS EXCLUSIVE MODE')
+        if is_partitioned():
+            return False
+        cursor.execute(f'SELECT min(date_time) FROM "{TABLE}"')
+        oldest = cursor.fetchone()[0]
+
+        cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{UNPARTITIONED_TABLE}"')
+        cursor.execute(
+            f'CREATE TABLE "{TABLE}" (LIKE "{UNPARTITIONED_TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            "PARTITION BY RANGE (date_time)"
+        )
+        cursor.execute(f'ALTER TABLE "{TABLE}" ADD PRIMARY KEY (id, date_time)')
+        cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+
+        first = oldest.date() if oldest else today
+        for month in month_starts(first, today + relativedelta(months=months_ahead)):
+            create_partition(cursor, month)
+        log(f"Created partitions from {first:%Y-%m} to {months_ahead} months ahead")
+
+        cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{UNPARTITIONED_TABLE}"')
+        log(f"Copied {cursor.rowcount} transactions")
+
+        for columns in ["user_id, date_time", "wallet_id", "category_id", "date_time"]:
+            cursor.execute(f'CREATE INDEX ON "{TABLE}" ({columns})')
+        for column, model in [("user_id", "user"), ("wallet_id", "wallet"), ("category_id", "category")]:
+            target = Transaction._meta.get_field(model).related_model._meta.db_table
+            cursor.execute(
+                f'ALTER TABLE "{TABLE}" ADD FOREIGN KEY ({column}) REFERENCES "{target}" (id) '
+                "DEFERRABLE INITIALLY DEFERRED"
+            )
+
+        if drop_old:
+            cursor.execute(f'DROP TABLE "{UNPARTITIONED_TABLE}"')
+    return True
@@ -4,14 +4,17 @@ from django.db import transaction
 from decimal import Decimal
 
 
+from common.serializers import ValuesSerializer
 from common.utils import is_valid_uuid
 from account.models import User
 from .models import Transaction, Category
+from categories.serializers import CategoryField
+from wallets.balances import apply_movements, replace_movements, transaction_movements
 
 
 # Serializer for Transaction model
 class TransactionSerializer(serializers.ModelSerializer):
-    # category = serializers.UUIDField(required=True)
+    category = CategoryField()
 
     class Meta:
         model = Transaction
@@ -97,7 +100,7 @@ class TransactionSerializer(serializers.ModelSerializer):
         user = self._get_transaction_user()
         transaction_type = self._get_transaction_type()
 
-        if not category.is_predefined and category.user != user:
+        if not category.is_predefined and category.user_id != getattr(user, "id", None):
             raise serializers.ValidationError(
                 "Category does not belong to the provided user."
             )
@@ -162,10 +165,12 @@ class TransactionSerializer(serializers.ModelSerializer):
             transaction_obj.wallet.balance -= transaction_obj.amount
             transaction_obj.wallet.save()
 
+        apply_movements(transaction_movements(transaction_obj))
         return transaction_obj
 
     @transaction.atomic
     def update(self, instance, validated_data):
+        old_movements = transaction_movements(instance)
 
         if "amount" in validated_data or "wallet" in validated_data:
             old_wallet = instance.wallet
@@ -191,4 +196,13 @@ class TransactionSerializer(serializers.ModelSerializer):
 
             new_wallet.save()
 
-        return super().update(instance, validated_data)
+        instance = super().update(instance, validated_data)
+
+        replace_movements(old_movements, transaction_movements(instance))
+        return instance
+
+
+class TransactionReadSerializer(ValuesSerializer):
+    """TransactionSerializer output for list responses, from values() rows."""
+
+    serializer_class = TransactionSerializer
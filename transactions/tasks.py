@@ -1,28 +1,25 @@
 from celery import shared_task
-from budgets.models import Budget
-from transactions.models import Transaction
-from budgets.tasks import track_and_notify_budget
+from django.conf import settings
+
+from budgets.tasks import budget_key, schedule_budget_evaluation
+from . import partitions
+from .models import Transaction
+
+
+@shared_task
+def create_transaction_partitions():
+    """Keep monthly partitions ahead of the calendar when the table is partitioned."""
+    if not partitions.supports_partitioning() or not partitions.is_partitioned():
+        return []
+    return partitions.create_future_partitions(settings.TRANSACTION_PARTITIONS_AHEAD)
+
 
 @shared_task
 def handle_transaction(transaction_id):
     """
-    Asynchronously handle the transaction and trigger budget tracking if a budget exists.
+    Deprecated, kept for one release so messages published before the switch to
+    evaluate_budgets still run. Schedules the transaction's budget for evaluation.
     """
-    try:
-        # Fetch the transaction from the database by ID
-        transaction = Transaction.objects.get(id=transaction_id)
-
-        # Check if a budget exists for this transaction's category and user
-        budget = Budget.objects.filter(
-            user=transaction.user,
-            category=transaction.category,
-            year=transaction.date_time.year,
-            month=transaction.date_time.month,
-            is_deleted=False,
-        ).first()
-
-        if budget:
-            track_and_notify_budget.delay(budget.id)
-
-    except Transaction.DoesNotExist:
-        pass  # No transaction found, do nothing
+    transaction = Transaction.objects.filter(id=transaction_id).first()
+    if transaction:
+        schedule_budget_evaluation(budget_key(transaction))
@@ -6,26 +6,33 @@ from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from django.db import transaction as db_transaction
 from .models import Transaction, Category
-from .serializers import TransactionSerializer
+from .serializers import TransactionSerializer, TransactionReadSerializer
 from common.utils import (
     CustomPagination,
     validation_error_response,
     not_found_response,
 )
 from common.permissions import IsStaffOrOwner
-from .tasks import handle_transaction
+from common.async_views import AsyncAPIView
+from common.cache import bump_data_version
+from common.conditional import conditional_get, user_data_version_keys
+from common.serializers import requested_fields
+from budgets.tasks import budget_key, schedule_budget_evaluation
+from wallets.balances import apply_movements, transaction_movements
 
 
 # View for listing and creating transactions
-class TransactionListCreateView(APIView, CustomPagination):
+class TransactionListCreateView(AsyncAPIView, CustomPagination):
     """Api view for listing all transactions and creating a new transaction"""
 
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
+    @conditional_get(user_data_version_keys)
+    async def get(self, request):
         """
         Get method to list all transactions for a particular user and staff user can access all the transactions.
         """
+        fields = requested_fields(request, TransactionReadSerializer)
         if request.user.is_staff:
             queryset = Transaction.objects.all().order_by("-date_time")
         else:
@@ -33,9 +40,12 @@ class TransactionListCreateView(APIView, CustomPagination):
                 user=request.user, is_deleted=False
             ).order_by("-date_time")
 
-        paginated_data = self.paginate_queryset(queryset, request)
-        serializer = TransactionSerializer(paginated_data, many=True)
-        return self.get_paginated_response(serializer.data)
+        paginated_data = await self.apaginate_queryset(
+            TransactionReadSerializer.values(queryset, fields), request
+        )
+        return self.get_paginated_response(
+            TransactionReadSerializer(paginated_data, fields=fields).data
+        )
 
     def post(self, request):
         """Post method to create a new transaction."""
@@ -46,7 +56,8 @@ class TransactionListCreateView(APIView, CustomPagination):
 
         if serializer.is_valid():
             transaction = serializer.save()
-            handle_transaction.delay(transaction.id)
+            bump_data_version(transaction.user_id)
+            schedule_budget_evaluation(budget_key(transaction))
             return Response(
                 serializer.data,
                 status=status.HTTP_201_CREATED,
@@ -63,6 +74,7 @@ class TransactionDetailView(APIView):
         """Helper method to get the transaction object by primary key"""
         return get_object_or_404(Transaction, id=id)
 
+    @conditional_get(user_data_version_keys)
     def get(self, request, id):
         """Get method to retrieve a specific transaction by its id"""
         try:
@@ -87,7 +99,8 @@ class TransactionDetailView(APIView):
         )
         if serializer.is_valid():
             transaction = serializer.save()
-            handle_transaction.delay(transaction.id)
+            bump_data_version(transaction.user_id)
+            schedule_budget_evaluation(budget_key(transaction))
             return Response(serializer.data, status=status.HTTP_200_OK)
         return validation_error_response(serializer.errors)
 
@@ -109,4 +122,6 @@ class TransactionDetailView(APIView):
             wallet.save()
             transaction.is_deleted = True
             transaction.save()
+            apply_movements(transaction_movements(transaction), undo=True)
+        bump_data_version(transaction.user_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
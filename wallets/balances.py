@@ -0,0 +1,233 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from time import sleep
+
+from django.db import connection, transaction
+from django.db.models import DecimalField, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from archive.models import ArchivedTransaction, ArchivedInterWalletTransaction
+from archive.queries import reaches_archive
+from transactions.models import Transaction
+from .models import Wallet, InterWalletTransaction, WalletBalanceSnapshot
+
+
+ZERO = Decimal("0.00")
+
+# take_snapshots waits this long between passes over wallets locked by writers,
+# and gives up on them after this many passes; their balance_as_of falls back
+# to the neighbouring snapshots.
+LOCKED_WALLET_RETRY_DELAY = 0.1
+LOCKED_WALLET_RETRIES = 50
+
+
+def signed_amount(transaction_type, amount):
+    """What a transaction adds to its wallet's balance, negative for debits."""
+    return amount if transaction_type == "credit" else -amount
+
+
+def day_start(day):
+    """The aware datetime a day begins at, the boundary snapshots are taken on."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _date_range(start, end):
+    filters = {"is_deleted": False}
+    if start is not None:
+        filters["date_time__gte"] = start
+    if end is not None:
+        filters["date_time__lt"] = end
+    return filters
+
+
+def _sources(model, archive_model, start):
+    """The hot model, and the archive when the range can reach into it."""
+    if start is None or reaches_archive(start.date()):
+        return [model, archive_model]
+    return [model]
+
+
+def movement_total(wallet_id, start=None, end=None):
+    """
+    Net change of a wallet's balance from the transactions and transfers dated
+    in [start, end), open ended where None.
+    """
+    if start is not None and start == end:
+        return ZERO
+
+    total = ZERO
+    dates = _date_range(start, end)
+    for model in _sources(Transaction, ArchivedTransaction, start):
+        sums = model.objects.filter(wallet_id=wallet_id, **dates).aggregate(
+            credit=Sum("amount", filter=Q(type="credit")),
+            debit=Sum("amount", filter=Q(type="debit")),
+        )
+        total += (sums["credit"] or ZERO) - (sums["debit"] or ZERO)
+    for model in _sources(InterWalletTransaction, ArchivedInterWalletTransaction, start):
+        sums = model.objects.filter(
+            Q(source_wallet_id=wallet_id) | Q(destination_wallet_id=wallet_id), **dates
+        ).aggregate(
+            incoming=Sum("amount", filter=Q(destination_wallet_id=wallet_id)),
+            outgoing=Sum("amount", filter=Q(source_wallet_id=wallet_id)),
+        )
+        total += (sums["incoming"] or ZERO) - (sums["outgoing"] or ZERO)
+    return total
+
+
+def balance_as_of(wallet, moment):
+    """
+    Balance of a wallet counting the movements dated before `moment`, from the
+    nearest snapshot on either side of it, or the current balance when that
+    is nearer, plus or minus only the movements in between.
+    """
+    snapshots = WalletBalanceSnapshot.objects.filter(wallet=wallet)
+    before = snapshots.filter(as_of__lte=moment).order_by("-as_of").first()
+    after = snapshots.filter(as_of__gt=moment).order_by("as_of").first()
+
+    after_as_of = after.as_of if after else max(timezone.now(), moment)
+    if before and moment - before.as_of <= after_as_of - moment:
+        return before.balance + movement_total(wallet.id, before.as_of, moment)
+    if after:
+        return after.balance - movement_total(wallet.id, moment, after.as_of)
+    return wallet.balance - movement_total(wallet.id, moment)
+
+
+def _total_since(queryset, group_by, as_of):
+    """Per wallet sum of the amounts dated from as_of on, as a subquery."""
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{group_by: OuterRef("pk")}, is_deleted=False, date_time__gte=as_of)
+            .order_by()
+            .values(group_by)
+            .annotate(total=Sum("amount"))
+            .values("total")
+        ),
+        Value(ZERO),
+        output_field=DecimalField(max_digits=15, decimal_places=2),
+    )
+
+
+def _snapshot_balances(wallet_ids, as_of):
+    """(wallet id, balance at as_of) rows: current balance less what moved since."""
+    credit = debit = incoming = outgoing = Value(ZERO)
+    for model in _sources(Transaction, ArchivedTransaction, as_of):
+        credit = credit + _total_since(model.objects.filter(type="credit"), "wallet", as_of)
+        debit = debit + _total_since(model.objects.filter(type="debit"), "wallet", as_of)
+    for model in _sources(InterWalletTransaction, ArchivedInterWalletTransaction, as_of):
+        incoming = incoming + _total_since(model.objects.all(), "destination_wallet", as_of)
+        outgoing = outgoing + _total_since(model.objects.all(), "source_wallet", as_of)
+
+    return Wallet.objects.filter(id__in=wallet_ids).values_list(
+        "id", F("balance") - credit + debit - incoming + outgoing
+    )
+
+
+def take_snapshots(as_of, period, batch_size=1000):
+    """
+    Snapshot every wallet at as_of: its current balance less what was moved
+    from as_of on, so a recent as_of only reads that day's rows.
+
+    Wallets are locked in batches before they are read, and writers lock their
+    wallets before adjust_snapshots, so a write either commits before the read
+    and is counted in both balance and movements, or waits for the batch and
+    then adjusts its new snapshot. Wallets a writer holds are skipped and
+    retried on a later pass. Wallets already snapshotted at as_of keep their
+    snapshot. Returns the number of snapshots taken.
+    """
+    pending = Wallet.objects.filter(is_deleted=False).exclude(balance_snapshots__as_of=as_of)
+    taken = retries = 0
+    while True:
+        with transaction.atomic():
+            wallet_ids = list(
+                pending.select_for_update(skip_locked=True)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if wallet_ids:
+                snapshots = WalletBalanceSnapshot.objects.bulk_create(
+                    [
+                        WalletBalanceSnapshot(wallet_id=wallet_id, as_of=as_of, period=period, balance=balance)
+                        for wallet_id, balance in _snapshot_balances(wallet_ids, as_of)
+                    ],
+                    ignore_conflicts=True,
+                )
+                taken += len(snapshots)
+                continue
+        if retries >= LOCKED_WALLET_RETRIES or not pending.exists():
+            return taken
+        retries += 1
+        sleep(LOCKED_WALLET_RETRY_DELAY)
+
+
+def adjust_snapshots(wallet_id, since, amount):
+    """
+    Apply a movement of `amount` dated `since` to the wallet's snapshots taken
+    after it. Callers go through apply_movements or replace_movements, which
+    lock the wallets first.
+    """
+    if amount:
+        WalletBalanceSnapshot.objects.filter(wallet_id=wallet_id, as_of__gt=since).update(
+            balance=F("balance") + amount
+        )
+
+
+def transaction_movements(transaction_obj):
+    """The (wallet id, date, signed amount) movements of a transaction."""
+    return [
+        (transaction_obj.wallet_id, transaction_obj.date_time,
+         signed_amount(transaction_obj.type, transaction_obj.amount)),
+    ]
+
+
+def transfer_movements(transfer):
+    """The (wallet id, date, signed amount) movements of an inter-wallet transfer."""
+    return [
+        (transfer.source_wallet_id, transfer.date_time, -transfer.amount),
+        (transfer.destination_wallet_id, transfer.date_time, transfer.amount),
+    ]
+
+
+def _lock_wallets(*movements):
+    """
+    Lock the moved wallets, in id order, waiting out a take_snapshots batch
+    that holds them so the snapshot it inserts is adjusted too. SQLite
+    serializes writers on the whole database instead.
+    """
+    if connection.features.has_select_for_update:
+        wallet_ids = {wallet_id for moves in movements for wallet_id, _, _ in moves}
+        list(
+            Wallet.objects.select_for_update().filter(id__in=wallet_ids).order_by("id").values_list("id", flat=True)
+        )
+
+
+def apply_movements(movements, undo=False):
+    """
+    Apply movements to the snapshots taken after them, or take them back with
+    undo=True. Call within the transaction of every balance change, since a
+    backdated movement changes history, not just the balance.
+    """
+    _lock_wallets(movements)
+    for wallet_id, since, amount in movements:
+        adjust_snapshots(wallet_id, since, -amount if undo else amount)
+
+
+def replace_movements(old, new):
+    """
+    Move an edited row's movements in the snapshots from `old` to `new`. Whole
+    movements are compared, since the balance history changes with the date
+    too, not just the amount.
+    """
+    if old != new:
+        _lock_wallets(old, new)
+        for wallet_id, since, amount in old:
+            adjust_snapshots(wallet_id, since, -amount)
+        for wallet_id, since, amount in new:
+            adjust_snapshots(wallet_id, since, amount)
+
+
+def prune_daily_snapshots(days):
+    """Delete daily snapshots older than the given number of days, monthly ones stay."""
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = WalletBalanceSnapshot.objects.filter(period="daily", as_of__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.3 on 2026-10-19 09:42
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0002_remove_interwallettransaction_date_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WalletBalanceSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('as_of', models.DateTimeField()),
+                ('period', models.CharField(choices=[('daily', 'Daily'), ('monthly', 'Monthly')], max_length=10)),
+                ('balance', models.DecimalField(decimal_places=2, max_digits=15)),
+                ('wallet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balance_snapshots', to='wallets.wallet')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['period', 'as_of'], name='wallets_wal_period_ab92c8_idx')],
+                'constraints': [models.UniqueConstraint(fields=('wallet', 'as_of'), name='unique_wallet_balance_snapshot')],
+            },
+        ),
+    ]
@@ -23,3 +23,31 @@ class InterWalletTransaction(BaseModel):
 
     def __str__(self):
         return f"{self.user} | {self.source_wallet} -> {self.destination_wallet} | {self.amount}"
+
+
+# WalletBalanceSnapshot Model
+class WalletBalanceSnapshot(BaseModel):
+    """
+    Balance of a wallet counting every movement dated before `as_of`, a day
+    start, taken nightly by wallets.tasks.snapshot_wallet_balances. Monthly
+    snapshots are kept, daily ones for WALLET_SNAPSHOT_DAILY_RETENTION_DAYS.
+    """
+
+    PERIOD_CHOICES = [
+        ("daily", "Daily"),
+        ("monthly", "Monthly"),
+    ]
+
+    wallet = models.ForeignKey(Wallet, on_delete=models.CASCADE, related_name="balance_snapshots")
+    as_of = models.DateTimeField()
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES)
+    balance = models.DecimalField(max_digits=15, decimal_places=2)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["wallet", "as_of"], name="unique_wallet_balance_snapshot"),
+        ]
+        indexes = [models.Index(fields=["period", "as_of"])]
+
+    def __str__(self):
+        return f"{self.wallet} | {self.as_of} | {self.balance}"
@@ -4,6 +4,7 @@ from wallets.models import Wallet
 from account.models import User
 from django.db import transaction as db_transaction
 from common.utils import is_valid_uuid
+from wallets.balances import apply_movements, replace_movements, transfer_movements
 from django.db import IntegrityError
 
 
@@ -148,12 +149,15 @@ class InterWalletTransactionSerializer(serializers.ModelSerializer):
                 destination_wallet.balance += amount
                 destination_wallet.save()
 
-                return super().create(validated_data)
+                transfer = super().create(validated_data)
+                apply_movements(transfer_movements(transfer))
+                return transfer
 
     def update(self, instance, validated_data):
         """Update an existing transaction and auto-adjust wallet balances."""
 
         with db_transaction.atomic():
+            old_movements = transfer_movements(instance)
             old_amount = instance.amount
             new_amount = validated_data.get("amount", old_amount)
             source_wallet = validated_data.get("source_wallet", instance.source_wallet)
@@ -183,4 +187,7 @@ class InterWalletTransactionSerializer(serializers.ModelSerializer):
                 source_wallet.save()
                 destination_wallet.save()
 
-            return super().update(instance, validated_data)
+            instance = super().update(instance, validated_data)
+
+            replace_movements(old_movements, transfer_movements(instance))
+            return instance
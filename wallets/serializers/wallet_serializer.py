@@ -3,6 +3,7 @@ from ..models import Wallet
 from account.models import User
 from django.utils.text import slugify
 from transactions.models import Transaction
+from common.serializers import ValuesSerializer
 
 
 class WalletSerializer(serializers.ModelSerializer):
@@ -75,3 +76,15 @@ class WalletSerializer(serializers.ModelSerializer):
                 )
 
         return data
+
+
+class WalletReadSerializer(ValuesSerializer):
+    """WalletSerializer output for list responses, from values() rows."""
+
+    serializer_class = WalletSerializer
+
+
+class WalletBalanceSerializer(serializers.Serializer):
+    wallet = serializers.UUIDField()
+    as_of = serializers.DateField()
+    balance = serializers.DecimalField(max_digits=15, decimal_places=2)
@@ -0,0 +1,19 @@
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from . import balances
+
+
+@shared_task
+def snapshot_wallet_balances():
+    """
+    Snapshot every wallet's balance at the start of today, as a monthly
+    snapshot on the first of the month, and prune expired daily snapshots.
+    """
+    today = timezone.localdate()
+    period = "monthly" if today.day == 1 else "daily"
+    return {
+        "snapshots": balances.take_snapshots(balances.day_start(today), period),
+        "pruned": balances.prune_daily_snapshots(settings.WALLET_SNAPSHOT_DAILY_RETENTION_DAYS),
+    }
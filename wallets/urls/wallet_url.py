@@ -1,8 +1,9 @@
 from django.urls import path
-from ..views.wallet_view import WalletListCreateView, WalletDetailAPIView
+from ..views.wallet_view import WalletListCreateView, WalletDetailAPIView, WalletBalanceView
 
 
 urlpatterns = [
     path("", WalletListCreateView.as_view(), name="wallet-list-create-view"),
     path("<uuid:pk>/", WalletDetailAPIView.as_view(),name="wallet-detail-view"),
+    path("<uuid:pk>/balance/", WalletBalanceView.as_view(), name="wallet-balance-view"),
 ]
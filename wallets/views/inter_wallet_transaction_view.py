@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -8,15 +9,20 @@ from ..serializers.inter_wallet_transaction_serializer import (
     InterWalletTransactionSerializer,
 )
 from common.permissions import IsStaffOrOwner
+from common.async_views import AsyncAPIView
+from common.cache import bump_data_version
+from ..balances import apply_movements, transfer_movements
+from common.conditional import conditional_get, user_data_version_keys
 from rest_framework.permissions import IsAuthenticated
 
 from common.utils import CustomPagination, validation_error_response, not_found_response
 
 
-class InterwalletTransactionListCreateView(APIView, CustomPagination):
+class InterwalletTransactionListCreateView(AsyncAPIView, CustomPagination):
     """List all transactions or create a new one."""
 
-    def get(self, request):
+    @conditional_get(user_data_version_keys)
+    async def get(self, request):
         """Fetch all transactions (staff can see all, normal users see their own)."""
         if request.user.is_staff:
             transactions = InterWalletTransaction.objects.all().order_by("created_at")
@@ -25,9 +31,11 @@ class InterwalletTransactionListCreateView(APIView, CustomPagination):
                 user=request.user, is_deleted=False
             ).order_by("created_at")
 
-        paginated_trasactions = self.paginate_queryset(transactions, request)
-        serializer = InterWalletTransactionSerializer(paginated_trasactions, many=True)
-        return self.get_paginated_response(serializer.data)
+        paginated_trasactions = await self.apaginate_queryset(transactions, request)
+        data = await sync_to_async(
+            lambda: InterWalletTransactionSerializer(paginated_trasactions, many=True).data
+        )()
+        return self.get_paginated_response(data)
 
     def post(self, request):
         """Create a new inter-wallet transaction."""
@@ -35,7 +43,8 @@ class InterwalletTransactionListCreateView(APIView, CustomPagination):
             data=request.data, context={"request": request}
         )
         if serializer.is_valid():
-            serializer.save()
+            transaction = serializer.save()
+            bump_data_version(transaction.user_id)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return validation_error_response(serializer.errors)
 
@@ -48,6 +57,7 @@ class InterwalletTransactionDetailView(APIView):
     def get_object(self, pk):
         return get_object_or_404(InterWalletTransaction, id=pk)
 
+    @conditional_get(user_data_version_keys)
     def get(self, request, pk):
         """Retrieve transaction details."""
         try:
@@ -71,7 +81,8 @@ class InterwalletTransactionDetailView(APIView):
             transaction, data=request.data, partial=True, context={"request": request}
         )
         if serializer.is_valid():
-            serializer.save()
+            transaction = serializer.save()
+            bump_data_version(transaction.user_id)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return validation_error_response(serializer.errors)
 
@@ -95,5 +106,8 @@ class InterwalletTransactionDetailView(APIView):
             destination_wallet.save(update_fields=["balance"])
 
             transaction.is_deleted = True
-            transaction.save(update_fields=["is_deleted"])
-            return Response(status=status.HTTP_204_NO_CONTENT)
+            transaction.save(update_fields=["is_deleted", "updated_at"])
+            apply_movements(transfer_movements(transaction), undo=True)
+
+        bump_data_version(transaction.user_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
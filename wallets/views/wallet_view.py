@@ -1,10 +1,17 @@
+from datetime import datetime, timedelta
+
 from django.shortcuts import get_object_or_404
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 from ..models import Wallet, InterWalletTransaction
 from transactions.models import Transaction
-from ..serializers.wallet_serializer import WalletSerializer
+from ..serializers.wallet_serializer import (
+    WalletSerializer,
+    WalletReadSerializer,
+    WalletBalanceSerializer,
+)
+from ..balances import balance_as_of, day_start
 
 # from .permissions import IsOwnerOrStaffManagingOthers
 
@@ -14,13 +21,18 @@ from common.utils import (
     not_found_response,
 )
 from common.permissions import IsStaffOrOwner
+from common.cache import bump_data_version
+from common.conditional import conditional_get, user_data_version_keys
+from common.serializers import requested_fields
 
 
 class WalletListCreateView(APIView, CustomPagination):
     # permission_classes = [IsOwnerOrStaffManagingOthers]
 
+    @conditional_get(user_data_version_keys)
     def get(self, request):
         """Retrieve wallets (Staff see all, normal users see their own)"""
+        fields = requested_fields(request, WalletReadSerializer)
         if request.user.is_staff:
             wallets = Wallet.objects.all().order_by("created_at")
         else:
@@ -28,15 +40,15 @@ class WalletListCreateView(APIView, CustomPagination):
                 user=request.user, is_deleted=False
             ).order_by("created_at")
 
-        paginated_wallets = self.paginate_queryset(wallets, request)
-        serializer = WalletSerializer(paginated_wallets, many=True)
-        return self.get_paginated_response(serializer.data)
+        paginated_wallets = self.paginate_queryset(WalletReadSerializer.values(wallets, fields), request)
+        return self.get_paginated_response(WalletReadSerializer(paginated_wallets, fields=fields).data)
 
     def post(self, request):
         """Create wallet (Staff must assign to another user)"""
         serializer = WalletSerializer(data=request.data, context={"request": request})
         if serializer.is_valid():
-            serializer.save()
+            wallet = serializer.save()
+            bump_data_version(wallet.user_id)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return validation_error_response(serializer.errors)
 
@@ -50,6 +62,7 @@ class WalletDetailAPIView(APIView):
         """Retrieve wallet object"""
         return get_object_or_404(Wallet, id=pk)
 
+    @conditional_get(user_data_version_keys)
     def get(self, request, pk):
         """Retrieve a single wallet"""
         try:
@@ -73,7 +86,8 @@ class WalletDetailAPIView(APIView):
             wallet, data=request.data, partial=True, context={"request": request}
         )
         if serializer.is_valid():
-            serializer.save()
+            wallet = serializer.save()
+            bump_data_version(wallet.user_id)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
         return validation_error_response(serializer.errors)
@@ -110,6 +124,34 @@ class WalletDetailAPIView(APIView):
 
         wallet.is_deleted = True
         wallet.save()
+        bump_data_version(wallet.user_id)
         return Response(
             status=status.HTTP_204_NO_CONTENT,
         )
+
+
+class WalletBalanceView(APIView):
+    """Balance of a wallet at the end of a past or future day"""
+
+    permission_classes = [IsStaffOrOwner]
+
+    @conditional_get(user_data_version_keys)
+    def get(self, request, pk):
+        """Balance at the end of the as_of day (YYYY-MM-DD), from the nearest snapshot."""
+        try:
+            as_of = datetime.strptime(request.query_params.get("as_of", ""), "%Y-%m-%d").date()
+        except ValueError:
+            return Response(
+                {"error": "as_of is required. Use YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            wallet = get_object_or_404(Wallet, id=pk)
+            self.check_object_permissions(request, wallet)
+        except Exception as e:
+            return not_found_response("Wallet Not Found")
+
+        balance = balance_as_of(wallet, day_start(as_of + timedelta(days=1)))
+        serializer = WalletBalanceSerializer({"wallet": wallet.id, "as_of": as_of, "balance": balance})
+        return Response(serializer.data, status=status.HTTP_200_OK)